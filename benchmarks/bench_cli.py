@@ -0,0 +1,321 @@
+"""yojenkins CLI startup time and command latency benchmarks
+
+Runs the CLI in fresh processes, the same way it is run from a shell, and stores the
+results as JSON so that they can be compared across commits.
+
+    python benchmarks/bench_cli.py
+    python benchmarks/bench_cli.py --compare benchmarks/results/<PREVIOUS RESULT>.json
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from typing import Optional
+
+import click
+from fake_jenkins import FakeJenkins
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / 'results'
+
+# Runs the working tree version of yojenkins, not an installed one
+CLI_ENTRY = 'import sys; sys.argv[0] = "yojenkins"; from yojenkins.__main__ import main; main()'
+
+# Commands that do not contact a server
+STARTUP_COMMANDS = {
+    'version': ['--version'],
+    'help': ['--help'],
+    'job_help': ['job', '--help'],
+    'build_info_help': ['build', 'info', '--help'],
+}
+
+# Commands run against the fake Jenkins server
+SERVER_COMMANDS = {
+    'server_info': ['server', 'info'],
+    'folder_jobs': ['folder', 'jobs', 'folder-1'],
+    'job_info': ['job', 'info', 'folder-1/job-1'],
+    'job_list': ['job', 'list', 'folder-1/job-1'],
+    'job_search': ['job', 'search', 'job-1$'],
+    'build_info': ['build', 'info', 'folder-1/job-1', '--latest'],
+    'build_logs': ['build', 'logs', 'folder-1/job-1', '--latest'],
+}
+
+# Expected number of server requests per run of each server command, once the first run filled the
+# local stores. Only the latest build number of a job is not stored, since it changes with new builds,
+# while a finished build and its log are read from the local response cache and log store.
+EXPECTED_REQUESTS = {
+    'server_info': 1,
+    'folder_jobs': 1,
+    'job_info': 1,
+    'job_list': 1,
+    'job_search': 0,
+    'build_info': 1,
+    'build_logs': 1,
+}
+
+# Modules broken down with `python -X importtime`
+IMPORT_MODULES = ['yojenkins.__main__', 'yojenkins.cli.cli_utility']
+IMPORT_TOP_COUNT = 15
+
+
+def run_cli(args: list[str], env: dict) -> float:
+    """Run one yojenkins command in a new process
+
+    Args:
+        args : Command line arguments, without the program name
+        env  : Process environment variables
+
+    Returns:
+        Wall clock seconds the command took
+    """
+    start_time = perf_counter()
+    process = subprocess.run(
+        [sys.executable, '-c', CLI_ENTRY, *args], cwd=env['HOME'], env=env, capture_output=True, check=False
+    )
+    elapsed = perf_counter() - start_time
+    if process.returncode != 0:
+        raise click.ClickException(
+            f'Command "yojenkins {" ".join(args)}" failed ({process.returncode}): {process.stderr.decode()[-500:]}'
+        )
+    return elapsed
+
+
+def summarize(timings: list[float]) -> dict:
+    """Summarize repeated timings
+
+    Args:
+        timings : Seconds of each run
+
+    Returns:
+        Median, minimum, and maximum seconds
+    """
+    return {
+        'median_s': round(statistics.median(timings), 4),
+        'min_s': round(min(timings), 4),
+        'max_s': round(max(timings), 4),
+        'runs': len(timings),
+    }
+
+
+def prepare_home(home_dir: str, server_url: str) -> dict:
+    """Create an isolated home directory with a credentials profile for the fake server
+
+    Args:
+        home_dir   : Directory used as the home directory of the commands
+        server_url : URL of the fake server
+
+    Returns:
+        Process environment variables for the commands
+    """
+    config_dir = os.path.join(home_dir, '.yojenkins')
+    os.makedirs(config_dir, exist_ok=True)
+    with open(os.path.join(config_dir, 'credentials'), 'w') as file:
+        file.write(
+            f'[default]\njenkins_server_url = "{server_url}"\nusername = "admin"\napi_token = "token"\nactive = true\n'
+        )
+    env = {key: value for key, value in os.environ.items() if not key.startswith('YOJENKINS_')}
+    env.update({'HOME': home_dir, 'PYTHONPATH': str(REPO_DIR), 'YOJENKINS_NO_AGENT': '1'})
+    return env
+
+
+def bench_startup(repeat: int) -> dict:
+    """Measure the cold start time of commands that do not contact a server
+
+    Args:
+        repeat : Number of runs of each command
+
+    Returns:
+        Timing summary by command name
+    """
+    results = {}
+    with tempfile.TemporaryDirectory(prefix='yojenkins_bench_') as home_dir:
+        env = prepare_home(home_dir, 'http://127.0.0.1:1')
+        for name, args in STARTUP_COMMANDS.items():
+            results[name] = summarize([run_cli(args, env) for _ in range(repeat)])
+            click.echo(f'  startup  {name:<18} {results[name]["median_s"] * 1000:8.1f} ms')
+    return results
+
+
+def bench_commands(repeat: int) -> dict:
+    """Measure the latency of commands against the fake Jenkins server
+
+    Details: The first run of each command is reported separately, since it fills the
+             local response cache, log store, item index, and authentication record. Fails if a
+             command sends a different number of server requests per run than expected.
+
+    Args:
+        repeat : Number of runs of each command after the first
+
+    Returns:
+        Timing summary and mean number of server requests per run by command name
+    """
+    results = {}
+    fake = FakeJenkins()
+    server_url = fake.start()
+    try:
+        with tempfile.TemporaryDirectory(prefix='yojenkins_bench_') as home_dir:
+            env = prepare_home(home_dir, server_url)
+            for name, args in SERVER_COMMANDS.items():
+                first = run_cli(args, env)
+                log_start = len(fake.request_log)
+                timings = [run_cli(args, env) for _ in range(repeat)]
+                results[name] = {
+                    **summarize(timings),
+                    'first_s': round(first, 4),
+                    'requests': round((len(fake.request_log) - log_start) / repeat, 1),
+                }
+                click.echo(
+                    f'  command  {name:<18} {results[name]["median_s"] * 1000:8.1f} ms'
+                    f'  (first: {first * 1000:.1f} ms, requests: {results[name]["requests"]})'
+                )
+                if results[name]['requests'] != EXPECTED_REQUESTS[name]:
+                    raise click.ClickException(
+                        f'Command "{name}" sent {results[name]["requests"]} server requests per run, '
+                        f'expected {EXPECTED_REQUESTS[name]}'
+                    )
+    finally:
+        fake.stop()
+    return results
+
+
+def bench_imports(module: str) -> dict:
+    """Break down the import time of a module with `python -X importtime`
+
+    Args:
+        module : Full module name
+
+    Returns:
+        Total import milliseconds and the modules with the largest own import time
+    """
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=REPO_DIR,
+        env={**os.environ, 'PYTHONPATH': str(REPO_DIR)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = []
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[len('import time:') :].split('|'))
+        modules.append((name, int(self_us), int(cumulative_us)))
+
+    total_us = next((cumulative for name, _, cumulative in modules if name == module), 0)
+    top = sorted(modules, key=lambda item: item[1], reverse=True)[:IMPORT_TOP_COUNT]
+    click.echo(f'  import   {module:<30} {total_us / 1000:8.1f} ms  ({len(modules)} modules)')
+    return {
+        'total_ms': round(total_us / 1000, 2),
+        'modules': len(modules),
+        'top_self_ms': {name: round(self_us / 1000, 2) for name, self_us, _ in top},
+    }
+
+
+def git_commit() -> dict:
+    """Get the current git commit of the repository
+
+    Returns:
+        Commit hash and if the working tree has changes
+    """
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], cwd=REPO_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = bool(
+            subprocess.run(
+                ['git', 'status', '--porcelain', '--untracked-files=no'],
+                cwd=REPO_DIR,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return {'commit': '', 'dirty': False}
+    return {'commit': commit, 'dirty': dirty}
+
+
+def compare(previous: dict, current: dict, threshold: float) -> list[str]:
+    """Compare two benchmark results
+
+    Args:
+        previous  : Earlier benchmark result
+        current   : New benchmark result
+        threshold : Relative slowdown reported as a regression (ie. 0.2 for 20%)
+
+    Returns:
+        Descriptions of all regressions
+    """
+    pairs = []
+    for section in ['startup', 'commands']:
+        for name, result in current.get(section, {}).items():
+            if name in previous.get(section, {}):
+                before = previous[section][name]['median_s'] * 1000
+                pairs.append((f'{section}.{name}', before, result['median_s'] * 1000))
+    for module, result in current.get('imports', {}).items():
+        if module in previous.get('imports', {}):
+            pairs.append((f'imports.{module}', previous['imports'][module]['total_ms'], result['total_ms']))
+
+    regressions = []
+    click.echo(f'\nCompared to {previous["meta"].get("commit", "")[:10]} ({previous["meta"].get("timestamp")}):')
+    for name, before, after in pairs:
+        change = (after - before) / before if before else 0.0
+        marker = ''
+        if change > threshold:
+            marker = '  <-- REGRESSION'
+            regressions.append(f'{name}: {before:.1f} ms -> {after:.1f} ms ({change:+.0%})')
+        click.echo(f'  {name:<45} {before:8.1f} ms -> {after:8.1f} ms  {change:+6.0%}{marker}')
+    return regressions
+
+
+@click.command()
+@click.option(
+    '--repeat', type=click.IntRange(min=1), default=5, show_default=True, help='Number of runs of each command'
+)
+@click.option('--output', type=click.Path(dir_okay=False), help='Result file. Default is a new file in results/')
+@click.option('--compare', 'compare_file', type=click.Path(exists=True, dir_okay=False), help='Earlier result')
+@click.option('--threshold', type=float, default=0.2, show_default=True, help='Relative slowdown failing --compare')
+@click.option('--skip-commands', is_flag=True, default=False, help='Only measure startup and import times')
+def main(repeat: int, output: Optional[str], compare_file: Optional[str], threshold: float, skip_commands: bool):
+    """Benchmark yojenkins startup time and command latency"""
+    timestamp = datetime.now(timezone.utc)
+    result = {
+        'meta': {
+            **git_commit(),
+            'timestamp': timestamp.isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': repeat,
+        },
+        'startup': bench_startup(repeat),
+        'commands': {} if skip_commands else bench_commands(repeat),
+        'imports': {module: bench_imports(module) for module in IMPORT_MODULES},
+    }
+
+    if not output:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        output = RESULTS_DIR / f'{timestamp:%Y%m%dT%H%M%SZ}_{result["meta"]["commit"][:10] or "nogit"}.json'
+    with open(output, 'w') as file:
+        json.dump(result, file, indent=2)
+    click.echo(f'\nResults saved: {output}')
+
+    if compare_file:
+        with open(compare_file) as file:
+            regressions = compare(json.load(file), result, threshold)
+        if regressions:
+            click.secho(f'\n{len(regressions)} regression(s) over {threshold:.0%}:', fg='bright_red', bold=True)
+            for regression in regressions:
+                click.secho(f'  - {regression}', fg='bright_red')
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
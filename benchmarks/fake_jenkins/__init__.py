@@ -0,0 +1,4 @@
+"""Importing sub-modules"""
+
+from .data import FakeJenkinsData, SyntheticLog, generate_deep_folders, generate_jobs, generate_large_logs
+from .server import FakeJenkins
@@ -0,0 +1,71 @@
+"""Run the fake Jenkins server on its own
+
+Serves synthetic content until stopped, to try the CLI against large or slow servers by hand.
+
+    cd benchmarks
+    python -m fake_jenkins --jobs 100000 --folder-depth 2
+    python -m fake_jenkins --log-size 2147483648 --bandwidth 10000000
+"""
+
+import click
+
+from fake_jenkins.data import generate_deep_folders, generate_jobs
+from fake_jenkins.server import FakeJenkins
+
+
+@click.command()
+@click.option('--host', default='127.0.0.1', show_default=True, help='Address to listen on')
+@click.option('--port', type=int, default=8080, show_default=True, help='Port to listen on')
+@click.option('--jobs', type=int, default=50, show_default=True, help='Number of jobs')
+@click.option('--folder-depth', type=int, default=1, show_default=True, help='Number of folder levels above the jobs')
+@click.option('--folder-fanout', type=int, default=5, show_default=True, help='Number of sub-folders of each folder')
+@click.option('--deep', is_flag=True, default=False, help='Nest --folder-depth folders in a single chain instead')
+@click.option('--builds', type=int, default=5, show_default=True, help='Number of builds of each job')
+@click.option('--log-size', type=int, default=100_000, show_default=True, help='Console text bytes of each build')
+@click.option('--running', is_flag=True, default=False, help='Last build of each job is running, its log growing')
+@click.option('--artifacts', type=int, default=0, show_default=True, help='Number of artifacts of each build')
+@click.option('--artifact-size', type=int, default=1_000_000, show_default=True, help='Bytes of each artifact')
+@click.option('--queue-items', type=int, default=0, show_default=True, help='Number of queued builds')
+@click.option('--latency', type=float, default=0.0, show_default=True, help='Seconds added before every response')
+@click.option('--bandwidth', type=int, default=0, show_default=True, help='Response bytes per second. 0 for no limit')
+@click.option('--api-token', default='', help='Required API token. Default is any credentials')
+@click.option('--use-crumbs', is_flag=True, default=False, help='Require a crumb on POST requests')
+def main(
+    host: str,
+    port: int,
+    jobs: int,
+    folder_depth: int,
+    folder_fanout: int,
+    deep: bool,
+    builds: int,
+    log_size: int,
+    running: bool,
+    artifacts: int,
+    artifact_size: int,
+    queue_items: int,
+    latency: float,
+    bandwidth: int,
+    api_token: str,
+    use_crumbs: bool,
+):
+    """Serve synthetic Jenkins content for offline testing"""
+    data_kwargs = {
+        'builds': builds,
+        'log_size': log_size,
+        'running_builds': running,
+        'queue_items': queue_items,
+        'artifacts': artifacts,
+        'artifact_size': artifact_size,
+    }
+    if deep:
+        jobs_per_folder = max(1, jobs // max(folder_depth, 1))
+        data = generate_deep_folders(depth=folder_depth, jobs_per_folder=jobs_per_folder, **data_kwargs)
+    else:
+        data = generate_jobs(jobs=jobs, folder_depth=folder_depth, folder_fanout=folder_fanout, **data_kwargs)
+    fake = FakeJenkins(data, latency=latency, bandwidth=bandwidth, api_token=api_token, use_crumbs=use_crumbs)
+    click.echo(f'Fake Jenkins serving {data.job_count()} jobs on http://{host}:{port} (Ctrl+C to stop)')
+    fake.serve_forever(host, port)
+
+
+if __name__ == '__main__':
+    main()
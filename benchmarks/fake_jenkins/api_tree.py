@@ -0,0 +1,127 @@
+"""Jenkins JSON API `tree` and `depth` handling"""
+
+import re
+from typing import Any, Callable, Optional
+
+# Parsed `tree` value: Field name to sub-tree (None if not nested) and list range (None if not limited)
+Tree = dict[str, tuple[Optional['Tree'], Optional[tuple[Optional[int], Optional[int]]]]]
+
+TREE_TOKEN = re.compile(r'\s*([^\[\]{},\s]+|\[|\]|\{[^}]*\}|,)')
+
+
+class ItemRef(dict):
+    """Reference to another item within an API document, as shown at the current depth
+
+    Details: Holds the fields Jenkins shows for a nested item (ie. `name`, `url`, `_class`).
+             The full document of the item is rendered if more of its fields are requested.
+    """
+
+    def __init__(self, path: str, fields: dict) -> None:
+        super().__init__(fields)
+        self.path = path
+
+
+def parse_tree(text: str) -> Tree:
+    """Parse a `tree` query value
+
+    Examples:
+        - 'name,url' -> {'name': (None, None), 'url': (None, None)}
+        - 'jobs[name]{0,10}' -> {'jobs': ({'name': (None, None)}, (0, 10))}
+
+    Args:
+        text : Value of the `tree` query parameter
+
+    Returns:
+        Parsed tree
+    """
+    tokens = [token for token in TREE_TOKEN.findall(text) if token]
+    return _parse_fields(tokens, 0)[0]
+
+
+def _parse_fields(tokens: list[str], position: int) -> tuple[Tree, int]:
+    tree: Tree = {}
+    while position < len(tokens):
+        token = tokens[position]
+        if token == ']':
+            return tree, position + 1
+        if token == ',':
+            position += 1
+            continue
+        subtree, item_range = None, None
+        position += 1
+        if position < len(tokens) and tokens[position] == '[':
+            subtree, position = _parse_fields(tokens, position + 1)
+        if position < len(tokens) and tokens[position].startswith('{'):
+            item_range = _parse_range(tokens[position])
+            position += 1
+        tree[token] = (subtree, item_range)
+    return tree, position
+
+
+def _parse_range(token: str) -> tuple[Optional[int], Optional[int]]:
+    """Parse a list range, `{M,N}`, `{M,}`, `{,N}`, or `{N}`"""
+    parts = token.strip('{}').split(',')
+    if len(parts) == 1:
+        index = int(parts[0])
+        return index, index + 1
+    return (int(parts[0]) if parts[0] else None), (int(parts[1]) if parts[1] else None)
+
+
+def apply_tree(value: Any, tree: Tree, resolve: Callable[[str], dict]) -> Any:
+    """Only keep the fields of a document requested with a `tree`
+
+    Args:
+        value   : API document, or part of it
+        tree    : Parsed tree
+        resolve : Renders the full document of an item reference path
+
+    Returns:
+        Filtered document
+    """
+    if isinstance(value, list):
+        return [apply_tree(item, tree, resolve) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if isinstance(value, ItemRef) and any(field not in value for field in tree):
+        value = resolve(value.path)
+
+    filtered = {'_class': value['_class']} if '_class' in value else {}
+    for field, (subtree, item_range) in tree.items():
+        if field not in value:
+            continue
+        field_value = value[field]
+        if item_range and isinstance(field_value, list):
+            field_value = field_value[item_range[0] : item_range[1]]
+        filtered[field] = apply_tree(field_value, subtree, resolve) if subtree else _plain(field_value)
+    return filtered
+
+
+def apply_depth(value: Any, depth: int, resolve: Callable[[str], dict]) -> Any:
+    """Expand nested item references to the requested `depth`
+
+    Args:
+        value   : API document, or part of it
+        depth   : Number of levels of nested items shown in full
+        resolve : Renders the full document of an item reference path
+
+    Returns:
+        Expanded document
+    """
+    if isinstance(value, list):
+        return [apply_depth(item, depth, resolve) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if isinstance(value, ItemRef):
+        if depth <= 0:
+            return dict(value)
+        return apply_depth(resolve(value.path), depth - 1, resolve)
+    return {field: apply_depth(field_value, depth, resolve) for field, field_value in value.items()}
+
+
+def _plain(value: Any) -> Any:
+    """Strip item reference markers from a value"""
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {field: _plain(field_value) for field, field_value in value.items()}
+    return value
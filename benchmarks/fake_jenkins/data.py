@@ -0,0 +1,344 @@
+"""Synthetic content of the fake Jenkins server"""
+
+from collections.abc import Iterator
+from math import ceil
+from time import time
+from typing import Optional
+
+FOLDER_CLASS = 'com.cloudbees.hudson.plugins.folder.Folder'
+JOB_CLASS = 'org.jenkinsci.plugins.workflow.job.WorkflowJob'
+BUILD_CLASS = 'org.jenkinsci.plugins.workflow.job.WorkflowRun'
+
+# Words making the generated log lines look like a build log
+LOG_WORDS = ['Checking out', 'Compiling', 'Running tests', 'Downloading', 'Archiving', 'Publishing', 'Cleaning up']
+
+
+class SyntheticLog:
+    """Console text of a build, generated on demand for any byte range
+
+    Details: All lines have the same length, so any byte range can be generated without
+             generating the lines before it. This allows logs of many gigabytes without
+             storing them. Every `error_every` line contains the word `ERROR`.
+             A log with a `growth_rate` grows from empty at that many bytes per second,
+             starting at `started`, modelling the log of a running build.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        line_length: int = 100,
+        error_every: int = 997,
+        growth_rate: float = 0,
+        started: Optional[float] = None,
+    ) -> None:
+        """Object constructor method, called at object creation
+
+        Args:
+            size        : Full size of the log in bytes. Rounded up to whole lines
+            line_length : Bytes per line, including the line break
+            error_every : Every this many lines contain `ERROR`. 0 for none
+            growth_rate : Bytes per second the log grows while running. 0 if complete
+            started     : Time the log started growing. Default is now
+
+        Returns:
+            None
+        """
+        self.line_length = max(line_length, 32)
+        self.lines = ceil(size / self.line_length)
+        self.size = self.lines * self.line_length
+        self.error_every = error_every
+        self.growth_rate = growth_rate
+        self.started = started if started is not None else time()
+
+    def size_now(self) -> int:
+        """Get the number of bytes available now
+
+        Returns:
+            Number of bytes, a whole number of lines
+        """
+        if not self.growth_rate:
+            return self.size
+        grown = int((time() - self.started) * self.growth_rate)
+        return min(self.size, grown - grown % self.line_length)
+
+    def complete(self) -> bool:
+        """Check if the log has reached its full size
+
+        Returns:
+            True if complete, else False
+        """
+        return self.size_now() >= self.size
+
+    def line(self, number: int) -> bytes:
+        """Generate one line
+
+        Args:
+            number : Zero based line number
+
+        Returns:
+            Line, including the line break
+        """
+        level = 'ERROR' if self.error_every and number % self.error_every == self.error_every - 1 else 'INFO '
+        text = f'[{number:010d}] {level} {LOG_WORDS[number % len(LOG_WORDS)]} item {number % 1000} '
+        return (text + '.' * self.line_length)[: self.line_length - 1].encode() + b'\n'
+
+    def read(self, start: int = 0, end: Optional[int] = None) -> bytes:
+        """Generate a byte range of the log
+
+        Args:
+            start : First byte
+            end   : Byte after the last byte. Default is the currently available size
+
+        Returns:
+            Log bytes
+        """
+        return b''.join(self.iter_bytes(start, end))
+
+    def iter_bytes(self, start: int = 0, end: Optional[int] = None, chunk_size: int = 65536) -> Iterator[bytes]:
+        """Generate a byte range of the log in chunks
+
+        Args:
+            start      : First byte
+            end        : Byte after the last byte. Default is the currently available size
+            chunk_size : Approximate bytes per chunk
+
+        Returns:
+            Iterator of log bytes
+        """
+        available = self.size_now()
+        end = available if end is None else min(end, available)
+        if start >= end:
+            return
+        lines_per_chunk = max(1, chunk_size // self.line_length)
+        first_line = start // self.line_length
+        last_line = (end - 1) // self.line_length
+        for chunk_start in range(first_line, last_line + 1, lines_per_chunk):
+            chunk_end = min(chunk_start + lines_per_chunk, last_line + 1)
+            chunk = b''.join(self.line(number) for number in range(chunk_start, chunk_end))
+            chunk_offset = chunk_start * self.line_length
+            yield chunk[max(0, start - chunk_offset) : end - chunk_offset]
+
+
+class FakeJenkinsData:
+    """Folders, jobs, builds, queue, and nodes served by the fake Jenkins server
+
+    Details: Only the folder and job full names are stored. Builds, stages, steps, and logs
+             are the same for every job and generated on request.
+    """
+
+    def __init__(
+        self,
+        *,
+        builds: int = 5,
+        log_size: int = 100_000,
+        running_builds: bool = False,
+        log_growth_rate: float = 50_000,
+        stages: Optional[list[str]] = None,
+        steps_per_stage: int = 3,
+        queue_items: int = 0,
+        nodes: int = 1,
+        artifacts: int = 0,
+        artifact_size: int = 1_000_000,
+    ) -> None:
+        """Object constructor method, called at object creation
+
+        Args:
+            builds          : Number of builds of each job
+            log_size        : Console text size of each build in bytes
+            running_builds  : If True, the last build of each job is running until its log is complete
+            log_growth_rate : Bytes per second the log of a running build grows
+            stages          : Pipeline stage names of each build
+            steps_per_stage : Number of steps in each stage
+            queue_items     : Number of queued builds
+            nodes           : Number of agent nodes, besides the built-in node
+            artifacts       : Number of archived artifacts of each build
+            artifact_size   : Size of each artifact in bytes
+
+        Returns:
+            None
+        """
+        self.folders: dict[str, list[str]] = {'': []}
+        self.jobs: dict[str, list[str]] = {'': []}
+        self.job_names: set[str] = set()
+
+        self.builds = builds
+        self.log_size = log_size
+        self.running_builds = running_builds
+        self.log_growth_rate = log_growth_rate
+        self.stages = stages if stages is not None else ['Checkout', 'Build', 'Test', 'Deploy']
+        self.steps_per_stage = steps_per_stage
+        self.queue_items = queue_items
+        self.nodes = nodes
+        self.artifacts = artifacts
+        self.artifact_size = artifact_size
+
+        self.started = time()
+        self._logs: dict[tuple[str, int], SyntheticLog] = {}
+
+    def add_folder(self, fullname: str) -> None:
+        """Add a folder, and any missing parent folders
+
+        Args:
+            fullname : Full name of the folder (ie. `folder-1/folder-2`)
+
+        Returns:
+            None
+        """
+        if fullname in self.folders:
+            return
+        parent = fullname.rsplit('/', 1)[0] if '/' in fullname else ''
+        self.add_folder(parent)
+        self.folders[parent].append(fullname)
+        self.folders[fullname] = []
+        self.jobs[fullname] = []
+
+    def add_job(self, fullname: str) -> None:
+        """Add a job, and any missing parent folders
+
+        Args:
+            fullname : Full name of the job (ie. `folder-1/job-1`)
+
+        Returns:
+            None
+        """
+        parent = fullname.rsplit('/', 1)[0] if '/' in fullname else ''
+        self.add_folder(parent)
+        self.jobs[parent].append(fullname)
+        self.job_names.add(fullname)
+
+    def job_count(self) -> int:
+        """Get the number of jobs
+
+        Returns:
+            Number of jobs
+        """
+        return len(self.job_names)
+
+    def is_running(self, job: str, number: int) -> bool:
+        """Check if a build is running
+
+        Args:
+            job    : Full name of the job
+            number : Build number
+
+        Returns:
+            True if running, else False
+        """
+        return self.running_builds and number == self.builds and not self.log(job, number).complete()
+
+    def log(self, job: str, number: int) -> SyntheticLog:
+        """Get the console text of a build
+
+        Args:
+            job    : Full name of the job
+            number : Build number
+
+        Returns:
+            Build log
+        """
+        key = (job, number)
+        if key not in self._logs:
+            running = self.running_builds and number == self.builds
+            self._logs[key] = SyntheticLog(
+                self.log_size, growth_rate=self.log_growth_rate if running else 0, started=self.started
+            )
+        return self._logs[key]
+
+    def artifact_paths(self) -> list[str]:
+        """Get the relative paths of the archived artifacts of each build
+
+        Returns:
+            Artifact paths (ie. `dist/artifact-1.bin`)
+        """
+        return [f'dist/artifact-{number}.bin' for number in range(1, self.artifacts + 1)]
+
+    def artifact(self, path: str) -> Optional[SyntheticLog]:
+        """Get the content of an archived artifact
+
+        Details: Artifacts are the same for every build, with the content of a build log
+
+        Args:
+            path : Relative path of the artifact
+
+        Returns:
+            Artifact content, None if there is no such artifact
+        """
+        if path not in self.artifact_paths():
+            return None
+        return SyntheticLog(self.artifact_size, error_every=0)
+
+
+def generate_jobs(
+    jobs: int = 100_000, folder_depth: int = 2, folder_fanout: int = 20, **data_kwargs
+) -> FakeJenkinsData:
+    """Generate a server with many jobs spread evenly over a balanced folder tree
+
+    Details: There are `folder_fanout ** folder_depth` folders on the lowest level, each
+             holding about the same number of jobs. Jobs are named `job-<N>`, numbered
+             across the whole server, and folders `folder-<N>`, numbered within their parent.
+
+    Args:
+        jobs          : Number of jobs
+        folder_depth  : Number of folder levels above the jobs. 0 for all jobs in the server root
+        folder_fanout : Number of sub-folders of each folder
+        data_kwargs   : Any other `FakeJenkinsData` arguments
+
+    Returns:
+        Server content
+    """
+    data = FakeJenkinsData(**data_kwargs)
+    leaf_folders = ['']
+    for _ in range(folder_depth):
+        leaf_folders = [
+            f'{parent}/folder-{number}'.strip('/') for parent in leaf_folders for number in range(1, folder_fanout + 1)
+        ]
+    for folder in leaf_folders:
+        if folder:
+            data.add_folder(folder)
+
+    jobs_per_folder = ceil(jobs / len(leaf_folders))
+    for job_number in range(1, jobs + 1):
+        folder = leaf_folders[(job_number - 1) // jobs_per_folder]
+        data.add_job(f'{folder}/job-{job_number}'.strip('/'))
+    return data
+
+
+def generate_deep_folders(depth: int = 50, jobs_per_folder: int = 2, **data_kwargs) -> FakeJenkinsData:
+    """Generate a server with a single chain of deeply nested folders
+
+    Args:
+        depth           : Number of nested folders
+        jobs_per_folder : Number of jobs in each folder
+        data_kwargs     : Any other `FakeJenkinsData` arguments
+
+    Returns:
+        Server content
+    """
+    data = FakeJenkinsData(**data_kwargs)
+    folder = ''
+    job_number = 0
+    for level in range(1, depth + 1):
+        folder = f'{folder}/folder-{level}'.strip('/')
+        data.add_folder(folder)
+        for _ in range(jobs_per_folder):
+            job_number += 1
+            data.add_job(f'{folder}/job-{job_number}')
+    return data
+
+
+def generate_large_logs(log_size: int = 2 * 1024**3, jobs: int = 1, builds: int = 1, **data_kwargs) -> FakeJenkinsData:
+    """Generate a server with a few jobs whose builds have very large logs
+
+    Args:
+        log_size    : Console text size of each build in bytes
+        jobs        : Number of jobs, all in the server root
+        builds      : Number of builds of each job
+        data_kwargs : Any other `FakeJenkinsData` arguments
+
+    Returns:
+        Server content
+    """
+    data = FakeJenkinsData(builds=builds, log_size=log_size, **data_kwargs)
+    for job_number in range(1, jobs + 1):
+        data.add_job(f'job-{job_number}')
+    return data
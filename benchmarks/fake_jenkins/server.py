@@ -0,0 +1,836 @@
+"""FakeJenkins class definition"""
+
+import base64
+import json
+import threading
+from collections.abc import Callable, Iterable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import chain, islice
+from time import sleep, time
+from typing import Optional
+from urllib.parse import parse_qs, quote, unquote, urlparse
+
+from fake_jenkins.api_tree import ItemRef, apply_depth, apply_tree, parse_tree
+from fake_jenkins.data import BUILD_CLASS, FOLDER_CLASS, JOB_CLASS, FakeJenkinsData, generate_jobs
+
+# Name of the built-in node in node URLs
+BUILT_IN_NODE = '(built-in)'
+# Milliseconds each build, stage, and step takes
+BUILD_DURATION_MS = 300_000
+CRUMB = 'fake-crumb'
+
+
+class FakeJenkins:
+    """Lightweight in-process fake Jenkins server
+
+    Details: Serves the JSON API (with `tree` and `depth`) of the server, folders, jobs,
+             builds, queue, and nodes, build console text (with byte ranges), progressive
+             log text, pipeline stages and steps (`wfapi`), and Groovy scripts (`scriptText`).
+             A fixed latency can be added to every response and the response bandwidth can
+             be limited to model slow network links. Every request is recorded in `request_log`.
+    """
+
+    def __init__(
+        self,
+        data: Optional[FakeJenkinsData] = None,
+        latency: float = 0.0,
+        bandwidth: int = 0,
+        *,
+        api_token: str = '',
+        use_crumbs: bool = False,
+        script_handler: Optional[Callable[[str], str]] = None,
+    ) -> None:
+        """Object constructor method, called at object creation
+
+        Args:
+            data           : Server content. Default is 5 folders with 10 jobs each
+            latency        : Seconds added before every response
+            bandwidth      : Maximum response bytes per second. 0 for no limit
+            api_token      : If set, requests must use this API token, else any credentials are accepted
+            use_crumbs     : If True, POST requests must send the crumb of `crumbIssuer`
+            script_handler : Returns the output of a Groovy script sent to `scriptText`. Default is no output
+
+        Returns:
+            None
+        """
+        self.data = data or generate_jobs(jobs=50, folder_depth=1, folder_fanout=5)
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.api_token = api_token
+        self.use_crumbs = use_crumbs
+        self.script_handler = script_handler or (lambda script: '')
+
+        self.url = ''
+        self.request_log: list[tuple[str, str]] = []
+        self._queue_id = 1000
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+        # GET request handlers by server path, by server path prefix, by build path, and by build path prefix
+        self._get_routes = {
+            '/crumbIssuer/api/json': self._crumb_json,
+            '/crumbIssuer/api/xml': self._crumb_xml,
+            '/me/api/json': self._me,
+            '/queue/api/json': self._queue,
+            '/computer/api/json': self._computer,
+        }
+        self._get_prefix_routes = [
+            ('/login', self._login),
+            ('/queue/item/', self._queue_item),
+            ('/computer/', self._node),
+        ]
+        self._build_routes = {
+            ('api', 'json'): self._build_api,
+            ('wfapi', 'describe'): self._build_describe,
+            ('consoleText',): self._console_text,
+            ('logText', 'progressiveText'): self._progressive_text,
+        }
+        self._build_prefix_routes = {'execution': self._flow_node, 'artifact': self._artifact}
+
+    def start(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        """Start serving in a background thread
+
+        Args:
+            host : Address to listen on
+            port : Port to listen on. 0 to pick a free port
+
+        Returns:
+            Server URL
+        """
+        fake = self
+
+        class Handler(_FakeJenkinsHandler):
+            server_fake = fake
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self.url = f'http://{host}:{self._server.server_port}'
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self.url
+
+    def serve_forever(self, host: str = '127.0.0.1', port: int = 8080) -> None:
+        """Serve in the current thread until interrupted
+
+        Args:
+            host : Address to listen on
+            port : Port to listen on
+
+        Returns:
+            None
+        """
+        self.start(host, port)
+        try:
+            while True:
+                sleep(1)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        """Stop serving
+
+        Returns:
+            None
+        """
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    ###########################################################################
+    #                             URL PATHS
+    ###########################################################################
+
+    @staticmethod
+    def item_path(fullname: str) -> str:
+        """Get the URL path of a folder or job
+
+        Args:
+            fullname : Full name of the item. Empty for the server root
+
+        Returns:
+            URL path, with leading and trailing slashes
+        """
+        if not fullname:
+            return '/'
+        return ''.join(f'/job/{quote(name)}' for name in fullname.split('/')) + '/'
+
+    def parse_item_path(self, path: str) -> tuple[Optional[str], list[str]]:
+        """Split a URL path into the folder or job it targets and the rest of the path
+
+        Args:
+            path : URL path
+
+        Returns:
+            Full name of the item (None if not found) and the remaining path segments
+        """
+        segments = [unquote(segment) for segment in path.strip('/').split('/') if segment]
+        fullname = ''
+        while len(segments) >= 2 and segments[0] == 'job':
+            child = f'{fullname}/{segments[1]}'.strip('/')
+            if child not in self.data.folders and child not in self.data.job_names:
+                return None, segments
+            fullname = child
+            segments = segments[2:]
+        return fullname, segments
+
+    ###########################################################################
+    #                             DOCUMENTS
+    ###########################################################################
+
+    def _job_ref(self, job: str) -> ItemRef:
+        color = 'blue_anime' if self.data.is_running(job, self.data.builds) else 'blue'
+        path = self.item_path(job)
+        fields = {'_class': JOB_CLASS, 'name': job.rsplit('/', 1)[-1], 'url': self.url + path, 'color': color}
+        return ItemRef(path, fields)
+
+    def _folder_ref(self, folder: str) -> ItemRef:
+        path = self.item_path(folder)
+        return ItemRef(path, {'_class': FOLDER_CLASS, 'name': folder.rsplit('/', 1)[-1], 'url': self.url + path})
+
+    def _build_ref(self, job: str, number: int) -> Optional[ItemRef]:
+        if not 1 <= number <= self.data.builds:
+            return None
+        path = f'{self.item_path(job)}{number}/'
+        return ItemRef(path, {'_class': BUILD_CLASS, 'number': number, 'url': self.url + path})
+
+    def folder_document(self, folder: str) -> dict:
+        """Get the API document of a folder, or of the server root
+
+        Args:
+            folder : Full name of the folder. Empty for the server root
+
+        Returns:
+            API document
+        """
+        path = self.item_path(folder)
+        jobs = [self._folder_ref(child) for child in self.data.folders[folder]]
+        jobs += [self._job_ref(job) for job in self.data.jobs[folder]]
+        if not folder:
+            return {
+                '_class': 'hudson.model.Hudson',
+                'assignedLabels': [{'name': 'built-in'}],
+                'mode': 'NORMAL',
+                'nodeDescription': 'Fake Jenkins built-in node',
+                'nodeName': '',
+                'numExecutors': 2,
+                'description': None,
+                'jobs': jobs,
+                'primaryView': {'_class': 'hudson.model.AllView', 'name': 'all', 'url': self.url + '/'},
+                'quietingDown': False,
+                'slaveAgentPort': 50000,
+                'url': self.url + '/',
+                'useCrumbs': self.use_crumbs,
+                'useSecurity': True,
+                'views': [{'_class': 'hudson.model.AllView', 'name': 'all', 'url': self.url + '/'}],
+            }
+        name = folder.rsplit('/', 1)[-1]
+        return {
+            '_class': FOLDER_CLASS,
+            'description': None,
+            'displayName': name,
+            'fullDisplayName': folder.replace('/', ' » '),
+            'fullName': folder,
+            'name': name,
+            'url': self.url + path,
+            'jobs': jobs,
+            'primaryView': {'_class': 'hudson.model.AllView', 'name': 'All', 'url': self.url + path},
+            'views': [{'_class': 'hudson.model.AllView', 'name': 'All', 'url': self.url + path}],
+        }
+
+    def job_document(self, job: str) -> dict:
+        """Get the API document of a job
+
+        Args:
+            job : Full name of the job
+
+        Returns:
+            API document
+        """
+        builds = self.data.builds
+        name = job.rsplit('/', 1)[-1]
+        last_completed = builds - 1 if self.data.is_running(job, builds) else builds
+        last_failed = last_completed - last_completed % 5
+        last_successful = last_completed - 1 if last_completed == last_failed else last_completed
+        return {
+            **self._job_ref(job),
+            'description': '',
+            'displayName': name,
+            'fullDisplayName': job.replace('/', ' » '),
+            'fullName': job,
+            'buildable': True,
+            'builds': [self._build_ref(job, number) for number in range(builds, 0, -1)],
+            'firstBuild': self._build_ref(job, 1),
+            'healthReport': [],
+            'inQueue': False,
+            'keepDependencies': False,
+            'lastBuild': self._build_ref(job, builds),
+            'lastCompletedBuild': self._build_ref(job, last_completed),
+            'lastFailedBuild': self._build_ref(job, last_failed),
+            'lastSuccessfulBuild': self._build_ref(job, last_successful),
+            'nextBuildNumber': builds + 1,
+            'property': [],
+            'queueItem': None,
+            'concurrentBuild': False,
+            'resumeBlocked': False,
+        }
+
+    def _build_result(self, job: str, number: int) -> Optional[str]:
+        if self.data.is_running(job, number):
+            return None
+        return 'FAILURE' if number % 5 == 0 else 'SUCCESS'
+
+    def _build_timestamp(self, number: int) -> int:
+        return int((self.data.started - (self.data.builds - number) * 3600) * 1000)
+
+    def build_document(self, job: str, number: int) -> dict:
+        """Get the API document of a build
+
+        Args:
+            job    : Full name of the job
+            number : Build number
+
+        Returns:
+            API document
+        """
+        running = self.data.is_running(job, number)
+        return {
+            **self._build_ref(job, number),
+            'actions': [
+                {
+                    '_class': 'hudson.model.CauseAction',
+                    'causes': [
+                        {
+                            '_class': 'hudson.model.Cause$UserIdCause',
+                            'shortDescription': 'Started by user admin',
+                            'userId': 'admin',
+                            'userName': 'admin',
+                        }
+                    ],
+                }
+            ],
+            'artifacts': [
+                {'displayPath': path.rsplit('/', 1)[-1], 'fileName': path.rsplit('/', 1)[-1], 'relativePath': path}
+                for path in self.data.artifact_paths()
+            ],
+            'building': running,
+            'description': None,
+            'displayName': f'#{number}',
+            'duration': 0 if running else BUILD_DURATION_MS,
+            'estimatedDuration': BUILD_DURATION_MS,
+            'fullDisplayName': f'{job.replace("/", " » ")} #{number}',
+            'id': str(number),
+            'inProgress': running,
+            'keepLog': False,
+            'queueId': number,
+            'result': self._build_result(job, number),
+            'timestamp': self._build_timestamp(number),
+            'builtOn': '',
+            'changeSets': [],
+            'culprits': [],
+            'nextBuild': self._build_ref(job, number + 1),
+            'previousBuild': self._build_ref(job, number - 1),
+        }
+
+    def _stage_nodes(self, job: str, number: int) -> Iterable[tuple[int, str, str, list[dict]]]:
+        """Generate the stages of a build, as far as the build has progressed
+
+        Returns:
+            Iterator of stage node ID, stage name, status, and steps
+        """
+        build_path = f'{self.item_path(job)}{number}/'
+        log = self.data.log(job, number)
+        progress = log.size_now() / log.size if log.size else 1.0
+        stage_count = len(self.data.stages)
+        for index, stage_name in enumerate(self.data.stages):
+            if progress < 1.0 and index > progress * stage_count:
+                break
+            status = 'IN_PROGRESS' if progress < 1.0 and index >= int(progress * stage_count) else 'SUCCESS'
+            stage_id = 10 + index * (self.data.steps_per_stage + 1)
+            steps = []
+            for step_index in range(self.data.steps_per_stage):
+                step_id = stage_id + 1 + step_index
+                step_path = f'{build_path}execution/node/{step_id}/'
+                steps.append(
+                    {
+                        '_links': {
+                            'self': {'href': f'{step_path}wfapi/describe'},
+                            'log': {'href': f'{step_path}wfapi/log'},
+                            'console': {'href': f'{step_path}log'},
+                        },
+                        'id': str(step_id),
+                        'name': 'Shell Script',
+                        'execNode': '',
+                        'status': status,
+                        'parameterDescription': f'echo "{stage_name} step {step_index + 1}"',
+                        'startTimeMillis': self._build_timestamp(number) + index * 60_000 + step_index * 10_000,
+                        'durationMillis': 10_000,
+                        'pauseDurationMillis': 0,
+                        'parentNodes': [str(stage_id)],
+                    }
+                )
+            yield stage_id, stage_name, status, steps
+
+    def _stage_summary(self, job: str, number: int, stage_id: int, stage_name: str, status: str) -> dict:
+        build_path = f'{self.item_path(job)}{number}/'
+        index = (stage_id - 10) // (self.data.steps_per_stage + 1)
+        return {
+            '_links': {'self': {'href': f'{build_path}execution/node/{stage_id}/wfapi/describe'}},
+            'id': str(stage_id),
+            'name': stage_name,
+            'execNode': '',
+            'status': status,
+            'startTimeMillis': self._build_timestamp(number) + index * 60_000,
+            'durationMillis': 60_000,
+            'pauseDurationMillis': 0,
+        }
+
+    def describe_document(self, job: str, number: int) -> dict:
+        """Get the pipeline stages of a build (`wfapi/describe`)
+
+        Args:
+            job    : Full name of the job
+            number : Build number
+
+        Returns:
+            Pipeline run description
+        """
+        running = self.data.is_running(job, number)
+        timestamp = self._build_timestamp(number)
+        return {
+            '_links': {'self': {'href': f'{self.item_path(job)}{number}/wfapi/describe'}},
+            'id': str(number),
+            'name': f'#{number}',
+            'status': 'IN_PROGRESS' if running else self._build_result(job, number),
+            'startTimeMillis': timestamp,
+            'endTimeMillis': 0 if running else timestamp + BUILD_DURATION_MS,
+            'durationMillis': 0 if running else BUILD_DURATION_MS,
+            'queueDurationMillis': 5,
+            'pauseDurationMillis': 0,
+            'stages': [
+                self._stage_summary(job, number, stage_id, stage_name, status)
+                for stage_id, stage_name, status, _ in self._stage_nodes(job, number)
+            ],
+        }
+
+    def flow_node_document(self, job: str, number: int, node_id: int, log: bool = False) -> Optional[dict]:
+        """Get a pipeline stage or step of a build (`execution/node/<ID>/wfapi/describe`)
+
+        Args:
+            job     : Full name of the job
+            number  : Build number
+            node_id : Flow node ID of the stage or step
+            log     : If True, get the log of the step (`wfapi/log`)
+
+        Returns:
+            Stage or step description, None if not found
+        """
+        for stage_id, stage_name, status, steps in self._stage_nodes(job, number):
+            if node_id == stage_id and not log:
+                return {**self._stage_summary(job, number, stage_id, stage_name, status), 'stageFlowNodes': steps}
+            for step in steps:
+                if step['id'] != str(node_id):
+                    continue
+                if not log:
+                    return step
+                text = f'{step["parameterDescription"]}\n{stage_name} step output\n'
+                return {
+                    'nodeId': step['id'],
+                    'nodeStatus': step['status'],
+                    'length': len(text),
+                    'hasMore': False,
+                    'text': text,
+                    'consoleUrl': step['_links']['console']['href'],
+                }
+        return None
+
+    def queue_document(self) -> dict:
+        """Get the API document of the build queue
+
+        Returns:
+            API document
+        """
+        jobs = islice(chain.from_iterable(self.data.jobs.values()), self.data.queue_items)
+        now = int(time() * 1000)
+        return {
+            '_class': 'hudson.model.Queue',
+            'discoverableItems': [],
+            'items': [
+                {
+                    '_class': 'hudson.model.Queue$WaitingItem',
+                    'actions': [],
+                    'blocked': False,
+                    'buildable': False,
+                    'id': queue_id,
+                    'inQueueSince': now - 1000 * queue_id,
+                    'params': '',
+                    'stuck': False,
+                    'task': dict(self._job_ref(job)),
+                    'url': f'queue/item/{queue_id}/',
+                    'why': 'Waiting for next available executor',
+                }
+                for queue_id, job in enumerate(jobs, start=1)
+            ],
+        }
+
+    def node_document(self, name: str) -> Optional[dict]:
+        """Get the API document of a node
+
+        Args:
+            name : Node name. `(built-in)` for the built-in node
+
+        Returns:
+            API document, None if not found
+        """
+        if name in [BUILT_IN_NODE, 'master']:
+            node_class, display_name = 'hudson.model.Hudson$MasterComputer', 'Built-In Node'
+        elif name.startswith('agent-') and name[len('agent-') :].isdigit() and int(name[6:]) <= self.data.nodes:
+            node_class, display_name = 'hudson.slaves.SlaveComputer', name
+        else:
+            return None
+        return {
+            '_class': node_class,
+            'actions': [],
+            'assignedLabels': [{'name': display_name.lower()}],
+            'description': '',
+            'displayName': display_name,
+            'executors': [{}, {}],
+            'icon': 'symbol-computer',
+            'idle': True,
+            'jnlpAgent': node_class.endswith('SlaveComputer'),
+            'launchSupported': False,
+            'manualLaunchAllowed': True,
+            'monitorData': {},
+            'numExecutors': 2,
+            'offline': False,
+            'offlineCause': None,
+            'offlineCauseReason': '',
+            'oneOffExecutors': [],
+            'temporarilyOffline': False,
+        }
+
+    def computer_document(self) -> dict:
+        """Get the API document of all nodes
+
+        Returns:
+            API document
+        """
+        names = [BUILT_IN_NODE] + [f'agent-{number}' for number in range(1, self.data.nodes + 1)]
+        return {
+            '_class': 'hudson.model.ComputerSet',
+            'busyExecutors': 0,
+            'computer': [self.node_document(name) for name in names],
+            'displayName': 'Nodes',
+            'totalExecutors': 2 * len(names),
+        }
+
+    def resolve(self, path: str) -> dict:
+        """Render the full API document of an item reference
+
+        Args:
+            path : URL path of a folder, job, or build
+
+        Returns:
+            API document
+        """
+        fullname, rest = self.parse_item_path(path)
+        if fullname in self.data.job_names and rest and rest[0].isdigit():
+            return self.build_document(fullname, int(rest[0]))
+        if fullname in self.data.job_names:
+            return self.job_document(fullname)
+        return self.folder_document(fullname)
+
+    ###########################################################################
+    #                             REQUESTS
+    ###########################################################################
+
+    def authorized(self, authorization: str) -> bool:
+        """Check the credentials of a request
+
+        Args:
+            authorization : Value of the `Authorization` header
+
+        Returns:
+            True if allowed, else False
+        """
+        if not self.api_token:
+            return True
+        if not authorization.startswith('Basic '):
+            return False
+        credentials = base64.b64decode(authorization[len('Basic ') :]).decode(errors='replace')
+        return credentials.split(':', 1)[-1] == self.api_token
+
+    def api_response(self, document: Optional[dict], query: dict) -> tuple[int, dict, Iterable[bytes]]:
+        """Build the response of a JSON API request, applying `tree` or `depth`
+
+        Args:
+            document : API document
+            query    : Parsed query parameters
+
+        Returns:
+            Status code, response headers, and body chunks
+        """
+        if document is None:
+            return _not_found()
+        if 'tree' in query:
+            document = apply_tree(document, parse_tree(query['tree'][0]), self.resolve)
+        else:
+            document = apply_depth(document, int(query.get('depth', ['0'])[0]), self.resolve)
+        return 200, {'Content-Type': 'application/json;charset=utf-8'}, [json.dumps(document).encode()]
+
+    def handle_get(self, path: str, query: dict, headers: dict) -> tuple[int, dict, Iterable[bytes]]:
+        """Handle a GET or HEAD request
+
+        Details: Server paths are looked up in `_get_routes`, then by prefix in `_get_prefix_routes`.
+                 Any other path is handled as a folder, job, or build path
+
+        Args:
+            path    : URL path
+            query   : Parsed query parameters
+            headers : Request headers
+
+        Returns:
+            Status code, response headers, and body chunks
+        """
+        route = self._get_routes.get(path)
+        if route is None:
+            route = next((route for prefix, route in self._get_prefix_routes if path.startswith(prefix)), None)
+        if route is None:
+            return self.handle_item_get(path, query, headers)
+        return route(path, query)
+
+    def handle_item_get(self, path: str, query: dict, headers: dict) -> tuple[int, dict, Iterable[bytes]]:
+        """Handle a GET or HEAD request of a folder, job, or build
+
+        Args:
+            path    : URL path
+            query   : Parsed query parameters
+            headers : Request headers
+
+        Returns:
+            Status code, response headers, and body chunks
+        """
+        fullname, rest = self.parse_item_path(path)
+        if fullname is None:
+            return _not_found()
+        if fullname in self.data.folders and fullname not in self.data.job_names:
+            return self.api_response(self.folder_document(fullname) if rest == ['api', 'json'] else None, query)
+        if rest == ['api', 'json']:
+            return self.api_response(self.job_document(fullname), query)
+        if not rest:
+            return _not_found()
+
+        number = {'lastBuild': self.data.builds, 'lastCompletedBuild': self.data.builds}.get(rest[0], rest[0])
+        if not str(number).isdigit() or not 1 <= int(number) <= self.data.builds:
+            return _not_found()
+        return self.handle_build_get(fullname, int(number), rest[1:], query, headers)
+
+    def handle_build_get(
+        self, job: str, number: int, rest: list[str], query: dict, headers: dict
+    ) -> tuple[int, dict, Iterable[bytes]]:
+        """Handle a GET or HEAD request of a build
+
+        Details: Build paths are looked up in `_build_routes`, then by their first segment in
+                 `_build_prefix_routes`
+
+        Args:
+            job     : Full name of the job
+            number  : Build number
+            rest    : Path segments after the build number
+            query   : Parsed query parameters
+            headers : Request headers
+
+        Returns:
+            Status code, response headers, and body chunks
+        """
+        route = self._build_routes.get(tuple(rest))
+        if route is None and len(rest) > 1:
+            route = self._build_prefix_routes.get(rest[0])
+        if route is None:
+            return _not_found()
+        return route(job, number, rest, query, headers)
+
+    def _login(self, path: str, query: dict) -> tuple[int, dict, Iterable[bytes]]:
+        return 200, {'Content-Type': 'text/html;charset=utf-8'}, [b'<html>Sign in</html>']
+
+    def _crumb_json(self, path: str, query: dict) -> tuple[int, dict, Iterable[bytes]]:
+        return self.api_response({'crumb': CRUMB, 'crumbRequestField': 'Jenkins-Crumb'}, query)
+
+    def _crumb_xml(self, path: str, query: dict) -> tuple[int, dict, Iterable[bytes]]:
+        body = f'<defaultCrumbIssuer><crumb>{CRUMB}</crumb><crumbRequestField>Jenkins-Crumb</crumbRequestField>'
+        return 200, {'Content-Type': 'application/xml'}, [(body + '</defaultCrumbIssuer>').encode()]
+
+    def _me(self, path: str, query: dict) -> tuple[int, dict, Iterable[bytes]]:
+        return self.api_response({'_class': 'hudson.model.User', 'id': 'admin', 'fullName': 'admin'}, query)
+
+    def _queue(self, path: str, query: dict) -> tuple[int, dict, Iterable[bytes]]:
+        return self.api_response(self.queue_document(), query)
+
+    def _queue_item(self, path: str, query: dict) -> tuple[int, dict, Iterable[bytes]]:
+        queue_id = path.split('/')[3]
+        if not queue_id.isdigit() or not path.endswith('/api/json'):
+            return _not_found()
+        item = {'_class': 'hudson.model.Queue$LeftItem', 'id': int(queue_id), 'cancelled': False}
+        return self.api_response({**item, 'executable': None, 'url': f'queue/item/{queue_id}/'}, query)
+
+    def _computer(self, path: str, query: dict) -> tuple[int, dict, Iterable[bytes]]:
+        return self.api_response(self.computer_document(), query)
+
+    def _node(self, path: str, query: dict) -> tuple[int, dict, Iterable[bytes]]:
+        if not path.endswith('/api/json'):
+            return _not_found()
+        return self.api_response(self.node_document(unquote(path.split('/')[2])), query)
+
+    def _build_api(self, job: str, number: int, rest: list[str], query: dict, headers: dict):
+        return self.api_response(self.build_document(job, number), query)
+
+    def _build_describe(self, job: str, number: int, rest: list[str], query: dict, headers: dict):
+        return self.api_response(self.describe_document(job, number), query)
+
+    def _flow_node(self, job: str, number: int, rest: list[str], query: dict, headers: dict):
+        if len(rest) != 5 or rest[1] != 'node' or not rest[2].isdigit() or rest[3] != 'wfapi':
+            return _not_found()
+        return self.api_response(self.flow_node_document(job, number, int(rest[2]), log=rest[4] == 'log'), query)
+
+    def _console_text(self, job: str, number: int, rest: list[str], query: dict, headers: dict):
+        log = self.data.log(job, number)
+        return _byte_range_response(log.size_now(), headers.get('Range', ''), log.iter_bytes)
+
+    def _artifact(self, job: str, number: int, rest: list[str], query: dict, headers: dict):
+        artifact = self.data.artifact('/'.join(rest[1:]))
+        if artifact is None:
+            return _not_found()
+        return _byte_range_response(artifact.size, headers.get('Range', ''), artifact.iter_bytes)
+
+    def _progressive_text(self, job: str, number: int, rest: list[str], query: dict, headers: dict):
+        log = self.data.log(job, number)
+        start = int(query.get('start', ['0'])[0])
+        size = log.size_now()
+        response_headers = {'Content-Type': 'text/plain;charset=utf-8', 'X-Text-Size': str(size)}
+        if self.data.is_running(job, number):
+            response_headers['X-More-Data'] = 'true'
+        return 200, response_headers, log.iter_bytes(start, size)
+
+    def handle_post(self, path: str, form: dict, headers: dict) -> tuple[int, dict, Iterable[bytes]]:
+        """Handle a POST request
+
+        Args:
+            path    : URL path
+            form    : Parsed form data
+            headers : Request headers
+
+        Returns:
+            Status code, response headers, and body chunks
+        """
+        if self.use_crumbs and headers.get('Jenkins-Crumb') != CRUMB:
+            return 403, {'Content-Type': 'text/html'}, [b'No valid crumb was included in the request']
+        if path == '/scriptText':
+            output = self.script_handler(form.get('script', [''])[0])
+            return 200, {'Content-Type': 'text/plain;charset=utf-8'}, [output.encode()]
+
+        fullname, rest = self.parse_item_path(path)
+        if fullname in self.data.job_names and rest and rest[0] in ['build', 'buildWithParameters']:
+            with self._lock:
+                self._queue_id += 1
+                queue_id = self._queue_id
+            return 201, {'Location': f'{self.url}/queue/item/{queue_id}/'}, []
+        return 200, {}, []
+
+
+def _not_found() -> tuple[int, dict, Iterable[bytes]]:
+    return 404, {'Content-Type': 'text/html'}, [b'<html>Not Found</html>']
+
+
+def _byte_range_response(
+    size: int, range_header: str, read: Callable[[int, int], Iterable[bytes]]
+) -> tuple[int, dict, Iterable[bytes]]:
+    """Build the response of a text request, with a single byte range if requested
+
+    Args:
+        size         : Total number of bytes
+        range_header : Value of the `Range` header
+        read         : Returns the bytes from a start up to an end byte
+
+    Returns:
+        Status code, response headers, and body chunks
+    """
+    headers = {'Content-Type': 'text/plain;charset=utf-8', 'Accept-Ranges': 'bytes'}
+    if not range_header.startswith('bytes='):
+        return 200, {**headers, 'Content-Length': str(size)}, read(0, size)
+
+    first, _, last = range_header[len('bytes=') :].split(',', 1)[0].strip().partition('-')
+    if not first:
+        start, end = max(0, size - int(last or 0)), size
+    else:
+        start, end = int(first), min(size, int(last) + 1) if last else size
+    if start >= size or start >= end:
+        return 416, {**headers, 'Content-Range': f'bytes */{size}'}, []
+    headers.update({'Content-Length': str(end - start), 'Content-Range': f'bytes {start}-{end - 1}/{size}'})
+    return 206, headers, read(start, end)
+
+
+class _FakeJenkinsHandler(BaseHTTPRequestHandler):
+    """Request handler of the fake Jenkins server"""
+
+    server_fake: FakeJenkins = None
+    protocol_version = 'HTTP/1.1'
+
+    def _read_body(self) -> bytes:
+        # Any request may have a body, which must be read to reuse the connection
+        return self.rfile.read(int(self.headers.get('Content-Length') or 0))
+
+    def _respond(self, status_code: int, headers: dict, chunks: Iterable[bytes]) -> None:
+        fake = self.server_fake
+        if fake.latency:
+            sleep(fake.latency)
+
+        # Responses without a known length are sent in full to get their length
+        if 'Content-Length' not in headers:
+            body = b''.join(chunks)
+            headers = {**headers, 'Content-Length': str(len(body))}
+            chunks = [body]
+        self.send_response(status_code)
+        self.send_header('X-Jenkins', '2.400')
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command == 'HEAD':
+            return
+
+        piece_size = max(1024, fake.bandwidth // 20) if fake.bandwidth else 0
+        try:
+            for chunk in chunks:
+                if not piece_size:
+                    self.wfile.write(chunk)
+                    continue
+                for position in range(0, len(chunk), piece_size):
+                    piece = chunk[position : position + piece_size]
+                    self.wfile.write(piece)
+                    sleep(len(piece) / fake.bandwidth)
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+    def _handle(self, method: str) -> None:
+        fake = self.server_fake
+        fake.request_log.append((method, self.path))
+        body = self._read_body()
+        url = urlparse(self.path)
+        if not url.path.startswith('/login') and not fake.authorized(self.headers.get('Authorization', '')):
+            return self._respond(401, {'Content-Type': 'text/html'}, [b'<html>Unauthorized</html>'])
+        if method == 'POST':
+            form = parse_qs(body.decode(errors='replace'))
+            return self._respond(*fake.handle_post(url.path, form, dict(self.headers.items())))
+        return self._respond(*fake.handle_get(url.path, parse_qs(url.query), dict(self.headers.items())))
+
+    def do_GET(self) -> None:
+        self._handle('GET')
+
+    def do_HEAD(self) -> None:
+        self._handle('HEAD')
+
+    def do_POST(self) -> None:
+        self._handle('POST')
+
+    def log_message(self, *args) -> None:
+        pass
@@ -1,5 +1,6 @@
 # -*- mode: python ; coding: utf-8 -*-
 
+from PyInstaller.utils.hooks import collect_submodules
 
 block_cipher = None
 
@@ -8,7 +9,7 @@ a = Analysis(['yojenkins/__main__.py'],
              pathex=[],
              binaries=[],
              datas=[],
-             hiddenimports=[],
+             hiddenimports=collect_submodules('yojenkins.cli_sub_commands'),
              hookspath=[],
              hooksconfig={},
              runtime_hooks=[],
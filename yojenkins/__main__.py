@@ -5,11 +5,11 @@ import logging
 import sys
 
 import click
-from click_help_colors import HelpColorsGroup
 
 from yojenkins import __version__
+from yojenkins.agent.agent_client import AgentForwardingGroup
 from yojenkins.cli import logger_setup
-from yojenkins.cli.cli_utility import set_debug_log_level
+from yojenkins.cli.lazy_group import LazyGroup, LazyHelpColorsGroup
 
 logger = logging.getLogger()
 
@@ -42,7 +42,7 @@ MAIN_HELP_TEXT = f"""
 ##############################################################################
 
 
-@click.group(help=MAIN_HELP_TEXT)
+@click.group(help=MAIN_HELP_TEXT, cls=AgentForwardingGroup)
 @click.version_option(
     __version__, "-v", "--version", message="%(version)s".format(version="version"),
     help="Show the version"
@@ -52,27 +52,27 @@ def main():
 
 # -----------------------------------------------------------------------------
 @main.group(short_help='\tManage authentication and profiles',
-    cls=HelpColorsGroup,
+    cls=LazyHelpColorsGroup,
+    lazy_module='yojenkins.cli_sub_commands.auth',
     help_options_custom_colors={
         'wipe': 'black'
         })
 def auth():
     """Authentication And Profile Management"""
     pass
-from yojenkins.cli_sub_commands import auth
 
 
 # -----------------------------------------------------------------------------
-@main.group(short_help='\tManage server')
+@main.group(short_help='\tManage server', cls=LazyGroup, lazy_module='yojenkins.cli_sub_commands.server')
 def server():
     """Server Management"""
     pass
-from yojenkins.cli_sub_commands import server
 
 
 # -----------------------------------------------------------------------------
 @main.group(short_help='\tManage nodes',
-    cls=HelpColorsGroup,
+    cls=LazyHelpColorsGroup,
+    lazy_module='yojenkins.cli_sub_commands.node',
     help_options_custom_colors={
         'prepare': 'black',
         'status': 'black',
@@ -82,24 +82,24 @@ from yojenkins.cli_sub_commands import server
 def node():
     """Node Management"""
     pass
-from yojenkins.cli_sub_commands import node
 
 
 # -----------------------------------------------------------------------------
 @main.group(short_help='\tManage user accounts',
-cls=HelpColorsGroup,
+cls=LazyHelpColorsGroup,
+    lazy_module='yojenkins.cli_sub_commands.account',
     help_options_custom_colors={
         'password-reset': 'black',
         })
 def account():
     """Account/User Management"""
     pass
-from yojenkins.cli_sub_commands import account
 
 
 # -----------------------------------------------------------------------------
 @main.group(short_help='\tManage credentials',
-cls=HelpColorsGroup,
+cls=LazyHelpColorsGroup,
+    lazy_module='yojenkins.cli_sub_commands.credential',
     help_options_custom_colors={
         'update': 'black',
         'move': 'black'
@@ -107,59 +107,60 @@ cls=HelpColorsGroup,
 def credential():
     """Credentials Management"""
     pass
-from yojenkins.cli_sub_commands import credential
 
 
 # -----------------------------------------------------------------------------
-@main.group(short_help='\tManage folders')
+@main.group(short_help='\tManage folders', cls=LazyGroup, lazy_module='yojenkins.cli_sub_commands.folder')
 def folder():
     """Folder Management"""
     pass
-from yojenkins.cli_sub_commands import folder
 
 
 # -----------------------------------------------------------------------------
 @main.group(short_help='\tManage jobs',
-    cls=HelpColorsGroup,
+    cls=LazyHelpColorsGroup,
+    lazy_module='yojenkins.cli_sub_commands.job',
     help_options_custom_colors={
         'queue_cancel': 'black'
         })
 def job():
     """Job Management"""
     pass
-from yojenkins.cli_sub_commands import job
 
 
 # -----------------------------------------------------------------------------
-@main.group(short_help='\tManage builds')
+@main.group(short_help='\tManage builds', cls=LazyGroup, lazy_module='yojenkins.cli_sub_commands.build')
 def build():
     """Build Management"""
     pass
-from yojenkins.cli_sub_commands import build
 
 
 # -----------------------------------------------------------------------------
-@main.group(short_help='\tManage build stages')
+@main.group(short_help='\tManage build stages', cls=LazyGroup, lazy_module='yojenkins.cli_sub_commands.stage')
 def stage():
     """Stage Management"""
     pass
-from yojenkins.cli_sub_commands import stage
 
 
 # -----------------------------------------------------------------------------
-@main.group(short_help='\tManage stage steps')
+@main.group(short_help='\tManage stage steps', cls=LazyGroup, lazy_module='yojenkins.cli_sub_commands.step')
 def step():
     """Step Management"""
     pass
-from yojenkins.cli_sub_commands import step
 
 
 # -----------------------------------------------------------------------------
-@main.group(short_help='\tTools and more')
+@main.group(short_help='\tManage local agent daemon', cls=LazyGroup, lazy_module='yojenkins.cli_sub_commands.agent')
+def agent():
+    """Local Agent Daemon Management"""
+    pass
+
+
+# -----------------------------------------------------------------------------
+@main.group(short_help='\tTools and more', cls=LazyGroup, lazy_module='yojenkins.cli_sub_commands.tools')
 def tools():
     """Utility And More"""
     pass
-from yojenkins.cli_sub_commands import tools
 
 ##############################################################################
 ##############################################################################
@@ -0,0 +1,4 @@
+"""Importing sub-modules"""
+
+from .agent_client import AgentClient, AgentForwardingGroup
+from .agent_server import AgentServer
@@ -0,0 +1,240 @@
+"""AgentClient class definition"""
+
+import json
+import logging
+import os
+import platform
+import socket
+import sys
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from yojenkins import __version__
+
+# Getting the logger reference
+logger = logging.getLogger()
+
+# TODO: Find centralized location for these static values
+CONFIG_DIR_NAME = '.yojenkins'
+AGENT_SOCKET_NAME = 'agent.sock'
+
+# Environment variable to use a different agent socket file
+AGENT_SOCKET_ENV_VAR = 'YOJENKINS_AGENT_SOCKET'
+# Environment variable to never forward commands to the agent
+AGENT_DISABLE_ENV_VAR = 'YOJENKINS_NO_AGENT'
+
+# Seconds to wait for the agent to accept a connection
+AGENT_CONNECT_TIMEOUT = 1
+
+# Commands that are never forwarded, because they are interactive, stream output, or manage local files
+AGENT_LOCAL_COMMANDS = [
+    ('agent',),
+    ('auth',),
+    ('build', 'browser'),
+    ('build', 'logs'),
+    ('build', 'monitor'),
+    ('folder', 'browser'),
+    ('job', 'browser'),
+    ('job', 'monitor'),
+    ('node', 'create-ephemeral'),
+    ('node', 'create-permanent'),
+    ('node', 'prepare'),
+    ('server', 'browser'),
+    ('server', 'server-deploy'),
+    ('server', 'server-teardown'),
+    ('tools', 'bug-report'),
+    ('tools', 'docs'),
+    ('tools', 'feature-request'),
+    ('tools', 'remove'),
+    ('tools', 'upgrade'),
+]
+# Options that make a command stream its output as it runs, or write debug log messages to its terminal
+AGENT_LOCAL_OPTIONS = ['--debug', '--follow', '--follow-logs', '--help', '--ndjson']
+# Environment variables of the client used by commands run in the agent, besides the yojenkins ones
+AGENT_FORWARDED_ENV_VARS = [
+    'ALL_PROXY',
+    'CURL_CA_BUNDLE',
+    'HTTP_PROXY',
+    'HTTPS_PROXY',
+    'NO_PROXY',
+    'REQUESTS_CA_BUNDLE',
+    'SSL_CERT_DIR',
+    'SSL_CERT_FILE',
+]
+
+
+class AgentLocalOnly(Exception):
+    """Raised within the agent when a command has to be run by the client, for example to ask for input"""
+
+
+def agent_supported() -> bool:
+    """Check if the agent daemon can be used on this system
+
+    Returns:
+        True if Unix domain sockets are available, else False
+    """
+    return hasattr(socket, 'AF_UNIX') and platform.system() != 'Windows'
+
+
+def agent_socket_path() -> str:
+    """Get the file path of the agent daemon socket
+
+    Returns:
+        Socket file path
+    """
+    return os.getenv(AGENT_SOCKET_ENV_VAR) or os.path.join(Path.home(), CONFIG_DIR_NAME, AGENT_SOCKET_NAME)
+
+
+def agent_environment() -> dict:
+    """Get the environment variables of this process used by commands run in the agent daemon
+
+    Details: These are the yojenkins environment variables, and the proxy and certificate
+             authority variables used by the server sessions
+
+    Returns:
+        Environment variables and their values
+    """
+    return {
+        key: value
+        for key, value in os.environ.items()
+        if key.startswith('YOJENKINS_') or key.upper() in AGENT_FORWARDED_ENV_VARS
+    }
+
+
+def is_forwardable(args: list[str]) -> bool:
+    """Check if a command can be run by the agent daemon instead of this process
+
+    Args:
+        args : Command line arguments, without the program name
+
+    Returns:
+        True if the command can be forwarded, else False
+    """
+    command = tuple(arg for arg in args[:2] if not arg.startswith('-'))
+    if not command:
+        return False
+    for local_command in AGENT_LOCAL_COMMANDS:
+        if command[: len(local_command)] == local_command:
+            return False
+    return not any(arg in AGENT_LOCAL_OPTIONS for arg in args)
+
+
+class AgentClient:
+    """Client sending requests to the local agent daemon"""
+
+    def __init__(self, socket_path: str = '') -> None:
+        """Object constructor method, called at object creation
+
+        Args:
+            socket_path : File path of the agent socket. Default is `~/.yojenkins/agent.sock`
+
+        Returns:
+            None
+        """
+        self.socket_path = socket_path or agent_socket_path()
+
+    def request(self, message: dict, timeout: Optional[float] = None) -> Optional[dict]:
+        """Send one request to the agent and wait for its response
+
+        Args:
+            message : Request message
+            timeout : Seconds to wait for the response. Default is to wait until the agent responds
+
+        Returns:
+            Response message, None if the agent is not running.
+            If the request was sent but no response was received, the message has a `lost` key
+        """
+        if not agent_supported() or not os.path.exists(self.socket_path):
+            return None
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client_socket:
+            try:
+                client_socket.settimeout(AGENT_CONNECT_TIMEOUT)
+                client_socket.connect(self.socket_path)
+            except OSError as error:
+                logger.debug(f'Failed to reach agent at "{self.socket_path}". Exception: {error}')
+                return None
+            try:
+                client_socket.settimeout(timeout)
+                client_socket.sendall(json.dumps(message).encode('utf-8') + b'\n')
+                with client_socket.makefile('rb') as response_file:
+                    return json.loads(response_file.readline())
+            except (OSError, ValueError) as error:
+                logger.debug(f'Failed to get response from agent. Exception: {error}')
+                return {'lost': True, 'error': f'Lost connection to agent: {error or "No response"}'}
+
+    def status(self) -> Optional[dict]:
+        """Get the status of the agent
+
+        Returns:
+            Agent status, None if the agent is not running
+        """
+        response = self.request({'type': 'status'}, timeout=AGENT_CONNECT_TIMEOUT * 5)
+        return response.get('status') if response else None
+
+    def stop(self) -> bool:
+        """Ask the agent to shut down
+
+        Returns:
+            True if the agent is shutting down, else False
+        """
+        response = self.request({'type': 'stop'}, timeout=AGENT_CONNECT_TIMEOUT * 5)
+        return bool(response and response.get('stopping'))
+
+    def forward(self, args: list[str]) -> Optional[int]:
+        """Run a command in the agent, writing its output to this process
+
+        Details: Commands are not forwarded if the agent is not running, is a different version,
+                 or if the command is interactive or streams its output. Commands the agent finds
+                 to need input, such as a password, are run by this process instead.
+
+        Args:
+            args : Command line arguments, without the program name
+
+        Returns:
+            Exit code of the command, None if the command was not run by the agent
+        """
+        if os.getenv(AGENT_DISABLE_ENV_VAR) or not is_forwardable(args):
+            return None
+        # Shell completion is handled by the local process
+        if any(key.startswith('_YOJENKINS_COMPLETE') for key in os.environ):
+            return None
+
+        response = self.request(
+            {
+                'type': 'run',
+                'version': __version__,
+                'args': args,
+                'cwd': os.getcwd(),
+                'env': agent_environment(),
+                'tty': sys.stdout.isatty(),
+            }
+        )
+        if not response:
+            return None
+        if response.get('lost'):
+            # The command may have already run, so it is not run again
+            click.secho(response['error'], fg='bright_red', bold=True, err=True)
+            return 1
+        if 'exit_code' not in response:
+            logger.debug(f'Agent did not run command: {response.get("error")}')
+            return None
+
+        sys.stdout.write(response['stdout'])
+        sys.stdout.flush()
+        sys.stderr.write(response['stderr'])
+        sys.stderr.flush()
+        return response['exit_code']
+
+
+class AgentForwardingGroup(click.Group):
+    """Top level command group forwarding the command to the agent daemon if it is running"""
+
+    def main(self, args=None, *main_args, **main_kwargs):
+        # Only forward commands coming from the command line, not the ones run by the agent itself
+        if args is None:
+            exit_code = AgentClient().forward(sys.argv[1:])
+            if exit_code is not None:
+                sys.exit(exit_code)
+        return super().main(args, *main_args, **main_kwargs)
@@ -0,0 +1,308 @@
+"""AgentServer class definition"""
+
+import io
+import json
+import logging
+import os
+import signal
+import socketserver
+import sys
+import traceback
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from shlex import quote
+from time import time
+
+from yojenkins import __version__
+from yojenkins.agent.agent_client import (
+    AGENT_FORWARDED_ENV_VARS,
+    AgentClient,
+    AgentLocalOnly,
+    agent_socket_path,
+    agent_supported,
+)
+
+# Getting the logger reference
+logger = logging.getLogger()
+
+# Seconds without any request after which the agent shuts down. 0 keeps it running
+DEFAULT_AGENT_IDLE_TIMEOUT = 3600
+# Seconds an authenticated server session is reused before authenticating again
+DEFAULT_AGENT_SESSION_TTL = 900
+
+
+class _CapturedOutput(io.StringIO):
+    """Captured text output of a command, reporting the terminal state of the client"""
+
+    def __init__(self, tty: bool) -> None:
+        super().__init__()
+        self.tty = tty
+
+    def isatty(self) -> bool:
+        return self.tty
+
+
+class _NoInput(io.StringIO):
+    """Standard input of a command, handing the command back to the client if it asks for input"""
+
+    def read(self, *_) -> str:
+        raise AgentLocalOnly('Command asked for input')
+
+    def readline(self, *_) -> str:
+        raise AgentLocalOnly('Command asked for input')
+
+
+class _AgentRequestHandler(socketserver.StreamRequestHandler):
+    """Handles one request of a client connected to the agent socket"""
+
+    def handle(self) -> None:
+        try:
+            message = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+        response = self.server.agent.handle_message(message)
+        with suppress(OSError):
+            self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+
+
+class AgentServer:
+    """Long running local daemon running yojenkins commands with warm server sessions
+
+    Details: The agent listens on a Unix domain socket only accessible by the current user.
+             Commands are run one at a time within the agent process, reusing the authenticated
+             server sessions, connection pools, response cache, and item index of earlier commands.
+    """
+
+    def __init__(
+        self,
+        socket_path: str = '',
+        idle_timeout: float = DEFAULT_AGENT_IDLE_TIMEOUT,
+        session_ttl: float = DEFAULT_AGENT_SESSION_TTL,
+    ) -> None:
+        """Object constructor method, called at object creation
+
+        Args:
+            socket_path  : File path of the agent socket. Default is `~/.yojenkins/agent.sock`
+            idle_timeout : Seconds without any request after which the agent shuts down. 0 keeps it running
+            session_ttl  : Seconds an authenticated server session is reused
+
+        Returns:
+            None
+        """
+        self.socket_path = socket_path or agent_socket_path()
+        self.idle_timeout = idle_timeout
+        self.session_ttl = session_ttl
+
+        self.started = 0.0
+        self.last_request = 0.0
+        self.commands_count = 0
+        self._stopping = False
+
+    def _bind(self) -> socketserver.UnixStreamServer:
+        """Create the agent socket, replacing a socket file left behind by an agent that is no longer running
+
+        Returns:
+            Socket server
+        """
+        socket_dir = os.path.dirname(self.socket_path)
+        os.makedirs(socket_dir, mode=0o700, exist_ok=True)
+        if os.path.exists(self.socket_path):
+            if AgentClient(self.socket_path).status():
+                raise OSError(f'Agent is already running on "{self.socket_path}"')
+            logger.debug(f'Removing stale agent socket file: {self.socket_path}')
+            os.remove(self.socket_path)
+
+        # Only the current user may connect to the socket
+        previous_umask = os.umask(0o177)
+        try:
+            server = socketserver.UnixStreamServer(self.socket_path, _AgentRequestHandler)
+        finally:
+            os.umask(previous_umask)
+        server.agent = self
+        server.timeout = 1
+        return server
+
+    def serve(self) -> None:
+        """Serve requests until stopped or idle for too long
+
+        Returns:
+            None
+        """
+        if not agent_supported():
+            raise OSError('The agent requires Unix domain sockets, which are not supported on this system')
+
+        # Commands run within the agent reuse their server sessions
+        from yojenkins.cli import cli_utility  # noqa: PLC0415
+
+        cli_utility.WARM_SESSIONS = {}
+        cli_utility.WARM_SESSION_TTL = self.session_ttl
+
+        server = self._bind()
+        self.started = self.last_request = time()
+        logger.debug(f'Agent (PID: {os.getpid()}) listening on: {self.socket_path}')
+
+        previous_handler = signal.signal(signal.SIGTERM, lambda *_: self.stop())
+        try:
+            while not self._stopping:
+                server.handle_request()
+                if self.idle_timeout and time() - self.last_request > self.idle_timeout:
+                    logger.debug(f'Agent was idle for {self.idle_timeout} seconds. Shutting down')
+                    break
+        finally:
+            signal.signal(signal.SIGTERM, previous_handler)
+            server.server_close()
+            with suppress(OSError):
+                os.remove(self.socket_path)
+            cli_utility.WARM_SESSIONS = None
+            logger.debug('Agent stopped')
+
+    def stop(self) -> None:
+        """Stop serving after the current request
+
+        Returns:
+            None
+        """
+        self._stopping = True
+
+    def status(self) -> dict:
+        """Get the status of the agent
+
+        Returns:
+            Agent status
+        """
+        from yojenkins.cli import cli_utility  # noqa: PLC0415
+
+        return {
+            'pid': os.getpid(),
+            'version': __version__,
+            'socket': self.socket_path,
+            'uptime': round(time() - self.started, 1),
+            'idle': round(time() - self.last_request, 1),
+            'idle_timeout': self.idle_timeout,
+            'commands': self.commands_count,
+            'sessions': len(cli_utility.WARM_SESSIONS or {}),
+        }
+
+    def handle_message(self, message: dict) -> dict:
+        """Handle one request message of a client
+
+        Args:
+            message : Request message
+
+        Returns:
+            Response message
+        """
+        message_type = message.get('type')
+        if message_type == 'status':
+            return {'status': self.status()}
+        if message_type == 'stop':
+            self.stop()
+            return {'stopping': True}
+        if message_type == 'run':
+            if message.get('version') != __version__:
+                return {'error': f'Agent version {__version__} does not match client version {message.get("version")}'}
+            self.last_request = time()
+            self.commands_count += 1
+            response = self.run_command(message['args'], message['cwd'], message['env'], message['tty'])
+            self.last_request = time()
+            return response
+        return {'error': f'Unknown request type: {message_type}'}
+
+    def run_command(self, args: list[str], cwd: str, env: dict, tty: bool) -> dict:
+        """Run a yojenkins command within the agent process, as if it was run by the client
+
+        Details: The working directory, the forwarded environment variables, and the
+                 standard input and output streams are switched to those of the client
+                 for the duration of the command. A command asking for input is stopped
+                 and handed back to the client, unless it already sent a request that may
+                 have changed the server, in which case it fails instead of running twice.
+
+        Args:
+            args : Command line arguments, without the program name
+            cwd  : Working directory of the client
+            env  : Forwarded environment variables of the client
+            tty  : If True, the output of the client is a terminal
+
+        Returns:
+            Response message with exit code and captured output, or the error if the client has to run the command
+        """
+        # NOTE: Imported when first used, since this package is imported at every command line startup
+        from yojenkins.__main__ import main  # noqa: PLC0415
+        from yojenkins.yo_jenkins.rest import Rest  # noqa: PLC0415
+
+        stdout = _CapturedOutput(tty)
+        stderr = _CapturedOutput(tty)
+        previous_changing_requests = Rest.changing_requests_sent
+
+        exit_code = 0
+        local_error = ''
+        try:
+            with _client_environment(args, cwd, env, (_NoInput(), stdout, stderr)):
+                main.main(args=args, prog_name='yojenkins', standalone_mode=True)
+        except SystemExit as exit_error:
+            if isinstance(exit_error.code, int):
+                exit_code = exit_error.code
+            elif exit_error.code is not None:
+                stderr.write(f'{exit_error.code}\n')
+                exit_code = 1
+        except AgentLocalOnly as error:
+            if Rest.changing_requests_sent == previous_changing_requests:
+                local_error = str(error)
+            else:
+                stderr.write(f'{error} after sending changes to the server. Not running it again outside the agent\n')
+                exit_code = 1
+        except Exception:
+            stderr.write(traceback.format_exc())
+            exit_code = 1
+
+        if local_error:
+            logger.debug(f'Agent handing command "{" ".join(args)}" back to the client: {local_error}')
+            return {'local': True, 'error': local_error}
+        logger.debug(f'Agent ran command "{" ".join(args)}" with exit code {exit_code}')
+        return {'exit_code': exit_code, 'stdout': stdout.getvalue(), 'stderr': stderr.getvalue()}
+
+
+@contextmanager
+def _client_environment(args: list[str], cwd: str, env: dict, streams: tuple) -> Iterator[None]:
+    """Switch to the working directory, environment variables, and standard streams of a client
+
+    Details: Everything switched, and the log levels changed by the command, are restored afterwards
+
+    Args:
+        args    : Command line arguments, without the program name
+        cwd     : Working directory of the client
+        env     : Forwarded environment variables of the client
+        streams : Standard input, output, and error streams of the command
+
+    Returns:
+        None
+    """
+    from yojenkins.cli import cli_utility  # noqa: PLC0415
+
+    previous_cwd = os.getcwd()
+    previous_env = {
+        key: value
+        for key, value in os.environ.items()
+        if key.startswith('YOJENKINS_') or key.upper() in AGENT_FORWARDED_ENV_VARS
+    }
+    previous_streams = (sys.stdin, sys.stdout, sys.stderr)
+    previous_cmd_args = cli_utility.CLI_CMD_ARGS
+    previous_log_levels = [(log_object, log_object.level) for log_object in [logger, *logger.handlers]]
+    for key in previous_env:
+        del os.environ[key]
+    os.environ.update(env)
+    cli_utility.CLI_CMD_ARGS = ' '.join(quote(arg) for arg in args)
+    # NOTE: Console log messages follow the standard error stream
+    sys.stdin, sys.stdout, sys.stderr = streams
+    try:
+        os.chdir(cwd)
+        yield
+    finally:
+        os.chdir(previous_cwd)
+        for key in env:
+            os.environ.pop(key, None)
+        os.environ.update(previous_env)
+        cli_utility.CLI_CMD_ARGS = previous_cmd_args
+        sys.stdin, sys.stdout, sys.stderr = previous_streams
+        for log_object, level in previous_log_levels:
+            log_object.setLevel(level)
@@ -0,0 +1,103 @@
+"""Agent Menu CLI Entrypoints"""
+
+import logging
+import subprocess
+import sys
+from pathlib import Path
+from time import sleep, time
+
+from yojenkins.agent import AgentClient, AgentServer
+from yojenkins.agent.agent_client import agent_supported
+from yojenkins.cli import cli_utility as cu
+from yojenkins.cli.cli_utility import log_to_history
+from yojenkins.utility.utility import am_i_bundled, fail_out, print2
+
+# Getting the logger reference
+logger = logging.getLogger()
+
+# Seconds to wait for a started agent to accept commands
+AGENT_START_TIMEOUT = 10
+
+
+@log_to_history
+def start(idle_timeout: float, session_ttl: float, foreground: bool) -> None:
+    """Start the local agent daemon, in the background unless specified
+
+    Args:
+        idle_timeout : Seconds without commands before the agent stops. 0 to never stop
+        session_ttl  : Seconds an authenticated server session is reused
+        foreground   : If True, run the agent in this process until it stops
+
+    Returns:
+        None
+    """
+    if not agent_supported():
+        fail_out('The agent requires Unix domain sockets, which are not supported on this system')
+
+    agent_status = AgentClient().status()
+    if agent_status:
+        print2(f'Agent is already running (PID: {agent_status["pid"]})', color='yellow')
+        return
+
+    if foreground:
+        print2('Agent is running. Press CTRL+C to stop', color='green')
+        try:
+            AgentServer(idle_timeout=idle_timeout, session_ttl=session_ttl).serve()
+        except OSError as error:
+            fail_out(f'Failed to start agent: {error}')
+        except KeyboardInterrupt:
+            pass
+        return
+
+    # Run the same program detached from this terminal
+    if am_i_bundled():
+        command = [sys.executable]
+    else:
+        command = [sys.executable, '-c', 'from yojenkins.__main__ import main; main()']
+    command += ['agent', 'start', '--foreground']
+    command += ['--idle-timeout', str(idle_timeout), '--session-ttl', str(session_ttl)]
+    logger.debug(f'Starting agent in background: {command}')
+    subprocess.Popen(
+        command,
+        cwd=Path.home(),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+    start_time = time()
+    while time() - start_time < AGENT_START_TIMEOUT:
+        agent_status = AgentClient().status()
+        if agent_status:
+            print2(f'Agent started (PID: {agent_status["pid"]})', color='green')
+            return
+        sleep(0.1)
+    fail_out('Failed to start agent. Run "yojenkins agent start --foreground --debug" for details')
+
+
+@log_to_history
+def stop() -> None:
+    """Stop the local agent daemon
+
+    Returns:
+        None
+    """
+    if not AgentClient().stop():
+        print2('Agent is not running', color='yellow')
+        return
+    print2('Agent stopped', color='green')
+
+
+@log_to_history
+def status(**kwargs) -> None:
+    """Output the status of the local agent daemon
+
+    Returns:
+        None
+    """
+    agent_status = AgentClient().status()
+    if not agent_status:
+        print2('Agent is not running', color='yellow')
+        sys.exit(1)
+    cu.standard_out(agent_status, **kwargs)
@@ -85,7 +85,7 @@ def verify(profile: str) -> None:
     """
     auth = Auth(Rest())
     auth.get_credentials(profile)
-    auth.create_auth()
+    auth.create_auth(use_auth_cache=False)
     click.secho('success', fg='bright_green', bold=True)
 
 
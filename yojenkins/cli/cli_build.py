@@ -2,6 +2,7 @@
 
 import logging
 import sys
+from typing import Optional
 
 import click
 
@@ -35,7 +36,9 @@ def _verify_build_url_get_job_format(build_url: str, job: str) -> bool:
 
 
 @log_to_history
-def info(profile: str, token: str, job: str, number: int, url: str, latest: bool, **kwargs) -> None:
+def info(
+    profile: str, token: str, job: str, number: int, url: str, latest: bool, *, fields: Optional[list], **kwargs
+) -> None:
     """Fetching build information
 
     Args:
@@ -45,6 +48,7 @@ def info(profile: str, token: str, job: str, number: int, url: str, latest: bool
         number:  The build number to get info on
         url:     The build url to get info on
         latest:  Option to get the latest build
+        fields:  Only get these build information fields
     """
     if url is None and job and is_complete_build_url(job):
         url, job = job, None
@@ -59,9 +63,9 @@ def info(profile: str, token: str, job: str, number: int, url: str, latest: bool
     yj_obj = cu.config_yo_jenkins(profile, token)
 
     if _verify_build_url_get_job_format(build_url=url, job=job):
-        data = yj_obj.build.info(build_url=url, job_url=job, build_number=number, latest=latest)
+        data = yj_obj.build.info(build_url=url, job_url=job, build_number=number, latest=latest, fields=fields)
     else:
-        data = yj_obj.build.info(build_url=url, job_name=job, build_number=number, latest=latest)
+        data = yj_obj.build.info(build_url=url, job_name=job, build_number=number, latest=latest, fields=fields)
     cu.standard_out(data, **kwargs)
 
 
@@ -210,6 +214,57 @@ def stages(profile: str, token: str, opt_list: bool, job: str, number: int, url:
     cu.standard_out(data, **kwargs)
 
 
+@log_to_history
+def artifacts(
+    profile: str,
+    token: str,
+    *,
+    opt_list: bool,
+    job: str,
+    number: int,
+    url: str,
+    latest: bool,
+    download_dir: str,
+    **kwargs,
+) -> None:
+    """List or download build artifacts
+
+    Args:
+        profile: The profile/account to use
+        token:   API Token for Jenkins server
+        opt_list: Option to list only the artifact paths
+        job: The job this build is under
+        number: The build number
+        url: The build URL
+        latest: Option to use the latest build
+        download_dir: Option to download all artifacts to a directory
+    """
+    if url is None and job and is_complete_build_url(job):
+        url, job = job, None
+    elif job and not number and not latest:
+        click.echo(
+            click.style(
+                'INPUT ERROR: For job, either specify --number or --latest. See --help', fg='bright_red', bold=True
+            )
+        )
+        sys.exit(1)
+
+    yj_obj = cu.config_yo_jenkins(profile, token)
+
+    job_kwargs = {'job_url': job} if _verify_build_url_get_job_format(build_url=url, job=job) else {'job_name': job}
+    if download_dir:
+        yj_obj.build.artifact_download(
+            build_url=url, build_number=number, latest=latest, download_dir=download_dir, **job_kwargs
+        )
+        click.secho('success', fg='bright_green', bold=True)
+        return
+
+    data = yj_obj.build.artifact_list(build_url=url, build_number=number, latest=latest, **job_kwargs)
+    if opt_list:
+        data = [artifact['relativePath'] for artifact in data]
+    cu.standard_out(data, **kwargs)
+
+
 @log_to_history
 def logs(
     profile: str,
@@ -221,6 +276,11 @@ def logs(
     tail: float,
     download_dir: str,
     follow: bool,
+    *,
+    grep: str,
+    last: int,
+    ignore_case: bool,
+    search_jobs: bool,
 ) -> None:
     """Get build logs
 
@@ -234,10 +294,26 @@ def logs(
         tail: Option to get the last N lines of the log
         download_dir: Option to download the log to a directory
         follow: Option to follow the log
+        grep: Option to only output log lines matching a REGEX pattern
+        last: Option to search the logs of the last N builds of the job
+        ignore_case: Option to match the grep pattern regardless of case
+        search_jobs: Option to search the logs of all jobs matching the job REGEX pattern
     """
+    if (last or search_jobs) and not grep:
+        click.echo(click.style('INPUT ERROR: --last and --search-jobs require --grep', fg='bright_red', bold=True))
+        sys.exit(1)
+    if grep and (tail or follow or download_dir):
+        click.echo(
+            click.style(
+                'INPUT ERROR: --grep cannot be used with --tail, --follow, or --download-dir',
+                fg='bright_red',
+                bold=True,
+            )
+        )
+        sys.exit(1)
     if url is None and job and is_complete_build_url(job):
         url, job = job, None
-    elif job and not number and not latest:
+    elif job and not number and not latest and not grep:
         click.echo(
             click.style(
                 'INPUT ERROR: For job, either specify --number or --latest. See --help', fg='bright_red', bold=True
@@ -247,6 +323,20 @@ def logs(
 
     yj_obj = cu.config_yo_jenkins(profile, token)
 
+    if grep:
+        _logs_grep(
+            yj_obj,
+            job=job,
+            number=number,
+            url=url,
+            latest=latest,
+            grep=grep,
+            last=last,
+            ignore_case=ignore_case,
+            search_jobs=search_jobs,
+        )
+        return
+
     if _verify_build_url_get_job_format(build_url=url, job=job):
         yj_obj.build.logs(
             build_url=url,
@@ -271,6 +361,62 @@ def logs(
         click.secho('success', fg='bright_green', bold=True)
 
 
+def _logs_grep(
+    yj_obj,
+    *,
+    job: str,
+    number: int,
+    url: str,
+    latest: bool,
+    grep: str,
+    last: int,
+    ignore_case: bool,
+    search_jobs: bool,
+) -> None:
+    """Output the build log lines matching a REGEX pattern like grep, exiting with 1 if none matched
+
+    Args:
+        yj_obj: The YoJenkins object
+        job: The job this build is under, or the job REGEX pattern with search_jobs
+        number: The build number to search
+        url: The build url to search
+        latest: Option to search the latest build
+        grep: REGEX pattern to match log lines
+        last: Option to search the logs of the last N builds of the job
+        ignore_case: Option to match the pattern regardless of case
+        search_jobs: Option to search the logs of all jobs matching the job REGEX pattern
+    """
+    if search_jobs or not (url or number or latest) or last:
+        if search_jobs:
+            job_kwargs = {'job_search_pattern': job}
+        elif _verify_build_url_get_job_format(build_url=url, job=job):
+            job_kwargs = {'job_url': job}
+        else:
+            job_kwargs = {'job_name': job}
+        matches = yj_obj.job.build_logs_grep(grep, last=last or 1, ignore_case=ignore_case, **job_kwargs)
+    else:
+        if _verify_build_url_get_job_format(build_url=url, job=job):
+            build_info = yj_obj.build.info(
+                build_url=url, job_url=job, build_number=number, latest=latest, fields=['url']
+            )
+        else:
+            build_info = yj_obj.build.info(
+                build_url=url, job_name=job, build_number=number, latest=latest, fields=['url']
+            )
+        matches = yj_obj.build.logs_grep([build_info['url']], grep, ignore_case=ignore_case)
+
+    # Output matching lines like grep, with build URL and line number
+    found = False
+    for match in matches:
+        found = True
+        click.echo(
+            f'{click.style(match["url"], fg="magenta")}:{click.style(str(match["line_number"]), fg="green")}:'
+            f'{match["line"]}'
+        )
+    if not found:
+        sys.exit(1)
+
+
 @log_to_history
 def browser(profile: str, token: str, job: str, number: int, url: str, latest: bool) -> None:
     """Open build in web browser
@@ -5,6 +5,8 @@ from typing import Callable
 
 import click
 
+from yojenkins.cli.cli_utility import trace_requests
+
 
 def format_output(decorated_function: Callable) -> Callable:
     """click module options for formatting the output
@@ -84,8 +86,37 @@ def profile(decorated_function: Callable) -> Callable:
         envvar='YOJENKINS_TOKEN',
         help='Authentication API token to use',
     )
+    @click.option(
+        '--no-cache',
+        type=bool,
+        default=False,
+        required=False,
+        is_flag=True,
+        envvar='YOJENKINS_NO_CACHE',
+        help='Do not use or update the local server response cache and log store',
+    )
+    @click.option(
+        '--trace',
+        type=click.Path(dir_okay=False, writable=True),
+        required=False,
+        envvar='YOJENKINS_TRACE',
+        help='Record the timing of every server request to this file and print a summary',
+    )
+    @click.option(
+        '--trace-format',
+        type=click.Choice(['json', 'chrome'], case_sensitive=False),
+        default='json',
+        show_default=True,
+        required=False,
+        help='Format of the --trace file. "chrome" can be opened with chrome://tracing or Perfetto',
+    )
     @functools.wraps(decorated_function)
     def wrapper(*args, **kwargs):
+        # Passed on to the server connection setup through the click context
+        click.get_current_context().meta['yojenkins.no_cache'] = kwargs.pop('no_cache')
+        trace_file, trace_format = kwargs.pop('trace'), kwargs.pop('trace_format')
+        if trace_file:
+            trace_requests(trace_file, trace_format)
         return decorated_function(*args, **kwargs)
 
     return wrapper
@@ -109,3 +140,60 @@ def list(decorated_function: Callable) -> Callable:
         return decorated_function(*args, **kwargs)
 
     return wrapper
+
+
+def fields(decorated_function: Callable) -> Callable:
+    """click module options for only getting specific fields of the item information
+
+    Details: This function is a convenience function to use to add click options
+
+    Args:
+        decorated_function : Function that is decorated
+
+    Returns:
+        Decorated function
+    """
+
+    def split_fields(ctx, param, value):
+        return [field.strip() for field in value.split(',') if field.strip()] if value else None
+
+    @click.option(
+        '--fields',
+        type=str,
+        default=None,
+        required=False,
+        callback=split_fields,
+        help='Only get these comma separated fields, nested with a dot (ie. "fullName,lastBuild.number")',
+    )
+    @functools.wraps(decorated_function)
+    def wrapper(*args, **kwargs):
+        return decorated_function(*args, **kwargs)
+
+    return wrapper
+
+
+def ndjson(decorated_function: Callable) -> Callable:
+    """click module options for outputting each item as soon as it is received
+
+    Details: This function is a convenience function to use to add click options
+
+    Args:
+        decorated_function : Function that is decorated
+
+    Returns:
+        Decorated function
+    """
+
+    @click.option(
+        '--ndjson',
+        type=bool,
+        default=False,
+        required=False,
+        is_flag=True,
+        help='Output each item as soon as it is received, one JSON per line',
+    )
+    @functools.wraps(decorated_function)
+    def wrapper(*args, **kwargs):
+        return decorated_function(*args, **kwargs)
+
+    return wrapper
@@ -3,6 +3,7 @@
 import json
 import logging
 import sys
+from typing import Optional
 
 import click
 import xmltodict
@@ -16,7 +17,7 @@ logger = logging.getLogger()
 
 
 @log_to_history
-def info(profile: str, token: str, job: str, **kwargs) -> None:
+def info(profile: str, token: str, job: str, fields: Optional[list], **kwargs) -> None:
     """TODO Docstring
 
     Args:
@@ -24,9 +25,9 @@ def info(profile: str, token: str, job: str, **kwargs) -> None:
     """
     yj_obj = cu.config_yo_jenkins(profile, token)
     if cu.is_full_url(job):
-        data = yj_obj.job.info(job_url=job)
+        data = yj_obj.job.info(job_url=job, fields=fields)
     else:
-        data = yj_obj.job.info(job_name=job)
+        data = yj_obj.job.info(job_name=job, fields=fields)
     cu.standard_out(data, **kwargs)
 
 
@@ -38,6 +39,9 @@ def search(
     search_folder: str,
     depth: int,
     fullname: bool,
+    *,
+    refresh: bool,
+    ndjson: bool,
     opt_list: bool,
     **kwargs,
 ) -> None:
@@ -47,13 +51,30 @@ def search(
         TODO
     """
     yj_obj = cu.config_yo_jenkins(profile, token)
+    if ndjson:
+        folder = {'folder_url': search_folder} if cu.is_full_url(search_folder) else {'folder_name': search_folder}
+        items = yj_obj.job.search_iter(
+            search_pattern=search_pattern, folder_depth=depth, fullname=fullname, refresh=refresh, **folder
+        )
+        if not cu.standard_out_stream(item['url'] if opt_list else item for item in items):
+            print2('No jobs found', color='yellow')
+            sys.exit(1)
+        return
     if cu.is_full_url(search_folder):
         data, data_list = yj_obj.job.search(
-            search_pattern=search_pattern, folder_url=search_folder, folder_depth=depth, fullname=fullname
+            search_pattern=search_pattern,
+            folder_url=search_folder,
+            folder_depth=depth,
+            fullname=fullname,
+            refresh=refresh,
         )
     else:
         data, data_list = yj_obj.job.search(
-            search_pattern=search_pattern, folder_name=search_folder, folder_depth=depth, fullname=fullname
+            search_pattern=search_pattern,
+            folder_name=search_folder,
+            folder_depth=depth,
+            fullname=fullname,
+            refresh=refresh,
         )
     if not data:
         print2('No folders found', color='yellow')
@@ -63,7 +84,7 @@ def search(
 
 
 @log_to_history
-def build_list(profile: str, token: str, opt_list: bool, job: str, **kwargs) -> None:
+def build_list(profile: str, token: str, opt_list: bool, job: str, details: bool, **kwargs) -> None:
     """TODO Docstring
 
     Args:
@@ -71,9 +92,9 @@ def build_list(profile: str, token: str, opt_list: bool, job: str, **kwargs) ->
     """
     yj_obj = cu.config_yo_jenkins(profile, token)
     if cu.is_full_url(job):
-        data, data_list = yj_obj.job.build_list(job_url=job)
+        data, data_list = yj_obj.job.build_list(job_url=job, details=details)
     else:
-        data, data_list = yj_obj.job.build_list(job_name=job)
+        data, data_list = yj_obj.job.build_list(job_name=job, details=details)
     data = data_list if opt_list else data
     cu.standard_out(data, **kwargs)
 
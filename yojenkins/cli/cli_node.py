@@ -2,6 +2,7 @@
 
 import json
 import logging
+from typing import Optional
 
 import click
 import xmltodict
@@ -14,7 +15,7 @@ logger = logging.getLogger()
 
 
 @log_to_history
-def info(profile: str, token: str, name: str, depth: int, **kwargs) -> None:
+def info(profile: str, token: str, name: str, depth: int, fields: Optional[list], **kwargs) -> None:
     """TODO Docstring
 
     Details: TODO
@@ -23,12 +24,14 @@ def info(profile: str, token: str, name: str, depth: int, **kwargs) -> None:
         TODO
     """
     yj_obj = cu.config_yo_jenkins(profile, token)
-    data = yj_obj.node.info(name, depth)
+    data = yj_obj.node.info(name, depth, fields)
     cu.standard_out(data, **kwargs)
 
 
 @log_to_history
-def list(profile: str, token: str, opt_list: bool, depth: int, **kwargs) -> None:
+def list(
+    profile: str, token: str, opt_list: bool, depth: int, *, fields: Optional[list], ndjson: bool, **kwargs
+) -> None:
     """TODO Docstring
 
     Details: TODO
@@ -37,7 +40,14 @@ def list(profile: str, token: str, opt_list: bool, depth: int, **kwargs) -> None
         TODO
     """
     yj_obj = cu.config_yo_jenkins(profile, token)
-    data, data_list = yj_obj.node.list(depth)
+    if opt_list and fields is None:
+        # Only the node names are listed
+        fields = []
+    if ndjson:
+        nodes = yj_obj.node.list_iter(depth, fields)
+        cu.standard_out_stream(node['displayName'] if opt_list else node for node in nodes)
+        return
+    data, data_list = yj_obj.node.list(depth, fields)
     data = data_list if opt_list else data
     cu.standard_out(data, **kwargs)
 
@@ -4,6 +4,7 @@ import json
 import logging
 import os
 from pathlib import Path
+from typing import Optional
 
 import click
 from yaspin import yaspin
@@ -11,7 +12,6 @@ from yaspin.spinners import Spinners
 
 from yojenkins.cli import cli_utility as cu
 from yojenkins.cli.cli_utility import log_to_history
-from yojenkins.docker_container import DockerJenkinsServer
 from yojenkins.utility.utility import fail_out, failures_out, print2
 from yojenkins.yo_jenkins import Auth, YoJenkins
 
@@ -33,7 +33,7 @@ def info(profile: str, token: str, **kwargs) -> None:
 
 
 @log_to_history
-def people(profile: str, token: str, opt_list: bool, **kwargs) -> None:
+def people(profile: str, token: str, opt_list: bool, ndjson: bool, **kwargs) -> None:
     """TODO Docstring
 
     Details: TODO
@@ -41,6 +41,10 @@ def people(profile: str, token: str, opt_list: bool, **kwargs) -> None:
     Args:
         TODO
     """
+    if ndjson:
+        people = cu.config_yo_jenkins(profile, token).server.people_iter()
+        cu.standard_out_stream(person['user']['fullName'] if opt_list else person for person in people)
+        return
     data, data_list = cu.config_yo_jenkins(profile, token).server.people()
     data = data_list if opt_list else data
     cu.standard_out(data, **kwargs)
@@ -64,7 +68,7 @@ def queue(profile: str, token: str, opt_list: bool, **kwargs) -> None:
 
 
 @log_to_history
-def plugins(profile: str, token: str, opt_list: bool, **kwargs) -> None:
+def plugins(profile: str, token: str, opt_list: bool, fields: Optional[list], ndjson: bool, **kwargs) -> None:
     """TODO Docstring
 
     Details: TODO
@@ -72,7 +76,16 @@ def plugins(profile: str, token: str, opt_list: bool, **kwargs) -> None:
     Args:
         TODO
     """
-    data, data_list = cu.config_yo_jenkins(profile, token).server.plugin_list()
+    if opt_list and fields is None:
+        # Only the fields for the plugin list are needed
+        fields = []
+    if ndjson:
+        plugins = cu.config_yo_jenkins(profile, token).server.plugin_list_iter(fields)
+        cu.standard_out_stream(
+            f'{p["longName"]} - {p["shortName"]} - {p["version"]}' if opt_list else p for p in plugins
+        )
+        return
+    data, data_list = cu.config_yo_jenkins(profile, token).server.plugin_list(fields)
     data = data_list if opt_list else data
     cu.standard_out(data, **kwargs)
 
@@ -181,6 +194,9 @@ def server_deploy(
     # TODO: Check if the docker server deployment file is there. If so, show that it is being renewed.
 
     # Creat object
+    # NOTE: Imported here, the Docker library is only needed for server deployment
+    from yojenkins.docker_container import DockerJenkinsServer  # noqa: PLC0415
+
     djs = DockerJenkinsServer(
         config_file=config_file,
         plugins_file=plugins_file,
@@ -272,6 +288,9 @@ def server_teardown(remove_volume: bool, remove_image: bool) -> None:
     volumes_named_only = [next(iter(vol.values())) for vol in deployed['volumes'] if 'named' in vol]
 
     # Create object
+    # NOTE: Imported here, the Docker library is only needed for server deployment
+    from yojenkins.docker_container import DockerJenkinsServer  # noqa: PLC0415
+
     djs = DockerJenkinsServer(
         image_fullname=deployed['image'], new_volume_name=volumes_named_only[0], container_name=deployed['container']
     )
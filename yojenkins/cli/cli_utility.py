@@ -9,18 +9,22 @@ from datetime import datetime
 from inspect import getfullargspec
 from pathlib import Path
 from shlex import quote
-from typing import Callable, Union
+from time import time
+from collections.abc import Callable, Iterable
+from typing import Optional, Union
 
 import click
 import toml
 import yaml
-from json2xml import json2xml
-from json2xml.utils import readfromstring
 from urllib3.util import parse_url
 
 from yojenkins import __version__
-from yojenkins.yo_jenkins.auth import Auth
+from yojenkins.agent.agent_client import AgentLocalOnly, agent_environment
+from yojenkins.yo_jenkins.auth import CREDS_FILE_NAME, Auth
+from yojenkins.yo_jenkins.log_store import LogStore
 from yojenkins.yo_jenkins.rest import Rest
+from yojenkins.yo_jenkins.rest_cache import RestCache
+from yojenkins.yo_jenkins.rest_trace import RequestTracer
 from yojenkins.yo_jenkins.yojenkins import YoJenkins
 from yojenkins.utility.utility import (
     am_i_bundled,
@@ -42,6 +46,10 @@ MAX_PROFILE_HISTORY_LENGTH = 1000
 CLI_CMD_PATH = sys.argv[0]
 CLI_CMD_ARGS = ' '.join([quote(arg) for arg in sys.argv[1:]])
 
+# Authenticated server sessions reused across commands when running inside the agent daemon
+WARM_SESSIONS: Optional[dict] = None
+WARM_SESSION_TTL = 900
+
 
 def set_debug_log_level(debug_flag: bool) -> None:
     """Setting the log DEBUG level
@@ -100,19 +108,64 @@ def config_yo_jenkins(profile: str, token: str) -> YoJenkins:
     Returns:
         Initialized YoJenkins object
     """
-    auth = Auth(Rest())
+    # Check if the response cache was disabled with --no-cache
+    context = click.get_current_context(silent=True)
+    no_cache = context.meta.get('yojenkins.no_cache', False) if context else False
+    if no_cache:
+        logger.debug('Server response cache disabled')
+
+    # Reuse an authenticated session of a previous command within the agent daemon
+    session_key = None
+    if WARM_SESSIONS is not None:
+        session_key = warm_session_key(profile, token, no_cache)
+        created, yj_obj = WARM_SESSIONS.get(session_key, (0, None))
+        if yj_obj and time() - created < WARM_SESSION_TTL:
+            logger.debug(f'Reusing warm server session created {time() - created:.0f} seconds ago')
+            return yj_obj
+
+    auth = Auth(Rest(cache=None if no_cache else RestCache(), log_store=None if no_cache else LogStore()))
 
     # Get the credential profile
     if not auth.get_credentials(profile):
         click.secho('Failed to find any credentials', fg='bright_red', bold=True)
         sys.exit(1)
 
+    # The agent daemon cannot ask for a password. The client asks for it instead
+    if WARM_SESSIONS is not None and not auth.jenkins_profile.get('api_token'):
+        raise AgentLocalOnly('Profile does not contain an API token')
+
     # Create authentication
     if not auth.create_auth(token=token):
         click.secho('Failed authentication', fg='bright_red', bold=True)
         sys.exit(1)
 
-    return YoJenkins(auth)
+    yj_obj = YoJenkins(auth)
+    if session_key:
+        WARM_SESSIONS[session_key] = (time(), yj_obj)
+    return yj_obj
+
+
+def warm_session_key(profile: str, token: str, no_cache: bool) -> tuple:
+    """Get the key identifying an authenticated session kept by the agent daemon
+
+    Details: The key changes with anything that could select different credentials or connections,
+             including the forwarded environment variables and the credentials file
+
+    Args:
+        profile  : Name of the yojenkins authentication profile
+        token    : API token to override profile value
+        no_cache : If True, the server response cache is disabled
+
+    Returns:
+        Session key
+    """
+    credentials_file_path = os.path.join(Path.home(), CONFIG_DIR_NAME, CREDS_FILE_NAME)
+    try:
+        credentials_modified = os.path.getmtime(credentials_file_path)
+    except OSError:
+        credentials_modified = None
+    environment = tuple(sorted(agent_environment().items()))
+    return (profile, token, no_cache, environment, credentials_modified)
 
 
 def standard_out(
@@ -125,6 +178,8 @@ def standard_out(
     """Outputting the resulting data to the console.
     This funciton handles a variety of output formats.
 
+    Details: The output format libraries are only imported when their format is requested
+
     Args:
         TODO
     """
@@ -138,6 +193,10 @@ def standard_out(
     if opt_xml:
         logger.debug('Outputting XML format ...')
         if isinstance(data, dict) or isinstance(data, list):
+            # NOTE: Imported here, only needed for XML output
+            from json2xml import json2xml  # noqa: PLC0415
+            from json2xml.utils import readfromstring  # noqa: PLC0415
+
             data = readfromstring(json.dumps(data))
             data_xml = json2xml.Json2xml(data, pretty=opt_pretty, wrapper=None, attr_type=False).to_xml()
             if opt_pretty:
@@ -167,6 +226,49 @@ def standard_out(
             print2(json.dumps(data))
 
 
+def standard_out_stream(data: Iterable) -> int:
+    """Outputting each item of the data to the console as soon as it is available,
+    one JSON document per line (NDJSON)
+
+    Args:
+        data : Iterable of items to output
+
+    Returns:
+        Number of items output
+    """
+    logger.debug('Outputting NDJSON format ...')
+    number_of_items = 0
+    for item in data:
+        click.echo(json.dumps(item))
+        sys.stdout.flush()
+        number_of_items += 1
+    return number_of_items
+
+
+def trace_requests(trace_file: str, trace_format: str = 'json') -> None:
+    """Record every server request of the running command, writing the trace file
+    and printing a per-endpoint timing summary when the command finishes
+
+    Args:
+        trace_file   : File path to write the trace to
+        trace_format : `json` for all requests and the summary, `chrome` for Chrome trace events
+
+    Returns:
+        None
+    """
+    tracer = RequestTracer()
+    RequestTracer.active = tracer
+    logger.debug(f'Tracing server requests to "{trace_file}" ({trace_format} format) ...')
+
+    def finish_trace() -> None:
+        RequestTracer.active = None
+        if not tracer.dump(trace_file, trace_format.lower()):
+            click.secho(f'Failed to write request trace file "{trace_file}"', fg='bright_red', bold=True, err=True)
+        click.echo(tracer.summary_text(), err=True)
+
+    click.get_current_context().call_on_close(finish_trace)
+
+
 def is_full_url(url: str) -> bool:
     """Check if the provided url is a full and valide URL
 
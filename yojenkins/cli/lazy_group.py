@@ -0,0 +1,53 @@
+"""Lazily loaded click command groups"""
+
+import importlib
+
+import click
+from click_help_colors import HelpColorsGroup
+
+
+class LazyGroupMixin:
+    """Command group importing the module defining its sub-commands only when they are needed
+
+    Details: The sub-command module registers its commands on the group when imported.
+             It is imported the first time a sub-command is looked up or listed, so only
+             the invoked group pays for the imports of its sub-commands.
+    """
+
+    def __init__(self, *args, lazy_module: str = '', **kwargs) -> None:
+        """Object constructor method, called at object creation
+
+        Args:
+            lazy_module : Full name of the module defining the sub-commands
+
+        Returns:
+            None
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_module = lazy_module
+
+    def _load_commands(self) -> None:
+        """Import the sub-command module, once
+
+        Returns:
+            None
+        """
+        if self.lazy_module:
+            module_name, self.lazy_module = self.lazy_module, ''
+            importlib.import_module(module_name)
+
+    def get_command(self, ctx: click.Context, cmd_name: str):
+        self._load_commands()
+        return super().get_command(ctx, cmd_name)
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        self._load_commands()
+        return super().list_commands(ctx)
+
+
+class LazyGroup(LazyGroupMixin, click.Group):
+    """Lazily loaded command group"""
+
+
+class LazyHelpColorsGroup(LazyGroupMixin, HelpColorsGroup):
+    """Lazily loaded command group with colored help"""
@@ -0,0 +1,68 @@
+"""Agent click sub-command"""
+# pylint: skip-file
+
+import click
+
+from yojenkins.__main__ import agent
+from yojenkins.agent.agent_server import DEFAULT_AGENT_IDLE_TIMEOUT, DEFAULT_AGENT_SESSION_TTL
+from yojenkins.cli import cli_agent, cli_decorators
+from yojenkins.cli.cli_utility import set_debug_log_level
+from yojenkins.utility.utility import translate_kwargs
+
+
+@agent.command(short_help='\tStart the local agent daemon')
+@cli_decorators.debug
+@click.option(
+    '--idle-timeout',
+    type=float,
+    default=DEFAULT_AGENT_IDLE_TIMEOUT,
+    show_default=True,
+    required=False,
+    help='Seconds without commands before the agent stops. 0 to never stop',
+)
+@click.option(
+    '--session-ttl',
+    type=float,
+    default=DEFAULT_AGENT_SESSION_TTL,
+    show_default=True,
+    required=False,
+    help='Seconds an authenticated server session is reused',
+)
+@click.option(
+    '--foreground', type=bool, default=False, required=False, is_flag=True, help='Run the agent in this terminal'
+)
+def start(debug, **kwargs):
+    """Start the local agent daemon
+
+    The agent keeps authenticated server sessions, connection pools, the response
+    cache, and the item index warm. While it is running, yojenkins commands are
+    run by the agent, avoiding the startup and authentication on every command.
+    Interactive commands and commands following output are always run locally.
+
+    To not use a running agent, set the YOJENKINS_NO_AGENT environment variable.
+
+    EXAMPLES:
+
+    \b
+      - yojenkins agent start
+      - yojenkins agent start --idle-timeout 600
+    """
+    set_debug_log_level(debug)
+    cli_agent.start(**translate_kwargs(kwargs))
+
+
+@agent.command(short_help='\tStop the local agent daemon')
+@cli_decorators.debug
+def stop(debug):
+    """Stop the local agent daemon"""
+    set_debug_log_level(debug)
+    cli_agent.stop()
+
+
+@agent.command(short_help='\tShow the local agent daemon status')
+@cli_decorators.debug
+@cli_decorators.format_output
+def status(debug, **kwargs):
+    """Show the local agent daemon status"""
+    set_debug_log_level(debug)
+    cli_agent.status(**translate_kwargs(kwargs))
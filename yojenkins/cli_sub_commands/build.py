@@ -17,6 +17,7 @@ from yojenkins.utility.utility import translate_kwargs
 @click.option('-n', '--number', type=int, required=False, help='Build number')
 @click.option('-u', '--url', type=str, required=False, help='Flexible build URL (No job info needed)')
 @click.option('--latest', type=bool, required=False, is_flag=True, help='Latest build (Replaces --number)')
+@cli_decorators.fields
 @click.pass_context
 def info(ctx, debug, **kwargs):
     """Build information"""
@@ -123,10 +124,23 @@ def stages(ctx, debug, **kwargs):
     is_flag=True,
     help='Follow/Stream the logs as they are generated',
 )
+@click.option('--grep', type=str, required=False, help='Only output log lines matching REGEX pattern')
+@click.option('--last', type=int, required=False, help='With --grep, search the last N builds of the job')
+@click.option('--ignore-case', type=bool, required=False, is_flag=True, help='With --grep, ignore case')
+@click.option(
+    '--search-jobs',
+    type=bool,
+    required=False,
+    is_flag=True,
+    help='With --grep, search all jobs matching JOB as a REGEX pattern',
+)
 @click.pass_context
 def logs(ctx, debug, **kwargs):
     """Get build logs
 
+    With --grep, the logs of multiple builds are searched at the same time, and each
+    matching line is output with its build URL and line number.
+
     EXAMPLES:
 
     \b
@@ -135,6 +149,8 @@ def logs(ctx, debug, **kwargs):
     - yojenkins build logs "myFolder/myJob" --latest --tail 0.1
     - yojenkins build logs "myFolder/myJob" --number 2 --follow
     - yojenkins build logs "myFolder/myJob" --latest -dd .
+    - yojenkins build logs "myFolder/myJob" --grep "ERROR|FAILED" --last 20
+    - yojenkins build logs "myFolder/.*" --search-jobs --grep "OutOfMemory" --last 5
 
     """
     set_debug_log_level(debug)
@@ -144,6 +160,44 @@ def logs(ctx, debug, **kwargs):
         click.echo(ctx.get_help())
 
 
+@build.command(short_help='\tList or download build artifacts')
+@cli_decorators.debug
+@cli_decorators.format_output
+@cli_decorators.profile
+@cli_decorators.list
+@click.argument('job', nargs=1, type=str, required=False)
+@click.option('-n', '--number', type=int, required=False, help='Build number')
+@click.option('-u', '--url', type=str, required=False, help='Flexible build URL (No job info needed)')
+@click.option('--latest', type=str, required=False, is_flag=True, help='Latest build (Replaces --number)')
+@click.option(
+    '-dd',
+    '--download-dir',
+    type=click.Path(file_okay=False, dir_okay=True),
+    required=False,
+    is_flag=False,
+    help='Download all artifacts to directory',
+)
+@click.pass_context
+def artifacts(ctx, debug, **kwargs):
+    """List or download build artifacts
+
+    Artifacts are downloaded at the same time, large ones in parts.
+    Interrupted downloads continue where they stopped when run again.
+
+    EXAMPLES:
+
+    \b
+    - yojenkins build artifacts "myFolder/myJob" --latest --list
+    - yojenkins build artifacts "myFolder/myJob" --number 2 -dd ./artifacts
+
+    """
+    set_debug_log_level(debug)
+    if kwargs.get('job') or kwargs.get('url'):
+        cli_build.artifacts(**translate_kwargs(kwargs))
+    else:
+        click.echo(ctx.get_help())
+
+
 @build.command(short_help='\tOpen build in web browser')
 @cli_decorators.debug
 @cli_decorators.profile
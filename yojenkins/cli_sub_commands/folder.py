@@ -14,6 +14,7 @@ from yojenkins.utility.utility import translate_kwargs
 @cli_decorators.format_output
 @cli_decorators.profile
 @click.argument('folder', nargs=1, type=str, required=True)
+@cli_decorators.fields
 def info(debug, **kwargs):
     """Folder information"""
     set_debug_log_level(debug)
@@ -30,6 +31,17 @@ def info(debug, **kwargs):
 @click.option(
     '-fn', '--fullname', type=bool, default=False, required=False, is_flag=True, help='Search entire folder path name'
 )
+@click.option(
+    '--refresh', type=bool, default=False, required=False, is_flag=True, help='Refresh the local item index first'
+)
+@click.option(
+    '--ndjson',
+    type=bool,
+    default=False,
+    required=False,
+    is_flag=True,
+    help='Output each match as soon as it is found, one JSON per line',
+)
 @cli_decorators.list
 def search(debug, **kwargs):
     """Search folders by REGEX pattern"""
@@ -14,6 +14,7 @@ from yojenkins.utility.utility import translate_kwargs
 @cli_decorators.format_output
 @cli_decorators.profile
 @click.argument('job', nargs=1, type=str, required=True)
+@cli_decorators.fields
 def info(debug, **kwargs):
     """Job information"""
     set_debug_log_level(debug)
@@ -30,6 +31,17 @@ def info(debug, **kwargs):
 @click.option(
     '-fn', '--fullname', type=bool, default=False, required=False, is_flag=True, help='Search entire job path name'
 )
+@click.option(
+    '--refresh', type=bool, default=False, required=False, is_flag=True, help='Refresh the local item index first'
+)
+@click.option(
+    '--ndjson',
+    type=bool,
+    default=False,
+    required=False,
+    is_flag=True,
+    help='Output each match as soon as it is found, one JSON per line',
+)
 @cli_decorators.list
 def search(debug, **kwargs):
     """Search jobs by REGEX pattern"""
@@ -42,6 +54,9 @@ def search(debug, **kwargs):
 @cli_decorators.format_output
 @cli_decorators.profile
 @click.argument('job', nargs=1, type=str, required=True)
+@click.option(
+    '--details', type=bool, default=False, required=False, is_flag=True, help='Get full information for each build'
+)
 @cli_decorators.list
 def list(debug, **kwargs):
     """List all builds for job"""
@@ -15,6 +15,7 @@ from yojenkins.utility.utility import translate_kwargs
 @cli_decorators.profile
 @click.argument('name', nargs=1, type=str, required=True)
 @click.option('-d', '--depth', type=int, default=0, required=False, help='Search depth from root directory')
+@cli_decorators.fields
 def info(debug, **kwargs):
     """Node information"""
     set_debug_log_level(debug)
@@ -37,6 +38,8 @@ def status(debug, **kwargs):
 @cli_decorators.format_output
 @cli_decorators.list
 @click.option('-d', '--depth', type=int, default=0, required=False, help='Search depth from root directory')
+@cli_decorators.fields
+@cli_decorators.ndjson
 def list(debug, **kwargs):
     """List all nodes"""
     set_debug_log_level(debug)
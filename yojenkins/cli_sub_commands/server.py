@@ -26,6 +26,7 @@ def info(debug, **kwargs):
 @cli_decorators.format_output
 @cli_decorators.profile
 @cli_decorators.list
+@cli_decorators.ndjson
 #  def people(debug, pretty, yaml, xml, toml, profile, list):
 def people(debug, **kwargs):
     """Show all people/users on server"""
@@ -52,6 +53,8 @@ def queue(debug, **kwargs):
 @cli_decorators.format_output
 @cli_decorators.profile
 @cli_decorators.list
+@cli_decorators.fields
+@cli_decorators.ndjson
 def plugins(debug, **kwargs):
     """Show plugin information"""
     set_debug_log_level(debug)
@@ -566,6 +566,11 @@ class BuildMonitor(Monitor):
         self.all_threads_enabled = True
         self.build_stages_thread_interval = monitor_interval
 
+        # Stages are only available with the Pipeline REST API plugin
+        if self.rest.capabilities.get('workflow_api') is False:
+            logger.debug('Server does not have the Pipeline REST API plugin (wfapi). Not polling build stages')
+            return
+
         # Check if this is a staged build
         logger.debug('Checking if build is a staged build ...')
         request_url = f'{build_url.strip("/")}/wfapi/describe'
@@ -191,8 +191,13 @@ class JobMonitor(Monitor):
 
                 # Loop through all listed builds
                 for _i, build in enumerate(self.builds_data):
-                    if not build:
+                    if build is None:
                         break
+                    if not build:
+                        # Failed to get this build, keep drawing the others
+                        mu.draw_text(scr, '(No build data)', y_row, x_col[0], color=self.color['grey-dark'])
+                        y_row += 1
+                        continue
 
                     # Build name
                     line = build['displayName'] if 'displayName' in build else build['number']
@@ -395,7 +400,7 @@ class JobMonitor(Monitor):
             if not self.paused:
                 self.server_interaction = True
                 with self._job_info_thread_lock:
-                    self.job_info_data = self.job.info(job_url=job_url)
+                    self.job_info_data = self.job.info(job_url=job_url, fields=['url', 'displayName', 'builds.url'])
 
             # Wait some time before checking again
             start_time = time()
@@ -436,22 +441,6 @@ class JobMonitor(Monitor):
 
     ############################  BUILDS INFO  ################################
 
-    def __thread_build_info(self, build_url: str, build_data_index: int) -> None:
-        """
-        Independent thread which fetches build information
-
-        Args:
-            build_url: Server URL of the build
-            build_data_index: Build index within the job info return
-
-        Returns:
-            None
-        """
-        logger.debug(f'Thread starting - Build info (INDEX: {build_data_index}, ID: {threading.get_ident()}) ...')
-        self.server_interaction = True
-        self.builds_data[build_data_index] = self.build.info(build_url=build_url)
-        logger.debug(f'Thread stopped - Build info (INDEX: {build_data_index}, ID: {threading.get_ident()})')
-
     def __thread_builds_data(self, monitor_interval: float) -> None:
         """
         Independent thread which polls the build data for each build listed in job
@@ -483,31 +472,17 @@ class JobMonitor(Monitor):
         while self.all_threads_enabled:
             if not self.paused:
                 if 'builds' in self.job_info_data:
-                    # Get and store the data in each thread
-                    threads = []
+                    # Get and store the data for all builds at once
+                    build_urls = [
+                        build['url'] for build in self.job_info_data['builds'][: self.builds_data_number_of_builds]
+                    ]
                     try:
-                        for build_data_index, build in enumerate(
-                            self.job_info_data['builds'][: self.builds_data_number_of_builds]
-                        ):
-                            # build_data_index += 1
-                            thread = threading.Thread(
-                                target=self.__thread_build_info,
-                                args=(
-                                    build['url'],
-                                    build_data_index,
-                                ),
-                                daemon=False,
-                            )
-                            thread.start()
-                            threads.append(thread)
-                    except Exception as error:
-                        logger.debug(f'Failure occurred when starting build data threads. Exception: {error}')
-
-                    try:
-                        for thread in threads:
-                            thread.join()
+                        self.server_interaction = True
+                        builds_data = self.build.info_many(build_urls)
+                        builds_data.extend([None] * (self.builds_data_number_of_builds - len(builds_data)))
+                        self.builds_data = builds_data
                     except Exception as error:
-                        logger.debug(f'Failure occurred when ending build data threads. Exception: {error}')
+                        logger.debug(f'Failure occurred when fetching builds data. Exception: {error}')
                 else:
                     logger.debug('No job info data. Waiting ...')
 
@@ -7,14 +7,6 @@ import sys
 import threading
 from time import sleep, time
 
-if platform.system() != 'Windows':
-    try:
-        import simpleaudio
-    except:
-        pass
-else:
-    import winsound
-
 from yojenkins.yo_jenkins.status import Color, Sound, Status
 
 from . import monitor_utility as mu
@@ -206,8 +198,11 @@ class Monitor:
         logger.debug(f'Thread starting - Play sound - (ID: {threading.get_ident()} - Sound: {sound_filepath}s) ...')
 
         # Load the file and play it
+        # NOTE: Sound libraries are imported here, they are only needed once a sound is played
         if platform.system() != 'Windows':
             try:
+                import simpleaudio  # noqa: PLC0415
+
                 wave_obj = simpleaudio.WaveObject.from_wave_file(sound_filepath)
                 play_obj = wave_obj.play()
             except Exception as error:
@@ -222,6 +217,8 @@ class Monitor:
                     break
         else:
             try:
+                import winsound  # noqa: PLC0415
+
                 winsound.PlaySound(sound_filepath, winsound.SND_FILENAME | winsound.SND_NODEFAULT)
                 self.playing_sound = True
             except RuntimeError as error:
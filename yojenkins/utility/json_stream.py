@@ -0,0 +1,230 @@
+"""Incremental parsing of large JSON documents"""
+
+import codecs
+import json
+import logging
+import re
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+# Getting the logger reference
+logger = logging.getLogger()
+
+WHITESPACE = ' \t\n\r'
+# Characters that may follow a complete value
+VALUE_DELIMITERS = ',:]}' + WHITESPACE
+# Characters changing the nesting of a value outside of strings, and within strings
+STRUCTURE_PATTERN = re.compile(r'["\[\]{}]')
+STRING_PATTERN = re.compile(r'["\\]')
+
+
+class JsonStreamReader:
+    """Reads JSON values from a stream of byte chunks, keeping only unread data in memory
+
+    Details: Values are decoded with the standard JSON decoder once all their bytes have
+             arrived. The end of an object, array, or string is found by scanning each received
+             chunk once for brackets and quotes, so a value is only decoded once. Memory use is
+             bounded by the largest single value read plus one chunk, not by the size of the whole
+             document.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        """Object constructor method, called at object creation
+
+        Args:
+            chunks : Byte chunks of a JSON document
+
+        Returns:
+            None
+        """
+        self.chunks = iter(chunks)
+        self.buffer = ''
+        self.position = 0
+        self.exhausted = False
+
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+    def _read_text(self) -> str:
+        """Read and decode the next chunk
+
+        Returns:
+            Text of the chunk, empty if at the end of the document
+        """
+        chunk = next(self.chunks, None)
+        if chunk is None:
+            self.exhausted = True
+            return self._text_decoder.decode(b'', final=True)
+        return self._text_decoder.decode(chunk)
+
+    def _fill(self) -> bool:
+        """Read the next chunk into the buffer, dropping what was already read
+
+        Returns:
+            True if more data was read, else False
+        """
+        if self.exhausted:
+            return False
+        text = self._read_text()
+        self.buffer = self.buffer[self.position :] + text
+        self.position = 0
+        return bool(text) or not self.exhausted
+
+    def peek(self) -> str:
+        """Get the next character that is not whitespace, without reading it
+
+        Returns:
+            Next character, empty if at the end of the document
+        """
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in WHITESPACE:
+                self.position += 1
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self._fill():
+                return ''
+
+    def expect(self, characters: str) -> str:
+        """Read the next character that is not whitespace, which must be one of the given
+
+        Args:
+            characters : Allowed characters
+
+        Returns:
+            Character read
+        """
+        character = self.peek()
+        if not character or character not in characters:
+            raise ValueError(f'Expected one of "{characters}" at JSON stream position, found "{character}"')
+        self.position += 1
+        return character
+
+    def _read_nested(self) -> None:
+        """Read the object, array, or string starting at the current position into the buffer
+
+        Details: Chunks are added to the buffer until the closing character is received,
+                 or the document ends
+
+        Returns:
+            None
+        """
+        pieces = [self.buffer[self.position :]]
+        scan = 0
+        depth = 0
+        in_string = False
+        while True:
+            pattern = STRING_PATTERN if in_string else STRUCTURE_PATTERN
+            match = pattern.search(pieces[-1], scan)
+            if not match:
+                if self.exhausted:
+                    break
+                # An escaped character may be the first of the next chunk
+                scan = max(0, scan - len(pieces[-1]))
+                pieces.append(self._read_text())
+                continue
+            character = match.group()
+            scan = match.end()
+            if character == '\\':
+                scan += 1
+                continue
+            if character == '"':
+                in_string = not in_string
+            elif character in '[{':
+                depth += 1
+            else:
+                depth -= 1
+            if not depth and not in_string:
+                break
+        self.buffer = ''.join(pieces)
+        self.position = 0
+
+    def read_value(self) -> Any:
+        """Read and decode the next complete JSON value
+
+        Returns:
+            Decoded value
+        """
+        character = self.peek()
+        if character and character in '[{"':
+            self._read_nested()
+            value, self.position = self._decoder.raw_decode(self.buffer, self.position)
+            return value
+
+        # Numbers, booleans, and null are short and decoded as they are
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number not followed by a delimiter may continue in the next chunk (ie. `-0.` then `5`)
+            followed_by_delimiter = end < len(self.buffer) and self.buffer[end] in VALUE_DELIMITERS
+            if not followed_by_delimiter and not self.exhausted and self._fill():
+                continue
+            self.position = end
+            return value
+
+
+def _follow_path(reader: JsonStreamReader, path: str) -> bool:
+    """Read a JSON document up to the value at a path of object keys
+
+    Args:
+        reader : Reader of the JSON document
+        path   : Object keys leading to the value, nested with a dot
+
+    Returns:
+        True if the path was found, else False
+    """
+    keys = path.split('.')
+    for depth, path_key in enumerate(keys):
+        if reader.peek() != '{':
+            logger.debug(f'JSON stream path "{path}" not found: "{".".join(keys[:depth])}" is not an object')
+            return False
+        reader.expect('{')
+        while True:
+            if reader.peek() == '}':
+                logger.debug(f'JSON stream path "{path}" not found')
+                return False
+            key = reader.read_value()
+            reader.expect(':')
+            if key == path_key:
+                break
+            reader.read_value()
+            if reader.expect(',}') == '}':
+                logger.debug(f'JSON stream path "{path}" not found')
+                return False
+    return True
+
+
+def iter_json_array(chunks: Iterable[bytes], path: str) -> Iterator[Any]:
+    """Yield the items of an array within a JSON document as they are received
+
+    Details: Only the object keys leading to the array are followed. Any values before
+             the array are decoded and dropped, and reading stops at the end of the array.
+
+    Examples:
+        - '{"computer": [{...}, {...}]}' with path 'computer' yields each node
+        - '{"a": {"b": [1, 2]}}' with path 'a.b' yields 1 and 2
+
+    Args:
+        chunks : Byte chunks of a JSON document
+        path   : Object keys leading to the array, nested with a dot
+
+    Returns:
+        Iterator of array items. Nothing is yielded if the path is not found
+    """
+    reader = JsonStreamReader(chunks)
+    if not _follow_path(reader, path):
+        return
+
+    if reader.peek() != '[':
+        logger.debug(f'JSON stream path "{path}" is not an array')
+        return
+    reader.expect('[')
+    if reader.peek() == ']':
+        return
+    while True:
+        yield reader.read_value()
+        if reader.expect(',]') == ']':
+            return
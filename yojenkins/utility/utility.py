@@ -77,7 +77,7 @@ def translate_kwargs(original_kwargs: dict[str, Any]) -> dict[str, Any]:
     return new_kwargs
 
 
-def print2(message: str, bold: bool = False, color: str = 'reset') -> None:
+def print2(message: str, bold: bool = False, color: str = 'reset', nl: bool = True) -> None:
     """Print a message to the console using click.
 
     Details:
@@ -91,8 +91,9 @@ def print2(message: str, bold: bool = False, color: str = 'reset') -> None:
         message: Message to print to console
         bold   : Whether to bold the message
         color  : Color to use for the message ()
+        nl     : Whether to end the message with a newline
     """
-    echo(style(message, fg=color, bold=bold))
+    echo(style(message, fg=color, bold=bold), nl=nl)
 
 
 def fail_out(message: str) -> None:
@@ -716,6 +717,33 @@ def item_subitem_list(
     return item_list, item_name_list
 
 
+def fields_to_tree(fields: list[str]) -> str:
+    """Build the Jenkins API `tree` query value from a list of fields.
+
+    Examples:
+        - ['number', 'result'] -> 'number,result'
+        - ['fullName', 'lastBuild.number', 'lastBuild.url'] -> 'fullName,lastBuild[number,url]'
+
+    Args:
+        fields : List of field names. Nested fields are separated by a dot (ie. `lastBuild.number`)
+
+    Returns:
+        Value for the `tree` query parameter
+    """
+    # Nested dict of field names, keeping the order fields were passed
+    field_tree = {}
+    for field in fields:
+        level = field_tree
+        for field_part in field.strip().split('.'):
+            if field_part:
+                level = level.setdefault(field_part, {})
+
+    def to_tree(level: dict) -> str:
+        return ','.join(f'{name}[{to_tree(sublevel)}]' if sublevel else name for name, sublevel in level.items())
+
+    return to_tree(field_tree)
+
+
 def to_seconds(time_quantity: int, time_unit_text: str) -> int:
     """Get the number of seconds from the time quantity and time unit type.
 
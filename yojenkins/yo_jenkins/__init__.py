@@ -2,15 +2,29 @@
 
 from .account import Account
 from .auth import Auth
+from .auth_cache import AuthCache
+from .console_log import ConsoleLog
+from .crawler import Crawler
 from .credential import Credential
+from .downloader import Downloader
 from .folder import Folder
+from .item_index import ItemIndex
 from .jenkins_item_classes import JenkinsItemClasses
 from .jenkins_item_config import JenkinsItemConfig
 from .jenkins_item_template import JenkinsItemTemplate
 from .job import Job
+from .log_store import LogStore
 from .node import Node
+from .rate_limiter import RateLimiter
 from .rest import Rest
+from .rest_cache import RestCache
+from .rest_crumb import CrumbManager
+from .rest_pool import ConnectionPool
+from .rest_retry import CircuitBreaker, RetryPolicy
+from .rest_single_flight import SingleFlight
+from .rest_trace import RequestTracer
 from .server import Server
+from .server_capabilities import ServerCapabilities
 from .stage import Stage
 from .step import Step
 from .yojenkins import YoJenkins
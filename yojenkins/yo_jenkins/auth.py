@@ -5,18 +5,23 @@ import logging
 import os
 import re
 import sys
+import threading
 from datetime import datetime
 from getpass import getpass
 from json.decoder import JSONDecodeError
 from pathlib import Path
 from typing import Any
+from urllib.parse import urlparse
 
 import toml
 from jenkins import Jenkins as JenkinsSDK
 
 from yojenkins.utility import utility
 from yojenkins.utility.utility import TextStyle, fail_out, failures_out, print2
+from yojenkins.yo_jenkins.auth_cache import DEFAULT_AUTH_CACHE_TTL, AuthCache
+from yojenkins.yo_jenkins.rate_limiter import RateLimiter
 from yojenkins.yo_jenkins.rest import Rest
+from yojenkins.yo_jenkins.rest_retry import CircuitBreaker
 
 # Getting the logger reference
 logger = logging.getLogger()
@@ -27,7 +32,28 @@ CREDS_FILE_NAME = 'credentials'
 PROFILE_ENV_VAR = 'YOJENKINS_PROFILE'
 
 REQUIRED_PROFILE_KEYS = ['jenkins_server_url', 'username']
-ALLOWED_PROFILE_KEYS = ['jenkins_server_url', 'username', 'api_token', 'active']
+ALLOWED_PROFILE_KEYS = [
+    'jenkins_server_url',
+    'username',
+    'api_token',
+    'active',
+    'cache_ttl',
+    'cache_max_size_mb',
+    'log_store_max_size_mb',
+    'index_max_age',
+    'auth_cache_ttl',
+    'request_retries',
+    'retry_backoff',
+    'circuit_breaker_threshold',
+    'circuit_breaker_timeout',
+    'rate_limit',
+    'rate_limit_burst',
+    'max_in_flight',
+    'capabilities_max_age',
+    'pool_size',
+    'max_workers',
+    'keep_alive',
+]
 
 
 class Auth:
@@ -57,6 +83,11 @@ class Auth:
         self.jenkins_api_token = ''
         self.authenticated = False
 
+        # Record of recently verified credentials - Instantiated in create_auth()
+        self.auth_cache = None
+        self._auth_cache_key = ''
+        self._reverify_lock = threading.Lock()
+
     def _update_profiles(self, profiles: dict) -> bool:
         """Create/Update the current credentials profile file
 
@@ -564,14 +595,18 @@ class Auth:
 
         return profile_selected
 
-    def create_auth(self, profile_info: dict = {}, token: str = '') -> bool:
+    def create_auth(self, profile_info: dict = {}, token: str = '', use_auth_cache: bool = True) -> bool:
         """Authenticate with the Jenkins server
 
-        Details: If not server API token in the profile used, ask for token/password
+        Details: If not server API token in the profile used, ask for token/password.
+                 If the same credentials were verified within the `auth_cache_ttl` of the profile,
+                 the server connection and authentication checks are skipped. Any later request
+                 denied by the server will then verify the credentials again.
 
         Args:
-            profile_info : (Optional) Credentials profile information
-            token:         API token as passed to override profile value
+            profile_info   : (Optional) Credentials profile information
+            token:           API token as passed to override profile value
+            use_auth_cache : If True, skip the server checks for recently verified credentials
 
         Returns:
             True if successfully authenticated, else False
@@ -642,6 +677,56 @@ class Auth:
             server_url=self.jenkins_profile['jenkins_server_url'],
         )
 
+        # Apply any profile response cache settings
+        if self.rest.cache:
+            self.rest.cache.configure(
+                ttl=self.jenkins_profile.get('cache_ttl'), max_size_mb=self.jenkins_profile.get('cache_max_size_mb')
+            )
+        if self.rest.log_store:
+            self.rest.log_store.configure(max_size_mb=self.jenkins_profile.get('log_store_max_size_mb'))
+
+        # Apply any profile request retry and circuit breaker settings
+        self.rest.retry.configure(
+            retries=self.jenkins_profile.get('request_retries'), backoff=self.jenkins_profile.get('retry_backoff')
+        )
+        CircuitBreaker.for_server(urlparse(self.jenkins_profile['jenkins_server_url']).netloc).configure(
+            threshold=self.jenkins_profile.get('circuit_breaker_threshold'),
+            timeout=self.jenkins_profile.get('circuit_breaker_timeout'),
+        )
+
+        # Apply any profile client-side request rate and concurrency limits
+        rate_limiter = RateLimiter(
+            urlparse(self.jenkins_profile['jenkins_server_url']).netloc,
+            rate=self._profile_number('rate_limit', 0),
+            burst=self._profile_number('rate_limit_burst', 0, int),
+            max_in_flight=self._profile_number('max_in_flight', 0, int),
+        )
+        self.rest.rate_limiter = rate_limiter if rate_limiter.enabled() else None
+
+        # Apply any profile connection pool settings
+        self.rest.configure_pool(
+            pool_size=self.jenkins_profile.get('pool_size'),
+            max_workers=self.jenkins_profile.get('max_workers'),
+            keep_alive=self.jenkins_profile.get('keep_alive'),
+        )
+
+        # Apply any profile server capability record settings
+        self.rest.capabilities.configure(max_age=self.jenkins_profile.get('capabilities_max_age'))
+
+        # Skip the server checks if these credentials were verified recently
+        self.auth_cache = AuthCache(ttl=self._profile_number('auth_cache_ttl', DEFAULT_AUTH_CACHE_TTL))
+        self._auth_cache_key = AuthCache.key(
+            self.jenkins_profile.get('profile', ''),
+            self.jenkins_profile['jenkins_server_url'],
+            self.jenkins_profile['username'],
+            self.jenkins_profile['api_token'],
+        )
+        if use_auth_cache and self.auth_cache.is_verified(self._auth_cache_key):
+            logger.debug('Credentials were recently verified. Skipping server connection and authentication checks')
+            self.rest.on_auth_failure = self._on_auth_failure
+            self.authenticated = True
+            return True
+
         # Check network connection
         if not self.rest.is_reachable():
             print2(
@@ -687,8 +772,55 @@ class Auth:
             print2('    - Give Jenkins server a little to start up', bold=True, color='red')
             sys.exit(1)
 
+        self.auth_cache.store(self._auth_cache_key)
+        self.rest.on_auth_failure = self._on_auth_failure
+        self.authenticated = True
         return True
 
+    def _on_auth_failure(self, status_code: int) -> None:
+        """Verify the credentials again after the server denied a request
+
+        Details: Called by the Rest object at most once. If the credentials are no longer
+                 accepted, the verification fails out. Otherwise the request was denied due
+                 to missing permissions and the request failure is handled as usual.
+
+        Args:
+            status_code : HTTP status code of the denied request
+
+        Returns:
+            None
+        """
+        with self._reverify_lock:
+            if self.rest.on_auth_failure is None:
+                return
+            self.rest.on_auth_failure = None
+            logger.debug(f'Server denied request (Status code: {status_code}). Verifying credentials again ...')
+            self.auth_cache.forget(self._auth_cache_key)
+            self.verify()
+            self.auth_cache.store(self._auth_cache_key)
+
+    def _profile_number(self, key: str, default: float, number_type: type = float) -> float:
+        """Get a number setting of the current profile
+
+        Details: Fails out if the setting is not a number
+
+        Args:
+            key         : Name of the profile setting
+            default     : Value used if the profile does not have the setting
+            number_type : Type of the number, `float` or `int`
+
+        Returns:
+            Value of the setting
+        """
+        value = self.jenkins_profile.get(key, default)
+        try:
+            return number_type(value)
+        except (TypeError, ValueError):
+            fail_out(
+                f'Profile "{self.jenkins_profile.get("profile", "")}" setting "{key}" must be a '
+                f'{"whole number" if number_type is int else "number"}. Found: {value!r}'
+            )
+
     def show_local_credentials(self) -> dict:
         """Output/Display the credentials profile file
 
@@ -0,0 +1,141 @@
+"""AuthCache class definition"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from time import time
+
+# Getting the logger reference
+logger = logging.getLogger()
+
+# TODO: Find centralized location for these static values
+CONFIG_DIR_NAME = '.yojenkins'
+AUTH_CACHE_FILE_NAME = 'auth_verified.json'
+
+# Seconds a successful authentication check is trusted without checking with the server again
+DEFAULT_AUTH_CACHE_TTL = 900
+
+
+class AuthCache:
+    """On-disk record of recently verified server credentials
+
+    Details: Each entry is keyed by a hash of the profile name, server URL, username, and API token,
+             so that no credentials are stored and any change to them requires a new verification.
+             Entries hold the time the credentials were last verified with the server and are
+             trusted for `ttl` seconds.
+    """
+
+    def __init__(self, cache_file: str = '', ttl: float = DEFAULT_AUTH_CACHE_TTL) -> None:
+        """Object constructor method, called at object creation
+
+        Args:
+            cache_file : File path of the verification record. Default is `~/.yojenkins/auth_verified.json`
+            ttl        : Seconds a successful verification is trusted. 0 to always verify
+
+        Returns:
+            None
+        """
+        self.cache_file = cache_file or os.path.join(Path.home(), CONFIG_DIR_NAME, AUTH_CACHE_FILE_NAME)
+        self.ttl = ttl
+
+    @staticmethod
+    def key(profile_name: str, server_url: str, username: str, api_token: str) -> str:
+        """Get the key of a set of credentials
+
+        Args:
+            profile_name : Name of the credentials profile
+            server_url   : Server URL
+            username     : Username
+            api_token    : API token or password
+
+        Returns:
+            Hexadecimal hash of the credentials
+        """
+        credentials = '\n'.join([profile_name, server_url.strip('/'), username, api_token])
+        return hashlib.sha256(credentials.encode('utf-8')).hexdigest()
+
+    def _load(self) -> dict:
+        """Load all entries from file
+
+        Returns:
+            Verification time by credentials key
+        """
+        try:
+            with open(self.cache_file, encoding='utf-8') as file:
+                entries = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def _save(self, entries: dict) -> None:
+        """Replace all entries in file, only readable by the current user
+
+        Args:
+            entries : Verification time by credentials key
+
+        Returns:
+            None
+        """
+        cache_dir = os.path.dirname(self.cache_file)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            file_descriptor, temp_path = tempfile.mkstemp(dir=cache_dir, prefix='.auth_verified.')
+            with os.fdopen(file_descriptor, 'w', encoding='utf-8') as file:
+                json.dump(entries, file)
+            os.replace(temp_path, self.cache_file)
+        except OSError as error:
+            logger.debug(f'Failed to save authentication verification record. Exception: {error}')
+
+    def is_verified(self, key: str) -> bool:
+        """Check if the credentials were verified within the TTL
+
+        Args:
+            key : Credentials key
+
+        Returns:
+            True if recently verified, else False
+        """
+        if self.ttl <= 0:
+            return False
+        verified = self._load().get(key)
+        if not isinstance(verified, (int, float)):
+            return False
+        age = time() - verified
+        logger.debug(f'Credentials were last verified {age:.0f} seconds ago (TTL: {self.ttl:.0f} seconds)')
+        return 0 <= age < self.ttl
+
+    def store(self, key: str) -> None:
+        """Record the credentials as verified now, dropping any expired entries
+
+        Args:
+            key : Credentials key
+
+        Returns:
+            None
+        """
+        if self.ttl <= 0:
+            return
+        now = time()
+        entries = {
+            entry_key: verified
+            for entry_key, verified in self._load().items()
+            if isinstance(verified, (int, float)) and now - verified < self.ttl
+        }
+        entries[key] = now
+        self._save(entries)
+
+    def forget(self, key: str) -> None:
+        """Remove the record of the credentials, so they are verified with the next command
+
+        Args:
+            key : Credentials key
+
+        Returns:
+            None
+        """
+        entries = self._load()
+        if entries.pop(key, None) is not None:
+            self._save(entries)
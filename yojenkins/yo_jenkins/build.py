@@ -2,43 +2,57 @@
 
 import logging
 import os
+import re
+import sys
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from itertools import islice
 from time import sleep, time
 from typing import Optional
-from urllib.parse import urlencode
+from urllib.parse import quote, urlencode
 
-import requests
 import yaml
 
-from yojenkins.monitor import BuildMonitor
 from yojenkins.utility import utility
 from yojenkins.utility.utility import diff_show, fail_out, failures_out, print2
 from yojenkins.yo_jenkins.auth import Auth
+from yojenkins.yo_jenkins.console_log import ConsoleLog
+from yojenkins.yo_jenkins.downloader import Downloader
+from yojenkins.yo_jenkins.item_index import ItemIndex
 from yojenkins.yo_jenkins.jenkins_item_classes import JenkinsItemClasses
-from yojenkins.yo_jenkins.rest import Rest
+from yojenkins.yo_jenkins.rest import REQUEST_MANY_MAX_CONCURRENT, Rest
 from yojenkins.yo_jenkins.status import BuildStatus
 
 # Getting the logger reference
 logger = logging.getLogger()
 
+# Build information fields holding the build parameters
+BUILD_PARAMETERS_FIELDS = ['actions.parameters.name', 'actions.parameters.value']
+# Build information fields always requested along with selected fields, so that the response
+# of a finished build can be recognized and cached as immutable
+BUILD_CACHE_FIELDS = ['building', 'result']
+
 
 class Build:
     """Buld class"""
 
-    def __init__(self, rest: Rest, auth: Auth) -> None:
+    def __init__(self, rest: Rest, auth: Auth, item_index: Optional[ItemIndex] = None) -> None:
         """Object constructor method, called at object creation
 
         Args:
             rest: Rest object
             auth: Auth object
+            item_index: ItemIndex object used to look up job URLs. Default is a new index
 
         Returns:
             None
         """
         self.rest = rest
         self.auth = auth
-        self.build_monitor = BuildMonitor(rest, auth, self)
+        self.item_index = item_index if item_index else ItemIndex(rest)
+        # BuildMonitor object - Instantiated in monitor()
+        self.build_monitor = None
 
         self.build_logs_extension = '.log'
 
@@ -49,19 +63,30 @@ class Build:
         job_url: str = '',
         build_number: Optional[int] = None,
         latest: bool = False,
+        *,
+        fields: Optional[list[str]] = None,
     ) -> dict:
-        """TODO Docstring
+        """Get the build information
 
         Args:
-            TODO
+            build_url    : Build URL
+            job_name     : Job name, used with build number or latest
+            job_url      : Job URL, used with build number or latest
+            build_number : Build number within the job
+            latest       : If True, get the latest build of the job
+            fields       : Only get these fields, nested with a dot (ie. `actions.parameters`). Default is all fields.
+                           If specified, no additional derived information is added
 
         Returns:
-            TODO
+            Build information
         """
+        if fields:
+            fields = [*fields, *(field for field in BUILD_CACHE_FIELDS if field not in fields)]
+
         if build_url:
             build_url = utility.build_url_complete(build_url)
             request_url = f'{build_url.strip("/")}/api/json'
-            build_info = self.rest.request(request_url, 'get', is_endpoint=False)[0]
+            build_info = self.rest.request(request_url, 'get', is_endpoint=False, fields=fields)[0]
             if not build_info:
                 fail_out(f'Failed to get build info for provided build url ({build_url})')
         else:
@@ -69,11 +94,16 @@ class Build:
                 fail_out('No job name, job url, and build url provided')
 
             if job_name and not job_url:
-                job_url = utility.name_to_url(self.rest.get_server_url(), job_name)
+                job_url = self.item_index.name_to_url(job_name)
 
-            job_info, _, success = self.rest.request(f'{job_url.strip("/")}/api/json', 'get', is_endpoint=False)
+            job_info, _, success = self.rest.request(
+                f'{job_url.strip("/")}/api/json', 'get', is_endpoint=False, fields=['fullName', 'lastBuild.number']
+            )
             if not success:
-                fail_out(f'Failed getting build info, because failed to request job info: {job_url}')
+                fail_out(
+                    'Failed getting build info, because failed to request job info: '
+                    f'{job_url}{self.item_index.did_you_mean(job_name)}'
+                )
 
             # Check if found item type/class is a build
             if job_info['_class'] not in JenkinsItemClasses.JOB.value['class_type']:
@@ -99,7 +129,7 @@ class Build:
 
             logger.debug(f'Getting build info for job "{job_info["fullName"]}, build {build_number} ...')
             build_info, _, success = self.rest.request(
-                f'{job_url.strip("/")}/{build_number}/api/json', 'get', is_endpoint=False
+                f'{job_url.strip("/")}/{build_number}/api/json', 'get', is_endpoint=False, fields=fields
             )
             if not success:
                 fail_out('Failed to request build info')
@@ -108,7 +138,47 @@ class Build:
         if build_info['_class'] not in JenkinsItemClasses.BUILD.value['class_type']:
             fail_out(f'Build found, but failed to match build type/class. This item is "{build_info["_class"]}"')
 
-        # Add additional derived information
+        if fields:
+            return build_info
+
+        return self._info_add_derived(build_info)
+
+    def info_many(self, build_urls: list[str]) -> list[dict]:
+        """Get the build information for multiple builds at once
+
+        Details: All build information requests are sent concurrently. Builds that
+                 fail to be fetched or are not a build item are returned as empty dict.
+
+        Args:
+            build_urls : List of build URLs
+
+        Returns:
+            List of build information, in the same order as the passed build URLs
+        """
+        logger.debug(f'Getting build info for {len(build_urls)} builds ...')
+        requests_kwargs = [
+            {'target': f'{build_url.strip("/")}/api/json', 'request_type': 'get', 'is_endpoint': False}
+            for build_url in build_urls
+        ]
+        build_info_list = []
+        for build_url, (build_info, _, success) in zip(build_urls, self.rest.request_many(requests_kwargs)):
+            if not success or build_info.get('_class') not in JenkinsItemClasses.BUILD.value['class_type']:
+                logger.debug(f'Failed to get build info for build: {build_url}')
+                build_info_list.append({})
+                continue
+            build_info_list.append(self._info_add_derived(build_info))
+
+        return build_info_list
+
+    def _info_add_derived(self, build_info: dict) -> dict:
+        """Add additional derived information to the build information
+
+        Args:
+            build_info : Build information as returned by the server
+
+        Returns:
+            Build information with derived information added
+        """
         if 'timestamp' in build_info:
             build_info['startDatetime'] = datetime.fromtimestamp(build_info['timestamp'] / 1000.0).strftime(
                 '%A, %B %d, %Y %I:%M:%S'
@@ -253,7 +323,7 @@ class Build:
         else:
             logger.debug('No build URL passed. Getting build information ...')
             # Get build info request
-            build_info = self.info(build_url, job_name, job_url, build_number, latest)
+            build_info = self.info(build_url, job_name, job_url, build_number, latest, fields=['url'])
             url = build_info['url']
 
         # Making a direct request using the passed url
@@ -295,7 +365,7 @@ class Build:
         else:
             logger.debug('No build URL passed. Getting build information ...')
             # Get build info request
-            build_info = self.info(build_url, job_name, job_url, build_number, latest)
+            build_info = self.info(build_url, job_name, job_url, build_number, latest, fields=['url'])
             url = build_info['url']
 
         # Making a direct request using the passed url
@@ -330,9 +400,13 @@ class Build:
             logger.debug('No build URL passed. Getting build information ...')
             # Get build info request
             build_url = utility.build_url_complete(build_url)
-            build_info = self.info(build_url, job_name, job_url, build_number, latest)
+            build_info = self.info(build_url, job_name, job_url, build_number, latest, fields=['url'])
             build_url = build_info['url']
 
+        # Stages are only available with the Pipeline REST API plugin
+        if self.rest.capabilities.get('workflow_api') is False:
+            fail_out('Failed to get build stages. Server does not have the Pipeline REST API plugin (wfapi)')
+
         # Making a direct request using the passed url
         logger.debug(f'Getting build stages for: {build_url} ...')
         request_url = f'{build_url.strip("/")}/wfapi/describe'
@@ -362,33 +436,87 @@ class Build:
         return build_stage_list, build_stage_name_list
 
     def artifact_list(
-        self, build_url: str = '', job_name: str = '', job_url: str = '', build_number: Optional[int] = None
+        self,
+        build_url: str = '',
+        job_name: str = '',
+        job_url: str = '',
+        build_number: Optional[int] = None,
+        latest: bool = False,
     ) -> list[dict]:
-        """TODO Docstring
+        """Get the list of archived artifacts of a build
 
         Args:
-            TODO
+            build_url    : Build URL
+            job_name     : Job name, used with build number or latest
+            job_url      : Job URL, used with build number or latest
+            build_number : Build number within the job
+            latest       : If True, use the latest build of the job
 
         Returns:
-            TODO
+            Artifact information (ie. `fileName`, `relativePath`)
         """
-        # Test on build with artifacts
-        build_url = utility.build_url_complete(build_url)
-        return self.info(build_url=build_url, job_name=job_name, job_url=job_url, build_number=build_number).get(
-            'artifacts'
+        build_info = self.info(
+            build_url=build_url,
+            job_name=job_name,
+            job_url=job_url,
+            build_number=build_number,
+            latest=latest,
+            fields=['url', 'artifacts.fileName', 'artifacts.relativePath'],
         )
+        return build_info.get('artifacts') or []
 
-    def artifact_download(self):
-        """TODO Docstring
+    def artifact_download(
+        self,
+        build_url: str = '',
+        job_name: str = '',
+        job_url: str = '',
+        build_number: Optional[int] = None,
+        latest: bool = False,
+        *,
+        download_dir: str = '.',
+    ) -> list[str]:
+        """Download the archived artifacts of a build, all at the same time
+
+        Details: Artifacts keep their relative path within the download directory. Interrupted
+                 downloads continue where they stopped when run again.
 
         Args:
-            TODO
+            build_url    : Build URL
+            job_name     : Job name, used with build number or latest
+            job_url      : Job URL, used with build number or latest
+            build_number : Build number within the job
+            latest       : If True, use the latest build of the job
+            download_dir : Directory to download the artifacts to
 
         Returns:
-            TODO
+            Local file paths of the downloaded artifacts
         """
-        # TODO: Test on build with artifacts
-        pass
+        build_info = self.info(
+            build_url=build_url,
+            job_name=job_name,
+            job_url=job_url,
+            build_number=build_number,
+            latest=latest,
+            fields=['url', 'artifacts.relativePath'],
+        )
+        artifacts = [artifact['relativePath'] for artifact in build_info.get('artifacts') or []]
+        if not artifacts:
+            fail_out('Failed to find any archived artifacts for this build')
+
+        downloads = []
+        for relative_path in artifacts:
+            file_path = os.path.normpath(os.path.join(download_dir, *relative_path.split('/')))
+            if os.path.relpath(file_path, download_dir).startswith(os.pardir):
+                fail_out(f'Failed to download artifact "{relative_path}". Artifact path is outside download directory')
+            downloads.append((f'{build_info["url"].strip("/")}/artifact/{quote(relative_path)}', file_path))
+
+        logger.debug(f'Downloading {len(downloads)} build artifacts to "{download_dir}" ...')
+        results = Downloader(self.rest).download_many(downloads)
+        failed = [relative_path for relative_path, success in zip(artifacts, results) if not success]
+        if failed:
+            fail_out(f'Failed to download {len(failed)} of {len(artifacts)} artifacts: {", ".join(failed)}')
+        logger.debug(f'Successfully downloaded {len(downloads)} build artifacts')
+        return [file_path for _, file_path in downloads]
 
     def logs(
         self,
@@ -414,7 +542,9 @@ class Build:
             build_url = utility.build_url_complete(build_url)
         else:
             logger.debug('No build URL passed. Getting build information through job ...')
-            build_info = self.info(job_name=job_name, job_url=job_url, build_number=build_number, latest=latest)
+            build_info = self.info(
+                job_name=job_name, job_url=job_url, build_number=build_number, latest=latest, fields=['url']
+            )
             build_url = build_info['url']
 
         # FIXME: Check if this is an actual build and job/folder/etc
@@ -422,53 +552,63 @@ class Build:
         request_url = f'{build_url.strip("/")}/consoleText'
 
         if download_dir:
-            # Download to local file
-            auth = requests.auth.HTTPBasicAuth(self.rest.username, self.rest.api_token)
-            filename = f'build-logs_{datetime.now().strftime("%m-%d-%Y_%I-%M-%S")}{self.build_logs_extension}'
+            # Download to local file, through the server session, or from the log store if stored
+            # NOTE: Named after the build, so an interrupted download continues when run again
+            filename = f'build-logs_{utility.url_to_name(build_url).replace("/", "_")}{self.build_logs_extension}'
             logger.debug(f'Downloading console text logs to local file "{filename}" ...')
-            try:
-                with requests.get(request_url, auth=auth, stream=True, timeout=10) as open_request:
-                    open_request.raise_for_status()
+            stored_chunks = self.rest.log_store.read(self.rest.username, request_url) if self.rest.log_store else None
+            if stored_chunks is not None:
+                try:
                     with open(os.path.join(download_dir, filename), 'wb') as open_file:
-                        for chunk in open_request.iter_content(chunk_size=8192):
-                            if chunk:
-                                open_file.write(chunk)
-                logger.debug('Successfully download build logs to file')
-            except Exception as error:
-                fail_out(f'Failed to download or save logs for build. Exception: {error}')
+                        for chunk in stored_chunks:
+                            open_file.write(chunk)
+                except OSError as error:
+                    fail_out(f'Failed to save logs for build. Exception: {error}')
+            elif not Downloader(self.rest).download(request_url, os.path.join(download_dir, filename)):
+                fail_out('Failed to download or save logs for build')
+            logger.debug('Successfully download build logs to file')
         elif not follow:
-            # Show build logs in console
-            logger.debug('Fetching logs from server ...')
-            return_content, _, return_success = self.rest.request(
-                request_url, 'get', is_endpoint=False, json_content=False
-            )
-            if not return_success or not return_content:
-                fail_out('Failed to get console logs. Build may not exist or is queued')
-
-            # If tail/last part of the log was specified
+            # Stream the build logs to console, never holding the whole log in memory
+            console_log = ConsoleLog(self.rest, build_url)
             if tail:
                 logger.debug(f'--tail option specified with value of: {tail}')
                 tail = abs(tail)
-                logs_list = [num.strip() for num in return_content.splitlines()]
-                number_of_lines = round(len(logs_list) * tail) if tail < 1 else round(tail)
-                start_log_number = 0 if number_of_lines > len(logs_list) else len(logs_list) - number_of_lines
-                return_content = os.linesep.join(list(islice(logs_list, start_log_number, None)))
-                logger.debug(f'Only printing out last logs, lines {start_log_number} to {len(logs_list)} ...')
+                if tail < 1:
+                    logger.debug(f'Only printing out the last {tail * 100:.0f}% of log lines ...')
+                    log_chunks = console_log.tail_fraction(tail)
+                else:
+                    logger.debug(f'Only printing out the last {round(tail)} log lines ...')
+                    log_chunks = console_log.tail(round(tail))
+            else:
+                log_chunks = console_log.read()
 
             logger.debug('Printing out console text logs ...')
-            print2(return_content)
+            log_text = ''
+            for log_text in ConsoleLog.decode(log_chunks):
+                print2(log_text, nl=False)
+            if log_text and not log_text.endswith('\n'):
+                print2('')
+            received = console_log.status_code == 416 or 200 <= console_log.status_code < 300
+            if log_text and not received:
+                fail_out('Failed to get the whole console log. Lost connection to server')
+            if not log_text and not (tail and received):
+                fail_out('Failed to get console logs. Build may not exist or is queued')
         else:
             # Stream the logs to console
             log_poll_interval = 1.0
             logger.debug(f'Following/streaming logs from server at poll interval: {log_poll_interval}s ...')
 
-            # Check if Jenkins server supports progressiveText
-            _, headers, request_success = self.rest.request(
-                f'{build_url.strip("/")}/logText/progressiveText?start=0',
-                'head',
-                is_endpoint=False,
-                json_content=False,
-            )
+            # Check if Jenkins server supports progressiveText, unless already known not to
+            request_success, headers = False, {}
+            if self.rest.capabilities.peek('progressive_text') is not False:
+                _, headers, request_success = self.rest.request(
+                    f'{build_url.strip("/")}/logText/progressiveText?start=0',
+                    'head',
+                    is_endpoint=False,
+                    json_content=False,
+                )
+                if request_success:
+                    self.rest.capabilities.update(progressive_text='X-Text-Size' in headers)
 
             if request_success and 'X-Text-Size' in headers:
                 # METHOD 1: Fetch logs using progressiveText endpoint
@@ -492,48 +632,68 @@ class Build:
                 except KeyboardInterrupt:
                     logger.debug('Keyboard Interrupt (CTRL-C) by user. Stopping log following ...')
             else:
-                # METHOD 2: Fetch logs using log difference (Server does not support progressiveText)
+                # METHOD 2: Fetch new log bytes by byte offset (Server does not support progressiveText)
+                console_log = ConsoleLog(self.rest, build_url)
                 try:
                     logger.debug(
-                        'Jenkins server does not support requesting partial byte ranges (progressiveText), '
-                        'MUST download entire log to get log message differences'
+                        'Jenkins server does not support progressiveText. Following logs with byte range requests'
                     )
-                    old_dict = {}
-                    fetch_number = 1
-                    request_url = f'{build_url.strip("/")}/consoleText'
-                    while True:
-                        headers = self.rest.request(request_url, 'head', is_endpoint=False, json_content=False)[1]
-                        if 'content-length' not in headers:
-                            fail_out(f'Failed to find "content-length" key in server response headers: {headers}')
-                        content_length_sample_1 = int(headers['Content-Length'])
-                        sleep(1)
-                        headers = self.rest.request(request_url, 'head', is_endpoint=False, json_content=False)[1]
-                        content_length_sample_2 = int(headers['Content-Length'])
-
-                        content_length_diff = content_length_sample_2 - content_length_sample_1
-                        if content_length_diff:
-                            logger.debug(
-                                f'LOG FETCH {fetch_number}: Content length difference: {content_length_diff} bytes'
-                            )
-                            return_content = self.rest.request(
-                                request_url, 'get', is_endpoint=False, json_content=False
-                            )[0]
-                            new_dict = dict.fromkeys([num.strip() for num in return_content.splitlines()])
-
-                            diff = dict.fromkeys(x for x in new_dict if x not in old_dict)
-                            diff_list = list(diff.keys())
-                            diff_text = os.linesep.join(diff_list)
-
-                            old_dict = new_dict
-                            fetch_number += 1
-
-                            print2(diff_text)
-                        else:
-                            logger.debug('No content length difference')
+                    for text in console_log.follow(poll_interval=log_poll_interval):
+                        print2(text, nl=False)
+                        sys.stdout.flush()
                 except KeyboardInterrupt:
                     logger.debug('Keyboard Interrupt (CTRL-C) by user. Stopping log following ...')
+                    return True
+                if console_log.status_code != 416 and not 200 <= console_log.status_code < 300:
+                    fail_out('Failed to follow console logs. Lost connection to server')
         return True
 
+    def logs_grep(self, build_urls: list[str], search_pattern: str, ignore_case: bool = False) -> Iterator[dict]:
+        """Search the console logs of multiple builds for lines matching a REGEX pattern
+
+        Details: The logs of the builds are searched at the same time, each streamed from the
+                 server without holding it in memory. Matches are yielded in the order of the builds,
+                 as soon as each build in turn has been searched.
+
+        Args:
+            build_urls     : Build URLs
+            search_pattern : REGEX pattern to match
+            ignore_case    : If True, match regardless of case
+
+        Returns:
+            Iterator of matching lines (`url`, `line_number`, `line`)
+        """
+        try:
+            pattern = re.compile(search_pattern.encode('utf-8'), re.MULTILINE | (re.IGNORECASE if ignore_case else 0))
+        except re.error as error:
+            fail_out(f'Failed to use log search pattern "{search_pattern}". Error: {error}')
+        if not build_urls:
+            return
+
+        # Set to stop the searches still running, once one failed or the results are no longer read
+        stop_search = threading.Event()
+
+        def build_matches(build_url: str) -> tuple[list[dict], bool]:
+            console_log = ConsoleLog(self.rest, build_url)
+            matches = [
+                {'url': build_url, 'line_number': line_number, 'line': line.decode('utf-8', errors='replace')}
+                for line_number, line in console_log.grep(pattern, stop=stop_search)
+            ]
+            return matches, 200 <= console_log.status_code < 300
+
+        number_of_workers = min(REQUEST_MANY_MAX_CONCURRENT, len(build_urls))
+        logger.debug(f'Searching console logs of {len(build_urls)} builds, {number_of_workers} at a time ...')
+        self.rest.pool.request_concurrency(number_of_workers)
+        with ThreadPoolExecutor(max_workers=number_of_workers) as executor:
+            try:
+                for build_url, (matches, success) in zip(build_urls, executor.map(build_matches, build_urls)):
+                    if not success:
+                        fail_out(f'Failed to search console logs of build "{build_url}"')
+                    yield from matches
+            finally:
+                stop_search.set()
+                executor.shutdown(wait=False, cancel_futures=True)
+
     def browser_open(
         self,
         build_url: str = '',
@@ -557,7 +717,7 @@ class Build:
             build_url = build_url.strip('/')
         else:
             logger.debug('No build URL passed. Getting build information ...')
-            build_info = self.info(build_url, job_name, job_url, build_number, latest)
+            build_info = self.info(build_url, job_name, job_url, build_number, latest, fields=['url'])
             build_url = build_info['url']
 
         # Open the build in browser
@@ -594,10 +754,15 @@ class Build:
             url = build_url
         else:
             logger.debug('No build URL passed. Getting build information ...')
-            build_info = self.info(build_url, job_name, job_url, build_number, latest)
+            build_info = self.info(build_url, job_name, job_url, build_number, latest, fields=['url'])
             url = build_info['url']
 
         logger.debug(f'Starting monitor for: "{url}" ...')
+        if not self.build_monitor:
+            # Imported here, the monitor terminal and sound libraries are only needed for monitoring
+            from yojenkins.monitor import BuildMonitor  # noqa: PLC0415
+
+            self.build_monitor = BuildMonitor(self.rest, self.auth, self)
         success = self.build_monitor.monitor_start(build_url=url, sound=sound)
         if not success:
             fail_out('Failed to start build monitor')
@@ -623,7 +788,9 @@ class Build:
         """
         # TODO: Pass a list of build numbers
         build_url = utility.build_url_complete(build_url)
-        build_info = self.info(build_url, job_name, job_url, build_number, latest)
+        build_info = self.info(
+            build_url, job_name, job_url, build_number, latest, fields=['url', *BUILD_PARAMETERS_FIELDS]
+        )
         if not build_url:
             logger.debug('No build URL passed. Getting build information ...')
             # Get build info request
@@ -664,7 +831,9 @@ class Build:
             TODO
         """
         build_url = utility.build_url_complete(build_url)
-        build_info = self.info(build_url, job_name, job_url, build_number, latest)
+        build_info = self.info(
+            build_url, job_name, job_url, build_number, latest, fields=['url', *BUILD_PARAMETERS_FIELDS]
+        )
         if not build_url:
             build_url = build_info['url']
         if not job_url:
@@ -732,17 +901,15 @@ class Build:
         logger.debug(f'    - Build 2:   {build_url_2}')
 
         if logs:
-            build_logs_1, _, success = self.rest.request(
-                f'{build_url_1.strip("/")}/consoleText', 'get', is_endpoint=False, json_content=False
-            )
-            if not success:
-                fail_out(f'Failed to fetch logs for build "{build_url_1}"')
-
-            build_logs_2, _, success = self.rest.request(
-                f'{build_url_2.strip("/")}/consoleText', 'get', is_endpoint=False, json_content=False
-            )
-            if not success:
-                fail_out(f'Failed to fetch logs for build "{build_url_2}"')
+            # Read through the log store, so logs of finished builds are only fetched once
+            build_logs = []
+            for build_url in [build_url_1, build_url_2]:
+                console_log = ConsoleLog(self.rest, build_url)
+                build_log = ''.join(ConsoleLog.decode(console_log.read()))
+                if not 200 <= console_log.status_code < 300:
+                    fail_out(f'Failed to fetch logs for build "{build_url}"')
+                build_logs.append(build_log)
+            build_logs_1, build_logs_2 = build_logs
 
             diff_show(
                 build_logs_1,
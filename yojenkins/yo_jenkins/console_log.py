@@ -0,0 +1,414 @@
+"""ConsoleLog class definition"""
+
+import codecs
+import logging
+import re
+import threading
+from collections import deque
+from collections.abc import Iterator
+from contextlib import closing
+from time import sleep
+from typing import Optional
+
+import requests
+
+from yojenkins.yo_jenkins.rest import STREAM_CHUNK_SIZE
+
+# Getting the logger reference
+logger = logging.getLogger()
+
+# Seconds between checks for new log output while following a log
+DEFAULT_FOLLOW_POLL_INTERVAL = 1.0
+# Factor the range read from the end of the log grows by until it holds the tail lines
+TAIL_RANGE_GROWTH = 4
+
+
+class ConsoleLog:
+    """Console text log of a build, read by byte offset
+
+    Details: Reads use HTTP `Range` requests, so only the requested bytes are transferred.
+             If the server ignores the range and sends the whole log, the bytes before the
+             offset are skipped while received, without holding them in memory.
+             Responses are requested without compression, since ranges refer to the log bytes.
+             If the server session has a log store, the log of a finished build is stored the first
+             time it is read in full, and read from the store instead of the server afterwards.
+    """
+
+    def __init__(self, rest, build_url: str, chunk_size: int = STREAM_CHUNK_SIZE) -> None:
+        """Object constructor method, called at object creation
+
+        Args:
+            rest       : Rest object of the server
+            build_url  : Full URL of the build
+            chunk_size : Number of bytes read from the server at a time
+
+        Returns:
+            None
+        """
+        self.rest = rest
+        self.build_url = build_url.strip('/')
+        self.log_url = f'{self.build_url}/consoleText'
+        self.chunk_size = chunk_size
+
+        # True if the server answered a range request with partial content, None if not yet known
+        self.range_supported: Optional[bool] = None
+        # Server response code of the last read, 0 if there was no response or it was not received in full
+        self.status_code = 0
+
+    def size(self) -> Optional[int]:
+        """Get the current number of bytes of the log
+
+        Returns:
+            Number of bytes, None if not known
+        """
+        _, headers, success = self.rest.request(
+            self.log_url, 'head', is_endpoint=False, headers={'Accept-Encoding': 'identity'}
+        )
+        if not success or 'Content-Length' not in headers:
+            logger.debug('Failed to get the console log size')
+            return None
+        return int(headers['Content-Length'])
+
+    def read(self, offset: int = 0) -> Iterator[bytes]:
+        """Read the log from a byte offset to its current end
+
+        Args:
+            offset : Number of log bytes to skip
+
+        Returns:
+            Iterator of byte chunks. Nothing is yielded if the log has no bytes past the offset
+        """
+        stored_chunks = self._stored()
+        if stored_chunks is not None:
+            self.status_code = 200
+            yield from _skip(stored_chunks, offset)
+            return
+
+        # Only the log of a finished build is stored, checked before it is read
+        store = not offset and self.rest.log_store is not None and not self._is_building()
+
+        headers = {'Accept-Encoding': 'identity'}
+        if offset:
+            headers['Range'] = f'bytes={offset}-'
+        chunks, response_headers, status_code = self.rest.request_bytes(
+            self.log_url, is_endpoint=False, headers=headers, chunk_size=self.chunk_size
+        )
+        self.status_code = status_code
+        if status_code == 416:
+            # Range starts at or past the end of the log
+            self.range_supported = True
+            return
+        if not 200 <= status_code < 300:
+            logger.debug(f'Failed to read console log from byte {offset}. Server code: {status_code}')
+            return
+        if not offset or status_code == 206:
+            if offset:
+                self.range_supported = True
+            if store:
+                content_length = response_headers.get('Content-Length', '')
+                expected_size = int(content_length) if content_length.isdigit() else None
+                chunks = self.rest.log_store.store(self.rest.username, self.log_url, chunks, expected_size)
+            yield from self._receive(chunks)
+            return
+
+        # Server ignored the range. Skip the bytes before the offset while receiving
+        if self.range_supported is not False:
+            logger.debug('Server does not support log byte ranges. Skipping to the offset while receiving ...')
+        self.range_supported = False
+        yield from _skip(self._receive(chunks), offset)
+
+    def tail(self, lines: int) -> Iterator[bytes]:
+        """Read the last lines of the log
+
+        Details: Growing byte ranges are read from the end of the log until they hold the lines,
+                 so only about the size of the lines is transferred and held in memory. If the
+                 server does not support ranges, or the log is stored, the whole log is streamed
+                 through a buffer holding only the last lines.
+
+        Args:
+            lines : Number of lines
+
+        Returns:
+            Iterator of byte chunks of the last lines
+        """
+        if lines <= 0:
+            return
+        chunks = self._stored()
+        stored = chunks is not None
+        if stored:
+            self.status_code = 200
+        elif self.range_supported is not False:
+            last_lines, chunks = self._tail_range(lines)
+            if last_lines is not None:
+                if last_lines:
+                    yield last_lines
+                return
+
+        # Stored, or the server ignored the range. Keep only the last lines while streaming the whole log
+        if not stored:
+            logger.debug(f'Server does not support log byte ranges. Keeping last {lines} lines while streaming ...')
+            self.range_supported = False
+        last_lines: deque = deque(maxlen=lines)
+        for line in _split_lines(chunks if chunks is not None else self.read()):
+            last_lines.append(line)
+        yield from last_lines
+
+    def tail_fraction(self, fraction: float) -> Iterator[bytes]:
+        """Read the last fraction of the lines of the log
+
+        Details: The log is streamed once, counting its lines while holding only the last
+                 fraction of the lines counted so far.
+
+        Args:
+            fraction : Fraction of the lines, between 0 and 1
+
+        Returns:
+            Iterator of the last lines
+        """
+        number_of_lines = 0
+        last_lines: deque = deque()
+        for line in _split_lines(self.read()):
+            number_of_lines += 1
+            last_lines.append(line)
+            while len(last_lines) > round(number_of_lines * fraction):
+                last_lines.popleft()
+        logger.debug(f'Read the last {len(last_lines)} of {number_of_lines} log lines')
+        yield from last_lines
+
+    def _tail_range(self, lines: int) -> tuple[Optional[bytes], Optional[Iterator[bytes]]]:
+        """Read the last lines of the log with growing byte ranges from the end of the log
+
+        Args:
+            lines : Number of lines
+
+        Returns:
+            The last lines (empty if the log is empty or failed to be read), or None if the server
+            ignored the range, with the byte chunks of the whole log it sent instead
+        """
+        window = self.chunk_size
+        while True:
+            chunks, headers, status_code = self.rest.request_bytes(
+                self.log_url,
+                is_endpoint=False,
+                headers={'Accept-Encoding': 'identity', 'Range': f'bytes=-{window}'},
+                chunk_size=self.chunk_size,
+            )
+            self.status_code = status_code
+            if status_code != 206 and 200 <= status_code < 300:
+                return None, chunks
+            if status_code == 416:
+                # Log is empty
+                self.range_supported = True
+                return b'', None
+            if status_code != 206:
+                logger.debug(f'Failed to read the end of the console log. Server code: {status_code}')
+                return b'', None
+
+            self.range_supported = True
+            content = b''.join(self._receive(chunks))
+            if not self.status_code:
+                return b'', None
+            content_range = re.match(r'bytes (\d+)-\d+/(\d+|\*)', headers.get('Content-Range', ''))
+            at_start = not content_range or content_range.group(1) == '0'
+            line_list = content.split(b'\n')
+            if content.endswith(b'\n'):
+                line_list.pop()
+            if at_start or len(line_list) > lines:
+                logger.debug(f'Read the last {lines} log lines from the last {len(content)} bytes')
+                return b'\n'.join(line_list[-lines:]) + (b'\n' if content.endswith(b'\n') else b''), None
+            window *= TAIL_RANGE_GROWTH
+
+    def lines(self, offset: int = 0) -> Iterator[bytes]:
+        """Read the log line by line
+
+        Args:
+            offset : Number of log bytes to skip
+
+        Returns:
+            Iterator of lines, each ending with a newline unless it is the last line of the log
+        """
+        return _split_lines(self.read(offset))
+
+    def grep(self, pattern: re.Pattern, stop: Optional[threading.Event] = None) -> Iterator[tuple[int, bytes]]:
+        """Search the log for lines matching a REGEX pattern, while streaming it
+
+        Details: Each received block of whole lines is searched at once, and only split into lines
+                 if it contains a match, so lines are neither decoded nor held unless they match.
+                 The pattern is compiled for bytes, with `re.MULTILINE` so that `^` and `$` match
+                 at each line.
+
+        Args:
+            pattern : Compiled REGEX bytes pattern
+            stop    : If given and set, the search stops at the next received chunk and the response is closed
+
+        Returns:
+            Iterator of line number (starting at 1) and matching line, without the line break
+        """
+        line_number = 0
+        partial = b''
+        with closing(self.read()) as chunks:
+            for chunk in chunks:
+                if stop is not None and stop.is_set():
+                    logger.debug(f'Stopped searching console log: {self.log_url}')
+                    return
+                block = partial + chunk
+                block_end = block.rfind(b'\n') + 1
+                block, partial = block[:block_end], block[block_end:]
+                if not block:
+                    continue
+                if not pattern.search(block):
+                    line_number += block.count(b'\n')
+                    continue
+                for line in block[:-1].split(b'\n'):
+                    line_number += 1
+                    if pattern.search(line):
+                        yield line_number, line
+        if partial and pattern.search(partial):
+            yield line_number + 1, partial
+
+    @staticmethod
+    def decode(chunks: Iterator[bytes]) -> Iterator[str]:
+        """Decode byte chunks of the log as they are read, keeping multi-byte characters split between chunks
+
+        Args:
+            chunks : Byte chunks of the log
+
+        Returns:
+            Iterator of log text
+        """
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        for chunk in chunks:
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+        text = decoder.decode(b'', final=True)
+        if text:
+            yield text
+
+    def follow(
+        self, offset: Optional[int] = None, poll_interval: float = DEFAULT_FOLLOW_POLL_INTERVAL
+    ) -> Iterator[str]:
+        """Follow the log while the build is running, yielding new log text as it is written
+
+        Details: Each poll only transfers the bytes written since the last one. When a poll finds
+                 no new bytes, the build is checked, and following stops once the build has finished.
+                 Following also stops if a poll fails without any new bytes, with its `status_code` kept.
+
+        Args:
+            offset        : Byte offset to start at. Default is the current end of the log, read through
+                            if the server does not report the log size
+            poll_interval : Seconds between checks for new log output
+
+        Returns:
+            Iterator of log text
+        """
+        offset = self._end_offset() if offset is None else offset
+        if offset is None:
+            logger.debug('Failed to find the end of the console log. Stopped following console log')
+            return
+        logger.debug(f'Following console log from byte {offset} at poll interval: {poll_interval}s ...')
+
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        build_finished = False
+        while True:
+            new_bytes = 0
+            for chunk in self.read(offset):
+                offset += len(chunk)
+                new_bytes += len(chunk)
+                text = decoder.decode(chunk)
+                if text:
+                    yield text
+            if new_bytes:
+                logger.debug(f'Read {new_bytes} new log bytes (Log size: {offset} bytes)')
+            elif self.status_code != 416 and not 200 <= self.status_code < 300:
+                logger.debug('Failed to read console log. Stopped following console log')
+                return
+            elif build_finished:
+                break
+            else:
+                # Read once more after the build finished, for any output written meanwhile
+                build_finished = not self._is_building()
+                if build_finished:
+                    continue
+            sleep(poll_interval)
+
+        text = decoder.decode(b'', final=True)
+        if text:
+            yield text
+        logger.debug('Build finished. Stopped following console log')
+
+    def _end_offset(self) -> Optional[int]:
+        """Get the byte offset of the current end of the log
+
+        Details: If the server does not report the log size, the log is read through without output
+
+        Returns:
+            Byte offset, None if the log failed to be read
+        """
+        size = self.size()
+        if size is not None:
+            return size
+        size = sum(len(chunk) for chunk in self.read())
+        if self.status_code != 416 and not 200 <= self.status_code < 300:
+            return None
+        return size
+
+    def _receive(self, chunks: Iterator[bytes]) -> Iterator[bytes]:
+        """Receive the byte chunks of a response, recording a failed read if the connection is lost
+
+        Args:
+            chunks : Byte chunks of the response
+
+        Returns:
+            Iterator of the byte chunks received
+        """
+        try:
+            yield from chunks
+        except requests.exceptions.RequestException as error:
+            logger.debug(f'Lost connection while reading console log. Exception: {error}')
+            self.status_code = 0
+
+    def _stored(self) -> Optional[Iterator[bytes]]:
+        """Read the log from the log store of the server session
+
+        Returns:
+            Iterator of log byte chunks, None if the log is not stored or there is no log store
+        """
+        if self.rest.log_store is None:
+            return None
+        return self.rest.log_store.read(self.rest.username, self.log_url, chunk_size=self.chunk_size)
+
+    def _is_building(self) -> bool:
+        """Check if the build is still running
+
+        Returns:
+            True if running or not known, else False
+        """
+        build_info, _, success = self.rest.request(
+            f'{self.build_url}/api/json', 'get', is_endpoint=False, fields=['building'], use_cache=False
+        )
+        if not success:
+            return True
+        return bool(build_info.get('building', True))
+
+
+def _skip(chunks: Iterator[bytes], offset: int) -> Iterator[bytes]:
+    """Skip a number of bytes of byte chunks"""
+    for chunk in chunks:
+        if offset >= len(chunk):
+            offset -= len(chunk)
+            continue
+        yield chunk[offset:] if offset else chunk
+        offset = 0
+
+
+def _split_lines(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """Split byte chunks into lines, each ending with a newline unless it is the last"""
+    partial = b''
+    for chunk in chunks:
+        chunk_lines = (partial + chunk).split(b'\n')
+        partial = chunk_lines.pop()
+        for line in chunk_lines:
+            yield line + b'\n'
+    if partial:
+        yield partial
@@ -0,0 +1,134 @@
+"""Crawler class definition"""
+
+import logging
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from time import perf_counter
+from typing import Optional
+
+from yojenkins.utility.utility import fail_out
+from yojenkins.yo_jenkins.jenkins_item_classes import JenkinsItemClasses
+
+# Getting the logger reference
+logger = logging.getLogger()
+
+# Default maximum number of folder requests in flight to the server at the same time
+CRAWLER_MAX_IN_FLIGHT = 16
+
+# Item fields requested for each folder level
+CRAWLER_FIELDS = ['jobs.name', 'jobs.url', 'jobs.fullName']
+CRAWLER_VIEW_FIELDS = ['views.name', 'views.url']
+
+
+class Crawler:
+    """Breadth-first crawler of the server folder tree
+
+    Details: All folders found on one level are requested concurrently, while the items
+             of each completed folder are already yielded. The number of requests in flight
+             to the server is capped.
+    """
+
+    def __init__(self, rest, max_in_flight: int = CRAWLER_MAX_IN_FLIGHT) -> None:
+        """Object constructor method, called at object creation
+
+        Args:
+            rest          : Rest object
+            max_in_flight : Maximum number of folder requests in flight at the same time
+
+        Returns:
+            None
+        """
+        self.rest = rest
+        self.max_in_flight = max(1, max_in_flight)
+
+        # Crawl statistics of the last crawl
+        self.folders_count = 0
+        self.items_count = 0
+        self.failed_count = 0
+
+    def _folder_items(self, folder_url: str, views: bool) -> Optional[tuple[list[dict], list[dict]]]:
+        """Request the items directly within a folder
+
+        Args:
+            folder_url : URL of the folder, server URL for the top level
+            views      : If True, also request the views of the folder
+
+        Returns:
+            List of jobs and list of views within the folder, None on failure
+        """
+        folder_info, _, success = self.rest.request(
+            f'{folder_url.strip("/")}/api/json',
+            'get',
+            is_endpoint=False,
+            fields=CRAWLER_FIELDS + CRAWLER_VIEW_FIELDS if views else CRAWLER_FIELDS,
+        )
+        if not success:
+            logger.debug(f'Failed to get folder items while crawling: {folder_url}')
+            return None
+        return folder_info.get('jobs', []), folder_info.get('views', [])
+
+    def crawl(self, folder_url: str = '', folder_depth: Optional[int] = None, views: bool = False) -> Iterator[dict]:
+        """Crawl the folder tree and yield every item found
+
+        Details: Each yielded item has at least the `_class`, `name`, `url`, and `fullName`
+                 keys. The `fullname` key is added to match the items of `jenkins_sdk.get_all_jobs()`.
+                 The `fullName` of a view is the full name of its folder joined with the view name.
+                 Fails out if the starting folder fails to be fetched. Sub-folders that fail to be
+                 fetched are skipped and counted in `failed_count`.
+
+        Args:
+            folder_url   : Folder to start crawling from. Default is the top level of the server
+            folder_depth : Number of sub-folder levels to crawl. 0 only crawls the top level. Default is no limit
+            views        : If True, also yield the views of each folder
+
+        Returns:
+            Iterator of items, in the order their folders are returned by the server
+        """
+        folder_url = folder_url or self.rest.get_server_url()
+        logger.debug(f'Crawling folder "{folder_url}" with depth {folder_depth} ({self.max_in_flight} in flight) ...')
+        start_time = perf_counter()
+        self.folders_count = 0
+        self.items_count = 0
+        self.failed_count = 0
+
+        executor = ThreadPoolExecutor(max_workers=self.max_in_flight)
+        pending: dict[Future, tuple[str, int]] = {}
+        try:
+            pending[executor.submit(self._folder_items, folder_url, views)] = ('', 0)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    parent_fullname, level = pending.pop(future)
+                    self.folders_count += 1
+                    folder_items = future.result()
+                    if folder_items is None:
+                        if not level:
+                            fail_out(f'Failed to get the items of folder: {folder_url}')
+                        self.failed_count += 1
+                        continue
+                    folder_jobs, folder_views = folder_items
+                    for item in folder_views:
+                        item['fullName'] = f'{parent_fullname}/{item["name"]}' if parent_fullname else item['name']
+                        item['fullname'] = item['fullName']
+                        yield item
+                    for item in folder_jobs:
+                        if 'fullName' not in item:
+                            item['fullName'] = f'{parent_fullname}/{item["name"]}' if parent_fullname else item['name']
+                        item['fullname'] = item['fullName']
+                        self.items_count += 1
+
+                        # Go into sub-folders until the depth limit
+                        if item.get('_class') in JenkinsItemClasses.FOLDER.value['class_type'] and (
+                            folder_depth is None or level < folder_depth
+                        ):
+                            next_folder = executor.submit(self._folder_items, item['url'], views)
+                            pending[next_folder] = (item['fullName'], level + 1)
+
+                        yield item
+        finally:
+            # Crawl may be abandoned by the caller before completion
+            executor.shutdown(wait=False, cancel_futures=True)
+            logger.debug(
+                f'Crawled {self.items_count} items in {self.folders_count} folders '
+                f'in {perf_counter() - start_time:.3f} seconds'
+            )
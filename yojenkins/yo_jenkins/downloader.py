@@ -0,0 +1,371 @@
+"""Downloader class definition"""
+
+import json
+import logging
+import os
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Optional
+
+from yojenkins.yo_jenkins.rest import STREAM_CHUNK_SIZE
+
+# Getting the logger reference
+logger = logging.getLogger()
+
+# Number of files, or parts of a file, downloaded at the same time
+DEFAULT_MAX_CONCURRENT = 4
+# Files larger than this many bytes are downloaded in parts of this size at the same time
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+# Bytes written between saves of the download progress
+PROGRESS_SAVE_BYTES = 1024 * 1024
+# Extension of the file being downloaded, and of its download progress
+PARTIAL_FILE_EXTENSION = '.part'
+PROGRESS_FILE_EXTENSION = '.part.json'
+
+
+class Downloader:
+    """Download engine for build logs and artifacts, using the server session and its connection pool
+
+    Details: A file is first written to `<file>.part`, and only renamed to its name once all bytes are
+             received and its size matches the size reported by the server. If the server reports the
+             size and supports byte ranges, files larger than `part_size` are split into parts that are
+             downloaded at the same time, each written at its offset of the preallocated file.
+             The bytes received of each part are saved in `<file>.part.json`, so that an interrupted
+             download continues where it stopped when run again, as long as the file on the server
+             has the same size, `ETag`, and `Last-Modified` time. If the server ignores a byte range,
+             the bytes before the range are skipped while received.
+    """
+
+    def __init__(
+        self,
+        rest,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        part_size: int = DEFAULT_PART_SIZE,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> None:
+        """Object constructor method, called at object creation
+
+        Args:
+            rest           : Rest object of the server
+            max_concurrent : Number of files, or parts of a file, downloaded at the same time
+            part_size      : Files larger than this many bytes are downloaded in parts
+            chunk_size     : Number of bytes read from the server at a time
+
+        Returns:
+            None
+        """
+        self.rest = rest
+        self.max_concurrent = max(1, max_concurrent)
+        self.part_size = max(chunk_size, part_size)
+        self.chunk_size = chunk_size
+
+        # Set when a download is interrupted, stopping all downloads of this downloader
+        self._stopped = threading.Event()
+
+    def download(self, url: str, file_path: str, max_concurrent: Optional[int] = None) -> bool:
+        """Download a file, continuing any earlier interrupted download of it
+
+        Args:
+            url            : Full URL of the file
+            file_path      : Local path of the downloaded file
+            max_concurrent : Number of parts downloaded at the same time. Default is `max_concurrent`
+
+        Returns:
+            True if downloaded, else False
+        """
+        size, ranges_supported, version = self._probe(url)
+        partial_path = file_path + PARTIAL_FILE_EXTENSION
+        progress_path = file_path + PROGRESS_FILE_EXTENSION
+        parts = self._load_progress(progress_path, partial_path, url, size, version)
+        if parts is None:
+            parts = self._new_parts(partial_path, size, ranges_supported)
+        else:
+            received = sum(part[2] for part in parts)
+            logger.debug(f'Continuing download of "{file_path}" from {received} of {size or "unknown"} bytes ...')
+
+        remaining = [part for part in parts if part[1] is None or part[2] < part[1] - part[0]]
+        concurrency = min(len(remaining), max_concurrent or self.max_concurrent) or 1
+        logger.debug(
+            f'Downloading "{url}" to "{file_path}" ({size or "unknown"} bytes) '
+            f'in {len(remaining)} of {len(parts)} parts, {concurrency} at a time ...'
+        )
+        progress = {'url': url, 'size': size, 'version': version, 'parts': parts}
+        progress_lock = threading.Lock()
+        download_part = partial(self._download_part, partial_path, progress_path, progress, progress_lock)
+        try:
+            if concurrency > 1:
+                self.rest.pool.request_concurrency(concurrency)
+            results = self._run_all(download_part, remaining, concurrency)
+        finally:
+            with progress_lock:
+                _save_progress(progress_path, progress)
+
+        if not all(results):
+            if any(part[2] for part in parts):
+                logger.debug(f'Failed to download "{url}". Partial download kept in "{partial_path}"')
+            else:
+                logger.debug(f'Failed to download "{url}"')
+                _remove(partial_path, progress_path)
+            return False
+        return self._finish(url, file_path, size, parts)
+
+    def download_many(self, downloads: list[tuple[str, str]]) -> list[bool]:
+        """Download multiple files at the same time
+
+        Details: The number of files downloaded at the same time and the number of parts of
+                 each file together stay within `max_concurrent`
+
+        Args:
+            downloads : Full URL and local file path of each file
+
+        Returns:
+            True for each downloaded file, else False
+        """
+        if not downloads:
+            return []
+        concurrency = min(len(downloads), self.max_concurrent)
+        part_concurrency = max(1, self.max_concurrent // concurrency)
+        logger.debug(f'Downloading {len(downloads)} files, {concurrency} at a time ...')
+        self.rest.pool.request_concurrency(self.max_concurrent)
+        return self._run_all(
+            lambda download: self.download(*download, max_concurrent=part_concurrency), downloads, concurrency
+        )
+
+    def _run_all(self, function: Callable, items: list, concurrency: int) -> list:
+        """Call a function for each item, a number of them at the same time
+
+        Details: If interrupted (ie. CTRL-C), calls not yet started are cancelled, and running
+                 downloads stop after their current chunk, keeping their progress
+
+        Args:
+            function    : Function called with each item
+            items       : Items
+            concurrency : Number of calls at the same time
+
+        Returns:
+            Results of the calls, in the order of the items
+        """
+        if concurrency <= 1:
+            return [function(item) for item in items]
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            return list(executor.map(function, items))
+        except BaseException:
+            logger.debug('Download interrupted. Stopping all downloads ...')
+            self._stopped.set()
+            raise
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _probe(self, url: str) -> tuple[Optional[int], bool, str]:
+        """Get the size and version of a file, and whether the server supports byte ranges of it
+
+        Args:
+            url : Full URL of the file
+
+        Returns:
+            Number of bytes (None if not known), True if byte ranges are supported,
+            and the `ETag` and `Last-Modified` headers of the file (empty if not known)
+        """
+        _, headers, success = self.rest.request(
+            url, 'head', is_endpoint=False, headers={'Accept-Encoding': 'identity'}, use_cache=False
+        )
+        if not success:
+            logger.debug(f'Failed to get the size of "{url}"')
+            return None, False, ''
+        size = int(headers['Content-Length']) if str(headers.get('Content-Length', '')).isdigit() else None
+        version = f'{headers.get("ETag", "")} {headers.get("Last-Modified", "")}'.strip()
+        return size, headers.get('Accept-Ranges', '').lower() == 'bytes', version
+
+    def _download_part(
+        self,
+        partial_path: str,
+        progress_path: str,
+        progress: dict,
+        progress_lock: threading.Lock,
+        part: list,
+    ) -> bool:
+        """Download a byte range of a file, writing it at its offset of the partial file
+
+        Args:
+            partial_path  : Local path of the partial file
+            progress_path : Local path of the download progress
+            progress      : Download progress, saved while received, holding the full URL of the file
+            progress_lock : Lock of the download progress
+            part          : First byte, byte after the last byte (None if not known), and bytes received
+
+        Returns:
+            True if all bytes of the part are received, else False
+        """
+        if self._stopped.is_set():
+            return False
+        url = progress['url']
+        start, end, _ = part
+        offset = start + part[2]
+        headers = {'Accept-Encoding': 'identity'}
+        if offset or (end is not None and end < (progress['size'] or 0)):
+            headers['Range'] = f'bytes={offset}-{"" if end is None else end - 1}'
+        chunks, _, status_code = self.rest.request_bytes(
+            url, is_endpoint=False, headers=headers, chunk_size=self.chunk_size
+        )
+        if status_code == 416 and end is None:
+            # Nothing past the offset
+            return True
+        if not 200 <= status_code < 300:
+            logger.debug(f'Failed to download bytes {offset}-{end or ""} of "{url}". Server code: {status_code}')
+            return False
+
+        # Server ignored the range. Skip the bytes before the offset while receiving
+        skip = offset if status_code != 206 else 0
+        length = None if end is None else end - offset
+        unsaved = 0
+        with open(partial_path, 'r+b') as partial_file:
+            partial_file.seek(offset)
+            try:
+                for data in _range_bytes(chunks, skip, length):
+                    if self._stopped.is_set():
+                        logger.debug(f'Stopped downloading bytes {offset}-{end or ""} of "{url}"')
+                        break
+                    partial_file.write(data)
+                    part[2] += len(data)
+                    unsaved += len(data)
+                    if unsaved >= PROGRESS_SAVE_BYTES:
+                        partial_file.flush()
+                        with progress_lock:
+                            _save_progress(progress_path, progress)
+                        unsaved = 0
+            except Exception as error:
+                logger.debug(f'Failed while downloading bytes {offset}-{end or ""} of "{url}". Exception: {error}')
+                return False
+            finally:
+                chunks.close()
+
+        if self._stopped.is_set():
+            return False
+        return end is None or part[2] == end - start
+
+    def _new_parts(self, partial_path: str, size: Optional[int], ranges_supported: bool) -> list:
+        """Split a file into the parts downloaded at the same time, and create its partial file
+
+        Args:
+            partial_path     : Local path of the partial file
+            size             : Number of bytes of the file, None if not known
+            ranges_supported : If True, the server supports byte ranges of the file
+
+        Returns:
+            Parts of the file
+        """
+        if size is not None and ranges_supported and size > self.part_size:
+            parts = [[start, min(start + self.part_size, size), 0] for start in range(0, size, self.part_size)]
+        else:
+            parts = [[0, size, 0]]
+        os.makedirs(os.path.dirname(os.path.abspath(partial_path)), exist_ok=True)
+        with open(partial_path, 'wb') as partial_file:
+            if size:
+                _preallocate(partial_file, size)
+        return parts
+
+    @staticmethod
+    def _finish(url: str, file_path: str, size: Optional[int], parts: list) -> bool:
+        """Verify the size of a downloaded file and give the partial file its name
+
+        Args:
+            url       : Full URL of the file
+            file_path : Local path of the downloaded file
+            size      : Number of bytes of the file on the server, None if not known
+            parts     : Parts of the file
+
+        Returns:
+            True if the size matches, else False
+        """
+        partial_path = file_path + PARTIAL_FILE_EXTENSION
+        progress_path = file_path + PROGRESS_FILE_EXTENSION
+        received = sum(part[2] for part in parts)
+        file_size = os.path.getsize(partial_path)
+        if received != file_size or size not in [None, received]:
+            logger.debug(
+                f'Downloaded size of "{url}" ({received} bytes) does not match '
+                f'file size ({file_size} bytes) or server size ({size or "unknown"} bytes)'
+            )
+            _remove(partial_path, progress_path)
+            return False
+
+        os.replace(partial_path, file_path)
+        _remove(progress_path)
+        logger.debug(f'Successfully downloaded "{file_path}" ({received} bytes)')
+        return True
+
+    @staticmethod
+    def _load_progress(
+        progress_path: str, partial_path: str, url: str, size: Optional[int], version: str
+    ) -> Optional[list]:
+        """Load the progress of an earlier interrupted download of the same file
+
+        Details: Only continued if the server reports the size and the version of the file, since
+                 the partial download cannot be checked against the file on the server otherwise
+
+        Args:
+            progress_path : Local path of the download progress
+            partial_path  : Local path of the partial file
+            url           : Full URL of the file
+            size          : Number of bytes of the file, None if not known
+            version       : `ETag` and `Last-Modified` headers of the file, empty if not known
+
+        Returns:
+            Parts of the file, None if there is no earlier download to continue
+        """
+        try:
+            with open(progress_path, encoding='utf-8') as progress_file:
+                progress = json.load(progress_file)
+        except (OSError, ValueError):
+            return None
+        if size is None or not version:
+            logger.debug('File on the server has no known size or version. Not continuing earlier partial download')
+            return None
+        earlier_file = (progress.get('url'), progress.get('size'), progress.get('version', ''))
+        if not os.path.isfile(partial_path) or earlier_file != (url, size, version):
+            logger.debug('Earlier partial download does not match the file on the server. Downloading again ...')
+            return None
+        return progress.get('parts') or None
+
+
+def _range_bytes(chunks: Iterator[bytes], skip: int, length: Optional[int]) -> Iterator[bytes]:
+    """Skip a number of bytes of byte chunks, and stop after a number of bytes (None for all bytes)"""
+    for chunk in chunks:
+        data = chunk[skip:] if skip else chunk
+        skip = max(0, skip - len(chunk))
+        if length is not None:
+            data = data[:length]
+            length -= len(data)
+        if data:
+            yield data
+        if length == 0:
+            return
+
+
+def _preallocate(file, size: int) -> None:
+    """Reserve the disk space of a file before it is written, so it is not fragmented or left short of space"""
+    try:
+        os.posix_fallocate(file.fileno(), 0, size)
+    except (AttributeError, OSError):
+        file.truncate(size)
+
+
+def _save_progress(progress_path: str, progress: dict) -> None:
+    """Save the download progress of a file"""
+    try:
+        with open(progress_path, 'w', encoding='utf-8') as progress_file:
+            json.dump(progress, progress_file)
+    except OSError as error:
+        logger.debug(f'Failed to save download progress. Exception: {error}')
+
+
+def _remove(*paths: str) -> None:
+    """Remove files, if they exist"""
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -2,24 +2,29 @@
 
 import json
 import logging
-import re
+from collections.abc import Iterator
 from time import perf_counter
+from typing import Optional
 
 import xmltodict
 
 from yojenkins.utility import utility
 from yojenkins.utility.utility import fail_out
+from yojenkins.yo_jenkins.item_index import ItemIndex
 from yojenkins.yo_jenkins.jenkins_item_classes import JenkinsItemClasses
 from yojenkins.yo_jenkins.jenkins_item_config import JenkinsItemConfig
 
 # Getting the logger reference
 logger = logging.getLogger()
 
+# Folder information fields listing the items within the folder
+FOLDER_ITEMS_FIELDS = ['jobs.name', 'jobs.url', 'jobs.color', 'views.name', 'views.url']
+
 
 class Folder:
     """TODO Folder"""
 
-    def __init__(self, rest, JenkinsSDK) -> None:
+    def __init__(self, rest, JenkinsSDK, item_index: Optional[ItemIndex] = None) -> None:
         """Object constructor method, called at object creation
 
         Args:
@@ -30,59 +35,70 @@ class Folder:
         """
         self.rest = rest
         self.jenkins_sdk = JenkinsSDK
+        self.item_index = item_index if item_index else ItemIndex(rest)
 
         # Recursive search results
         self.search_results = []
         self.search_items_count = 0
 
-    def __recursive_search(self, search_pattern: str, search_list: list, level: int, fullname: bool = True) -> None:
-        """Recursive search method for folders
+    def search_iter(
+        self,
+        search_pattern: str,
+        folder_name: str = '',
+        folder_url: str = '',
+        folder_depth: int = 4,
+        fullname: bool = True,
+        *,
+        refresh: bool = False,
+    ) -> Iterator[dict]:
+        """Search the server for folders matching REGEX pattern, yielding each folder as soon as it is found
 
-        Details: Matched pattern findings are storred in the object: `self.search_results`
+        Details: Folders are searched in the local item index. Each folder is only yielded once.
 
         Args:
-            search_pattern : REGEX pattern to match for each item
-            search_list    : List of items
-            level          : Current recursion level
+            search_pattern : REGEX search pattern to match
+            folder_name    : (Optional) Only look within this folder for matching sub-folder using item name
+            folder_url     : (Optional) Only look within this folder for matching sub-folder using item URL
+            folder_depth   : Number of levels to look through
             fullname       : Search the entire path of the item, not just the item name
+            refresh        : If True, refresh the item index before searching
 
         Returns:
-            None
+            Iterator of matching folder items
         """
-        # Current directory level
-        level += 1
-
-        # Loop through all sub-folders
-        for list_item in search_list:
-            # print(level, "   " * level, list_item['name'])
-
-            # Check if folder
-            if list_item['_class'] in JenkinsItemClasses.FOLDER.value['class_type']:
-                # Get fullname if specified and available, else get name
-                if fullname:
-                    dict_key = 'fullname' if 'fullname' in list_item else 'name'
-                else:
-                    dict_key = 'name'
-
-                # Match the regex pattern
-                try:
-                    if re.search(search_pattern, list_item[dict_key], re.IGNORECASE):
-                        self.search_results.append(list_item)
-                except re.error as error:
-                    logger.debug(
-                        f'Error while applying REGEX pattern "{search_pattern}" to "{list_item[dict_key]}". Exception: {error}'
-                    )
-                    break
-
-            # Count items searched for record
-            self.search_items_count += 1
-
-            # Check if the item has subitems
-            if 'jobs' not in list_item:
+        logger.debug(f'Folder search pattern: {search_pattern}')
+
+        # Get all the jobs
+        if folder_name or folder_url:
+            # Only search the specified folder
+            logger.debug(f'Searching folder in sub-folder "{folder_name if folder_name else folder_url}"')
+            logger.debug('Folder depth does not apply. Only looking in this specific folder for subfolders')
+            folder_url = folder_url if folder_url else self.item_index.name_to_url(folder_name)
+            folder_depth = None
+        else:
+            # Search entire Jenkins
+            logger.debug(f'Searching folder in ALL Jenkins. Folder depth: "{folder_depth}"')
+
+        # Bring the searched part of the local item index up to date if needed
+        refresh_depth = 0 if folder_url else folder_depth
+        if refresh or self.item_index.is_stale(folder_url, refresh_depth):
+            self.item_index.refresh(folder_url, refresh_depth)
+
+        # Search the item index for any matching folders, skipping duplicates
+        found_urls = set()
+        for item in self.item_index.search(
+            search_pattern,
+            JenkinsItemClasses.FOLDER.value['class_type'],
+            folder_url=folder_url,
+            folder_depth=folder_depth,
+            fullname=fullname,
+        ):
+            if item['url'] in found_urls:
                 continue
+            found_urls.add(item['url'])
+            yield item
 
-            # Keep searching all sub-items for this item. Call itself for some recursion fun
-            self.__recursive_search(search_pattern, list_item['jobs'], level, fullname)
+        self.search_items_count = self.item_index.searched_count
 
     def search(
         self,
@@ -91,6 +107,8 @@ class Folder:
         folder_url: str = '',
         folder_depth: int = 4,
         fullname: bool = True,
+        *,
+        refresh: bool = False,
     ) -> tuple[list, list]:
         """Search the server for folders matching REGEX pattern
 
@@ -100,38 +118,21 @@ class Folder:
             folder_url     : (Optional) Only look within this folder for matching sub-folder using item URL
             folder_depth   : Number of levels to look through
             fullname       : Search the entire path of the item, not just the item name
+            refresh        : If True, refresh the item index before searching
 
         Returns:
             List of folder found. Both, list of info and list of folder URLs
         """
         # Start a timer to time the search
         start_time = perf_counter()
-        logger.debug(f'Folder search pattern: {search_pattern}')
-
-        # Get all the jobs
-        if folder_name or folder_url:
-            # Only recursively search the specified folder name
-            logger.debug(f'Searching folder in sub-folder "{folder_name if folder_name else folder_url}"')
-            logger.debug('Folder depth does not apply. Only looking in this specific folder for subfolders')
-            items = self.item_list(folder_name=folder_name, folder_url=folder_url)[0]
-        else:
-            # Search entire Jenkins
-            logger.debug(f'Searching folder in ALL Jenkins. Folder depth: "{folder_depth}"')
-            items = self.jenkins_sdk.get_all_jobs(folder_depth=folder_depth, folder_depth_per_request=20)
 
-        # Search for any matching folders ("jobs")
         self.search_items_count = 0
-        self.search_results = []
-        self.__recursive_search(search_pattern=search_pattern, search_list=items, level=0, fullname=fullname)
-
-        # Remove duplicates from list (THANKS GeeksForGeeks.org)
-        logger.debug('Removing duplicates if needed ...')
-        self.search_results = [i for n, i in enumerate(self.search_results) if i not in self.search_results[n + 1 :]]
+        self.search_results = list(
+            self.search_iter(search_pattern, folder_name, folder_url, folder_depth, fullname, refresh=refresh)
+        )
 
         # Collect URLs only
-        folder_search_results_list = []
-        for search_result in self.search_results:
-            folder_search_results_list.append(search_result['url'])
+        folder_search_results_list = [search_result['url'] for search_result in self.search_results]
 
         # Output search stats
         logger.debug(
@@ -140,12 +141,13 @@ class Folder:
 
         return self.search_results, folder_search_results_list
 
-    def info(self, folder_name: str = '', folder_url: str = '') -> dict:
+    def info(self, folder_name: str = '', folder_url: str = '', fields: Optional[list[str]] = None) -> dict:
         """Get the folder information
 
         Args:
             folder_name : Folder name to get folder information of
             folder_url  : Folder URL to get the folder information of
+            fields      : Only get these fields, nested with a dot (ie. `jobs.name`). Default is all fields
 
         Returns:
             Folder information
@@ -154,10 +156,10 @@ class Folder:
             fail_out('Failed to get folder information. No folder name or folder url received')
 
         if folder_name and not folder_url:
-            folder_url = utility.name_to_url(self.rest.get_server_url(), folder_name)
+            folder_url = self.item_index.name_to_url(folder_name)
 
         folder_info, _, success = self.rest.request(
-            folder_url.strip('/') + '/api/json', request_type='get', is_endpoint=False
+            folder_url.strip('/') + '/api/json', request_type='get', is_endpoint=False, fields=fields
         )
         if not success:
             fail_out(f'Failed to find folder info: {folder_url}')
@@ -184,7 +186,7 @@ class Folder:
         logger.debug(f'Getting subfolders for folder name "{folder_name if folder_name else folder_url}" ...')
 
         # Get the folder information
-        folder_info = self.info(folder_name=folder_name, folder_url=folder_url)
+        folder_info = self.info(folder_name=folder_name, folder_url=folder_url, fields=FOLDER_ITEMS_FIELDS)
 
         # Extract lists
         sub_folder_list, sub_folder_list_url = utility.item_subitem_list(
@@ -212,7 +214,7 @@ class Folder:
         logger.debug(f'Getting jobs for folder name "{folder_name if folder_name else folder_url}" ...')
 
         # Get the folder information
-        folder_info = self.info(folder_name=folder_name, folder_url=folder_url)
+        folder_info = self.info(folder_name=folder_name, folder_url=folder_url, fields=FOLDER_ITEMS_FIELDS)
 
         # Extract lists
         job_list, job_list_url = utility.item_subitem_list(
@@ -238,7 +240,7 @@ class Folder:
             List of views, information list and URL list
         """
         # Get the folder information
-        folder_info = self.info(folder_name=folder_name, folder_url=folder_url)
+        folder_info = self.info(folder_name=folder_name, folder_url=folder_url, fields=FOLDER_ITEMS_FIELDS)
 
         logger.debug(f'Getting all view items for folder "{folder_name if folder_name else folder_url}" ...')
         view_list, view_list_url = utility.item_subitem_list(
@@ -268,7 +270,7 @@ class Folder:
         logger.debug(f'Getting items for folder "{folder_name if folder_name else folder_url}" ...')
 
         # Get the folder information
-        folder_info = self.info(folder_name=folder_name, folder_url=folder_url)
+        folder_info = self.info(folder_name=folder_name, folder_url=folder_url, fields=FOLDER_ITEMS_FIELDS)
 
         # Getting all possible Jenkins items listed enum
         all_subitems = [subitem.value for subitem in JenkinsItemClasses]
@@ -312,7 +314,7 @@ class Folder:
         if folder_url:
             folder_url = folder_url.strip('/')
         else:
-            folder_url = utility.name_to_url(self.rest.get_server_url(), folder_name)
+            folder_url = self.item_index.name_to_url(folder_name)
 
         logger.debug(f'Opening folder in web browser: "{folder_url}" ...')
         success = utility.browser_open(url=folder_url)
@@ -350,7 +352,7 @@ class Folder:
         if folder_url:
             folder_url = folder_url.strip('/')
         else:
-            folder_url = utility.name_to_url(self.rest.get_server_url(), folder_name)
+            folder_url = self.item_index.name_to_url(folder_name)
 
         logger.debug(f'Fetching XML configurations for folder: "{folder_url}" ...')
         return_content, _, success = self.rest.request(
@@ -390,7 +392,7 @@ class Folder:
         if folder_url:
             folder_url = folder_url.strip('/')
         else:
-            folder_url = utility.name_to_url(self.rest.get_server_url(), folder_name)
+            folder_url = self.item_index.name_to_url(folder_name)
 
         if not name:
             fail_out('The item name is a blank')
@@ -474,7 +476,7 @@ class Folder:
         if folder_url:
             folder_url = folder_url.strip('/')
         else:
-            folder_url = utility.name_to_url(self.rest.get_server_url(), folder_name)
+            folder_url = self.item_index.name_to_url(folder_name)
 
         if not original_name:
             fail_out('The original folder name is a blank')
@@ -517,7 +519,7 @@ class Folder:
         if folder_url:
             folder_url = folder_url.strip('/')
         else:
-            folder_url = utility.name_to_url(self.rest.get_server_url(), folder_name)
+            folder_url = self.item_index.name_to_url(folder_name)
 
         logger.debug(f'Deleting folder: "{folder_url}" ...')
         success = self.rest.request(f'{folder_url.strip("/")}/doDelete', 'post', is_endpoint=False)[2]
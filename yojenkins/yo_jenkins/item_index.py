@@ -0,0 +1,649 @@
+"""ItemIndex class definition"""
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+from collections import Counter
+from collections.abc import Iterator
+from pathlib import Path
+from time import perf_counter, time
+from typing import Optional
+
+import click
+
+try:
+    import re._parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
+from yojenkins.utility import utility
+from yojenkins.yo_jenkins.crawler import Crawler
+from yojenkins.yo_jenkins.jenkins_item_classes import JenkinsItemClasses
+
+# Getting the logger reference
+logger = logging.getLogger()
+
+# TODO: Find centralized location for these static values
+CONFIG_DIR_NAME = '.yojenkins'
+INDEX_DIR_NAME = 'index'
+
+# Seconds after which the index is refreshed with a new crawl of the server
+DEFAULT_INDEX_MAX_AGE = 3600
+
+# Number of crawled items written to the index per transaction
+INDEX_WRITE_BATCH_SIZE = 500
+# Number of indexed items read from the index at a time while searching
+INDEX_READ_BATCH_SIZE = 500
+
+# Number of closest matching items suggested for a mistyped name
+SUGGESTION_LIMIT = 5
+# Minimum trigram similarity (0 to 1) of a suggested item
+SUGGESTION_MIN_SCORE = 0.3
+# Number of items with the most shared trigrams that are ranked for suggestions
+SUGGESTION_CANDIDATES = 50
+# Number of least common trigrams of a name used to find suggestion candidates
+SUGGESTION_TRIGRAMS = 8
+# Number of least common trigrams of a REGEX pattern literal used to prefilter search candidates
+SEARCH_PREFILTER_TRIGRAMS = 3
+
+
+class ItemIndex:
+    """Local index of all folders, jobs, and views on the server
+
+    Details: The index is a SQLite database per server and user. It is populated by a full crawl
+             of the server and refreshed by crawling again, updating changed items and removing
+             items that are no longer on the server.
+    """
+
+    def __init__(
+        self, rest, crawler: Optional[Crawler] = None, index_dir: str = '', max_age: float = DEFAULT_INDEX_MAX_AGE
+    ) -> None:
+        """Object constructor method, called at object creation
+
+        Args:
+            rest      : Rest object
+            crawler   : Crawler object used to populate the index. Default is a new crawler
+            index_dir : Directory holding the index databases. Default is `~/.yojenkins/index`
+            max_age   : Seconds after which the index is considered stale
+
+        Returns:
+            None
+        """
+        self.rest = rest
+        self.crawler = crawler if crawler else Crawler(rest)
+        self.index_dir = index_dir or os.path.join(Path.home(), CONFIG_DIR_NAME, INDEX_DIR_NAME)
+        self.max_age = max_age
+
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._namespace = ''
+
+        # Number of items looked at in the last search
+        self.searched_count = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the index database of the current server and user, creating it if needed
+
+        Details: If the index file cannot be opened, an in-memory index is used for this session
+
+        Args:
+            None
+
+        Returns:
+            Database connection
+        """
+        namespace = f'{self.rest.username}@{self.rest.get_server_url().strip("/")}'
+        if self._connection and namespace == self._namespace:
+            return self._connection
+
+        index_filename = hashlib.sha256(namespace.encode('utf-8')).hexdigest()[:32] + '.sqlite'
+        index_filepath = os.path.join(self.index_dir, index_filename)
+        try:
+            os.makedirs(self.index_dir, mode=0o700, exist_ok=True)
+            logger.debug(f'Opening item index for "{namespace}": {index_filepath}')
+            connection = sqlite3.connect(index_filepath, timeout=10, check_same_thread=False)
+            os.chmod(index_filepath, 0o600)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute('PRAGMA cache_size=-65536')
+        except (sqlite3.Error, OSError) as error:
+            logger.debug(f'Failed to open item index file. Using in-memory index. Exception: {error}')
+            connection = sqlite3.connect(':memory:', check_same_thread=False)
+
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS items (
+                kind TEXT NOT NULL,
+                fullname TEXT NOT NULL,
+                name TEXT NOT NULL,
+                parent TEXT NOT NULL,
+                depth INTEGER NOT NULL,
+                class TEXT,
+                url TEXT NOT NULL,
+                crawl_id INTEGER NOT NULL,
+                PRIMARY KEY (kind, fullname)
+            )
+            """
+        )
+        connection.execute('CREATE INDEX IF NOT EXISTS items_parent ON items (parent)')
+        connection.execute('CREATE INDEX IF NOT EXISTS items_url ON items (url)')
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS trigrams (
+                trigram TEXT NOT NULL,
+                item INTEGER NOT NULL,
+                PRIMARY KEY (trigram, item)
+            ) WITHOUT ROWID
+            """
+        )
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS trigram_counts '
+            '(trigram TEXT PRIMARY KEY, count INTEGER NOT NULL) WITHOUT ROWID'
+        )
+        connection.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+
+        # Index created before trigrams were added
+        if not connection.execute('SELECT 1 FROM trigrams LIMIT 1').fetchone():
+            self._add_trigrams(connection, connection.execute('SELECT rowid, fullname FROM items').fetchall())
+        connection.commit()
+
+        self._connection = connection
+        self._namespace = namespace
+        return self._connection
+
+    @staticmethod
+    def _trigrams(text: str, padded: bool = True) -> set[str]:
+        """Get all three character sequences of a text, case insensitive
+
+        Args:
+            text   : Text to split up
+            padded : If True, pad the text with spaces to also get the sequences at its start and end
+
+        Returns:
+            Set of trigrams
+        """
+        text = text.lower()
+        if padded:
+            text = f'  {text} '
+        return {text[i : i + 3] for i in range(len(text) - 2)}
+
+    def _add_trigrams(self, connection: sqlite3.Connection, items: list[tuple[int, str]]) -> None:
+        """Add the full name trigrams of new items to the trigram index
+
+        Args:
+            connection : Database connection
+            items      : List of row ID and full name of each item
+
+        Returns:
+            None
+        """
+        # Inserting in key order is considerably faster for large batches
+        rows = sorted((trigram, item_id) for item_id, fullname in items for trigram in self._trigrams(fullname))
+        connection.executemany('INSERT OR IGNORE INTO trigrams (trigram, item) VALUES (?, ?)', rows)
+        connection.executemany(
+            'INSERT INTO trigram_counts (trigram, count) VALUES (?, ?) '
+            'ON CONFLICT (trigram) DO UPDATE SET count = count + excluded.count',
+            Counter(row[0] for row in rows).items(),
+        )
+
+    def _remove_trigrams(self, connection: sqlite3.Connection, items: list[tuple[int, str]]) -> None:
+        """Remove the full name trigrams of removed items from the trigram index
+
+        Args:
+            connection : Database connection
+            items      : List of row ID and full name of each item
+
+        Returns:
+            None
+        """
+        rows = [(trigram, item_id) for item_id, fullname in items for trigram in self._trigrams(fullname)]
+        connection.executemany('DELETE FROM trigrams WHERE trigram = ? AND item = ?', rows)
+        connection.executemany(
+            'UPDATE trigram_counts SET count = MAX(count - ?, 0) WHERE trigram = ?',
+            ((count, trigram) for trigram, count in Counter(row[0] for row in rows).items()),
+        )
+
+    @staticmethod
+    def _rarest_trigrams(connection: sqlite3.Connection, trigrams: set[str]) -> list[tuple[str, int]]:
+        """Order trigrams by the number of indexed items containing them, least common first
+
+        Args:
+            connection : Database connection
+            trigrams   : Trigrams to order
+
+        Returns:
+            List of trigram and number of items containing it
+        """
+        # SQLite limits the number of query parameters
+        trigram_list = sorted(trigrams)[:900]
+        counts = dict(
+            connection.execute(
+                f'SELECT trigram, count FROM trigram_counts WHERE trigram IN ({",".join("?" * len(trigram_list))})',
+                trigram_list,
+            ).fetchall()
+        )
+        return sorted(((trigram, counts.get(trigram, 0)) for trigram in trigram_list), key=lambda pair: pair[1])
+
+    @staticmethod
+    def _regex_literal(search_pattern: str) -> str:
+        """Get the longest literal text that any match of a REGEX pattern must contain
+
+        Args:
+            search_pattern : REGEX pattern
+
+        Returns:
+            Longest required literal text, empty string if there is none
+        """
+        try:
+            parsed_pattern = sre_parse.parse(search_pattern)
+        except (re.error, OverflowError, RecursionError):
+            return ''
+
+        # Only consecutive literals at the top level are always part of a match
+        longest_literal = current_literal = ''
+        for op_code, argument in parsed_pattern:
+            if op_code == sre_parse.LITERAL:
+                current_literal += chr(argument)
+                continue
+            longest_literal = max(longest_literal, current_literal, key=len)
+            current_literal = ''
+        longest_literal = max(longest_literal, current_literal, key=len)
+
+        # Case insensitive matching of non-ASCII text does not always follow lower casing
+        return longest_literal if longest_literal.isascii() else ''
+
+    @staticmethod
+    def _item_kind(item_class: str) -> str:
+        """Get the kind of index item from the item class
+
+        Args:
+            item_class : Jenkins class of the item
+
+        Returns:
+            Kind of item, `folder`, `view`, or `job`
+        """
+        if item_class in JenkinsItemClasses.FOLDER.value['class_type']:
+            return 'folder'
+        if item_class in JenkinsItemClasses.VIEW.value['class_type']:
+            return 'view'
+        return 'job'
+
+    @staticmethod
+    def _refresh_key(folder_fullname: str = '', folder_depth: Optional[int] = None) -> str:
+        """Get the key of the time of the last refresh of a part of the server
+
+        Args:
+            folder_fullname : Full name of the refreshed folder. Empty for the entire server
+            folder_depth    : Number of refreshed sub-folder levels. None for all levels
+
+        Returns:
+            Key of the refresh time
+        """
+        if not folder_fullname and folder_depth is None:
+            return 'last_refresh'
+        return f'last_refresh:{folder_fullname}:{"" if folder_depth is None else folder_depth}'
+
+    def last_refresh(self, folder_url: str = '', folder_depth: Optional[int] = None) -> Optional[float]:
+        """Get the time of the last refresh of the index covering a part of the server
+
+        Args:
+            folder_url   : Folder of the refresh. Default is the entire server
+            folder_depth : Number of sub-folder levels of the refresh. Default is all levels
+
+        Returns:
+            Time of the last full refresh, or of the last refresh of this part, whichever is later,
+            in seconds since epoch. None if never refreshed
+        """
+        folder_fullname = utility.url_to_name(folder_url) if folder_url else ''
+        keys = {self._refresh_key(), self._refresh_key(folder_fullname, folder_depth)}
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(f'SELECT value FROM meta WHERE key IN ({",".join("?" * len(keys))})', tuple(keys))
+                .fetchall()
+            )
+        return max(float(row[0]) for row in rows) if rows else None
+
+    def is_stale(self, folder_url: str = '', folder_depth: Optional[int] = None) -> bool:
+        """Check if the index needs to be refreshed
+
+        Args:
+            folder_url   : Only check the items within this folder. Default is the entire server
+            folder_depth : Only check the items up to this many sub-folder levels deep. Default is all levels
+
+        Returns:
+            True if the index was never refreshed or is older than the maximum age, else False
+        """
+        last_refresh = self.last_refresh(folder_url, folder_depth)
+        if last_refresh is None:
+            logger.debug('Item index was never populated')
+            return True
+        age = time() - last_refresh
+        logger.debug(f'Item index age: {age:.0f} seconds (Max age: {self.max_age} seconds)')
+        return age > self.max_age
+
+    def refresh(self, folder_url: str = '', folder_depth: Optional[int] = None) -> int:
+        """Crawl the server and update the index
+
+        Details: Crawled items are written as they arrive and committed together at the end.
+                 Items within the crawled folder and depth that were not found by the crawl are removed
+                 from the index, unless a folder failed to be crawled.
+
+        Args:
+            folder_url   : Only refresh the items within this folder. Default is the entire server
+            folder_depth : Only refresh the items up to this many sub-folder levels deep. Default is all levels
+
+        Returns:
+            Number of items crawled
+        """
+        start_time = perf_counter()
+        crawl_id = int(time() * 1000)
+        folder_fullname = utility.url_to_name(folder_url) if folder_url else ''
+        logger.debug(
+            f'Refreshing item index {"for " + folder_fullname if folder_fullname else ""} '
+            f'with depth {folder_depth} ...'
+        )
+
+        connection = self._connect()
+        number_of_items = 0
+        batch = []
+        try:
+            for item in self.crawler.crawl(folder_url=folder_url, folder_depth=folder_depth, views=True):
+                fullname = item['fullName']
+                if folder_fullname and not fullname.startswith(f'{folder_fullname}/'):
+                    fullname = f'{folder_fullname}/{fullname}'
+                kind = self._item_kind(item.get('_class', ''))
+                parent = fullname.rsplit('/', 1)[0] if '/' in fullname else ''
+                depth = fullname.count('/')
+                batch.append((kind, fullname, item['name'], parent, depth, item.get('_class'), item['url'], crawl_id))
+                number_of_items += 1
+                if len(batch) >= INDEX_WRITE_BATCH_SIZE:
+                    self._write_batch(connection, batch)
+                    batch = []
+            self._write_batch(connection, batch)
+        except BaseException:
+            with self._lock:
+                connection.rollback()
+            raise
+
+        with self._lock:
+            removed = 0
+            if self.crawler.failed_count:
+                # Items of folders that failed to be crawled may still be on the server
+                logger.debug(f'Failed to crawl {self.crawler.failed_count} folders. Keeping all indexed items')
+                click.secho(
+                    f'WARNING: Failed to get the items of {self.crawler.failed_count} sub-folders. '
+                    'Results may be incomplete',
+                    fg='yellow',
+                    bold=True,
+                    err=True,
+                )
+            else:
+                removed = self._remove_stale(connection, crawl_id, folder_fullname, folder_depth)
+                connection.execute(
+                    'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+                    (self._refresh_key(folder_fullname, folder_depth), str(time())),
+                )
+            connection.commit()
+
+        logger.debug(
+            f'Refreshed item index with {number_of_items} items, removed {removed} items '
+            f'in {perf_counter() - start_time:.3f} seconds'
+        )
+        return number_of_items
+
+    def _remove_stale(
+        self, connection: sqlite3.Connection, crawl_id: int, folder_fullname: str, folder_depth: Optional[int]
+    ) -> int:
+        """Remove the items within the crawled folder and depth that were not found by the crawl
+
+        Args:
+            connection      : Database connection
+            crawl_id        : ID of the crawl
+            folder_fullname : Full name of the crawled folder. Empty for the entire server
+            folder_depth    : Number of crawled sub-folder levels. None for all levels
+
+        Returns:
+            Number of removed items
+        """
+        stale_condition = 'crawl_id != ?'
+        stale_parameters = [crawl_id]
+        if folder_fullname:
+            escaped = folder_fullname.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            stale_condition += " AND fullname LIKE ? ESCAPE '\\'"
+            stale_parameters.append(f'{escaped}/%')
+        if folder_depth is not None:
+            stale_condition += ' AND depth <= ?'
+            stale_parameters.append((folder_fullname.count('/') + 1 if folder_fullname else 0) + folder_depth)
+        stale_items = connection.execute(
+            f'SELECT rowid, fullname FROM items WHERE {stale_condition}', stale_parameters
+        ).fetchall()
+        self._remove_trigrams(connection, stale_items)
+        return connection.execute(f'DELETE FROM items WHERE {stale_condition}', stale_parameters).rowcount
+
+    def _write_batch(self, connection: sqlite3.Connection, batch: list[tuple]) -> None:
+        """Insert or update a batch of crawled items
+
+        Details: Changes are committed by the caller once the refresh is complete
+
+        Args:
+            connection : Database connection
+            batch      : List of item rows
+
+        Returns:
+            None
+        """
+        if not batch:
+            return
+        with self._lock:
+            # Trigrams only depend on the full name, so only new items need them
+            new_items = {
+                (row[0], row[1])
+                for row in batch
+                if not connection.execute(
+                    'SELECT 1 FROM items WHERE kind = ? AND fullname = ?', (row[0], row[1])
+                ).fetchone()
+            }
+
+            # Existing items are updated in place to keep their row ID
+            connection.executemany(
+                'INSERT INTO items (kind, fullname, name, parent, depth, class, url, crawl_id) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT (kind, fullname) DO UPDATE SET name = excluded.name, parent = excluded.parent, '
+                'depth = excluded.depth, class = excluded.class, url = excluded.url, crawl_id = excluded.crawl_id',
+                batch,
+            )
+            item_rowid_query = 'SELECT rowid FROM items WHERE kind = ? AND fullname = ?'
+            new_items = [
+                (connection.execute(item_rowid_query, (kind, fullname)).fetchone()[0], fullname)
+                for kind, fullname in new_items
+            ]
+            self._add_trigrams(connection, new_items)
+
+    def count(self) -> int:
+        """Get the number of items in the index
+
+        Args:
+            None
+
+        Returns:
+            Number of indexed items
+        """
+        with self._lock:
+            return self._connect().execute('SELECT COUNT(*) FROM items').fetchone()[0]
+
+    def search(
+        self,
+        search_pattern: str,
+        item_class_list: list,
+        folder_url: str = '',
+        folder_depth: Optional[int] = None,
+        fullname: bool = True,
+    ) -> Iterator[dict]:
+        """Search the index for items matching a REGEX pattern
+
+        Args:
+            search_pattern  : REGEX pattern to match, case insensitive
+            item_class_list : Only match items of these classes
+            folder_url      : Only match the items directly within this folder
+            folder_depth    : Only match items up to this many sub-folder levels deep
+            fullname        : Match the entire path of the item, not just the item name
+
+        Returns:
+            Iterator of matching items
+        """
+        try:
+            pattern = re.compile(search_pattern, re.IGNORECASE)
+        except re.error as error:
+            logger.debug(f'Error while compiling REGEX pattern "{search_pattern}". Exception: {error}')
+            return
+
+        query = f'SELECT class, name, url, fullname FROM items WHERE class IN ({",".join("?" * len(item_class_list))})'
+        parameters = list(item_class_list)
+        if folder_url:
+            query += ' AND parent = ?'
+            parameters.append(utility.url_to_name(folder_url))
+        elif folder_depth is not None:
+            query += ' AND depth <= ?'
+            parameters.append(folder_depth)
+
+        # Only look at the items containing the least common trigrams of the literal text the pattern requires
+        connection = self._connect()
+        literal_trigrams = self._trigrams(self._regex_literal(search_pattern), padded=False)
+        if literal_trigrams:
+            with self._lock:
+                rarest_trigrams = self._rarest_trigrams(connection, literal_trigrams)[:SEARCH_PREFILTER_TRIGRAMS]
+            if rarest_trigrams[0][1] == 0:
+                logger.debug('No indexed item contains the literal text of the search pattern')
+                self.searched_count = 0
+                return
+            logger.debug(f'Prefiltering items for search with trigrams: {[pair[0] for pair in rarest_trigrams]}')
+            query += (
+                ' AND rowid IN (SELECT item FROM trigrams '
+                f'WHERE trigram IN ({",".join("?" * len(rarest_trigrams))}) '
+                'GROUP BY item HAVING COUNT(*) = ?)'
+            )
+            parameters.extend(pair[0] for pair in rarest_trigrams)
+            parameters.append(len(rarest_trigrams))
+        query += ' ORDER BY depth, fullname'
+
+        # Rows are read in batches and matched as they are read
+        self.searched_count = 0
+        with self._lock:
+            cursor = connection.execute(query, parameters)
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(INDEX_READ_BATCH_SIZE)
+            if not rows:
+                break
+            self.searched_count += len(rows)
+            for item_class, name, url, item_fullname in rows:
+                if not pattern.search(item_fullname if fullname else name):
+                    continue
+                yield {
+                    '_class': item_class,
+                    'name': name,
+                    'url': url,
+                    'fullName': item_fullname,
+                    'fullname': item_fullname,
+                }
+
+    def suggest(self, name: str, kinds: tuple = ('job',), limit: int = SUGGESTION_LIMIT) -> list[dict]:
+        """Find the indexed items with the names closest to a possibly mistyped or partial name
+
+        Details: Items sharing the most of the least common trigrams of the name are ranked by their
+                 similarity to either the full name or the item name, whichever is closer
+
+        Args:
+            name  : Full name or name of the item
+            kinds : Only suggest these kinds of items, `folder`, `view`, or `job`
+            limit : Maximum number of suggestions
+
+        Returns:
+            List of suggested items, closest first, each with `fullname`, `url`, and `score` (0 to 1)
+        """
+        name_trigrams = self._trigrams(name.strip('/'))
+        if not name_trigrams or not kinds:
+            return []
+
+        try:
+            with self._lock:
+                connection = self._connect()
+                query_trigrams = [
+                    trigram for trigram, count in self._rarest_trigrams(connection, name_trigrams) if count
+                ][:SUGGESTION_TRIGRAMS]
+                if not query_trigrams:
+                    return []
+                rows = connection.execute(
+                    'SELECT i.fullname, i.name, i.url FROM '
+                    '(SELECT item, COUNT(*) AS shared FROM trigrams '
+                    f'WHERE trigram IN ({",".join("?" * len(query_trigrams))}) GROUP BY item) AS t '
+                    'CROSS JOIN items AS i ON i.rowid = t.item '
+                    f'WHERE i.kind IN ({",".join("?" * len(kinds))}) ORDER BY t.shared DESC LIMIT ?',
+                    (*query_trigrams, *kinds, SUGGESTION_CANDIDATES),
+                ).fetchall()
+        except sqlite3.Error as error:
+            logger.debug(f'Failed to look up suggestions in item index. Exception: {error}')
+            return []
+
+        suggestions = []
+        for fullname, item_name, url in rows:
+            score = 0.0
+            for item_trigrams in (self._trigrams(fullname), self._trigrams(item_name)):
+                shared = len(name_trigrams & item_trigrams)
+                score = max(score, shared / (len(name_trigrams) + len(item_trigrams) - shared))
+            if score >= SUGGESTION_MIN_SCORE:
+                suggestions.append({'fullname': fullname, 'url': url, 'score': round(score, 3)})
+        suggestions.sort(key=lambda suggestion: (-suggestion['score'], suggestion['fullname']))
+        return suggestions[:limit]
+
+    def did_you_mean(self, name: str, kinds: tuple = ('job',)) -> str:
+        """Get a message suggesting the closest indexed item names for a name that was not found
+
+        Args:
+            name  : Full name or name of the item that was not found
+            kinds : Only suggest these kinds of items, `folder`, `view`, or `job`
+
+        Returns:
+            Message with the suggested names, empty string if there are no suggestions
+        """
+        suggestions = self.suggest(name, kinds) if name else []
+        if not suggestions:
+            return ''
+        return '. Did you mean: ' + ', '.join(f'"{suggestion["fullname"]}"' for suggestion in suggestions)
+
+    def name_to_url(self, name: str) -> str:
+        """Convert the item full name to URL, using the index if the item is indexed
+
+        Details: A name that only differs in upper/lower case from one indexed item resolves to that item.
+                 Falls back to building the URL from the name if the item is not in the index
+
+        Args:
+            name : The full name of the item
+
+        Returns:
+            Item URL
+        """
+        name = name.strip('/')
+        try:
+            with self._lock:
+                connection = self._connect()
+                rows = connection.execute(
+                    "SELECT url FROM items WHERE fullname = ? AND kind != 'view'", (name,)
+                ).fetchall()
+                if not rows:
+                    # Only resolve a name with different casing if it is not ambiguous
+                    rows = connection.execute(
+                        "SELECT url FROM items WHERE fullname = ? COLLATE NOCASE AND kind != 'view' LIMIT 2", (name,)
+                    ).fetchall()
+        except sqlite3.Error as error:
+            logger.debug(f'Failed to look up item in item index. Exception: {error}')
+            rows = []
+        if len(rows) == 1:
+            logger.debug(f'Found name "{name}" in item index with URL "{rows[0][0]}"')
+            return rows[0][0]
+
+        return utility.name_to_url(self.rest.get_server_url(), name)
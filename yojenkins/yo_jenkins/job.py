@@ -2,19 +2,19 @@
 
 import json
 import logging
-import re
+from collections.abc import Iterator
 from datetime import timedelta
 from time import perf_counter
-from typing import Union
+from typing import Optional, Union
 from urllib.parse import urlencode
 
 import jenkins
 import xmltodict
 import yaml
 
-from yojenkins.monitor import JobMonitor
 from yojenkins.utility import utility
 from yojenkins.utility.utility import diff_show, fail_out, failures_out
+from yojenkins.yo_jenkins.item_index import ItemIndex
 from yojenkins.yo_jenkins.jenkins_item_classes import JenkinsItemClasses
 from yojenkins.yo_jenkins.jenkins_item_config import JenkinsItemConfig
 
@@ -25,7 +25,7 @@ logger = logging.getLogger()
 class Job:
     """TODO Job"""
 
-    def __init__(self, rest, Folder, JenkinsSDK, auth, Build) -> None:
+    def __init__(self, rest, Folder, JenkinsSDK, auth, Build, *, item_index: Optional[ItemIndex] = None) -> None:
         """Object constructor method, called at object creation
 
         Args:
@@ -39,58 +39,75 @@ class Job:
         self.jenkins_sdk = JenkinsSDK
         self.auth = auth
         self.build = Build
-        self.JM = JobMonitor(rest, auth, self, Build)
+        self.item_index = item_index if item_index else ItemIndex(rest)
+        # JobMonitor object - Instantiated in monitor()
+        self.JM = None
 
         # Recursive search results
         self.search_results = []
         self.search_items_count = 0
 
-    def _recursive_search(self, search_pattern: str, search_list: list, level: int, fullname: bool = True) -> None:
-        """Recursive search method for jobs
+    def search_iter(
+        self,
+        search_pattern: str,
+        folder_name: str = '',
+        folder_url: str = '',
+        folder_depth: int = 4,
+        fullname: bool = True,
+        *,
+        refresh: bool = False,
+    ) -> Iterator[dict]:
+        """Search for jobs matching a REGEX pattern, yielding each job as soon as it is found
 
-        Details: Matched pattern findings are storred in the object: `self.search_results`
+        Details: Jobs are searched in the local item index. Each job is only yielded once.
 
         Args:
-            search_pattern : REGEX pattern to match for each item
-            search_list    : List of items
-            level          : Current recursion level
-            fullname       : Search the entire path of the item, not just the item name
+            search_pattern : REGEX pattern to match, case insensitive
+            folder_name    : Only search jobs directly within this folder name
+            folder_url     : Only search jobs directly within this folder URL
+            folder_depth   : Number of sub-folder levels to search
+            fullname       : Search the entire path of the job, not just the job name
+            refresh        : If True, refresh the item index before searching
 
         Returns:
-            None
+            Iterator of matching job items
         """
-        # Current directory level
-        level += 1
-
-        # Loop through all sub-folders
-        for list_item in search_list:
-            # Check if it is not a job
-            if list_item['_class'] in JenkinsItemClasses.JOB.value['class_type']:
-                # Get fullname, else get name
-                if fullname:
-                    dict_key = 'fullname' if 'fullname' in list_item else 'name'
-                else:
-                    dict_key = 'name'
-
-                # Match the regex pattern
-                try:
-                    if re.search(search_pattern, list_item[dict_key], re.IGNORECASE):
-                        self.search_results.append(list_item)
-                except re.error as error:
-                    logger.debug(
-                        f'Error while applying REGEX pattern "{search_pattern}" to "{list_item[dict_key]}". Exception: {error}'
-                    )
-                    break
-
-            # Count items searched for record
-            self.search_items_count += 1
-
-            # Check if it is a folder, if it is, keep looking
-            if 'jobs' not in list_item:
+        # Finding the job by REGEX pattern
+        # NOTE:
+        #   - Criteria of jobs is that jobs do not have any sub-folders, only views and jobs
+        logger.debug(f'Job search pattern: {search_pattern}')
+
+        # Get all the jobs
+        if folder_name or folder_url:
+            # Only search the specified folder
+            logger.debug(f'Searching jobs in sub-folder "{folder_name if folder_name else folder_url}"')
+            logger.debug('Folder depth does not apply. Only looking in this specific folder for job')
+            folder_url = folder_url if folder_url else self.item_index.name_to_url(folder_name)
+            folder_depth = None
+        else:
+            # Search entire Jenkins
+            logger.debug(f'Searching jobs in ALL Jenkins. Folder depth: "{folder_depth}"')
+
+        # Bring the searched part of the local item index up to date if needed
+        refresh_depth = 0 if folder_url else folder_depth
+        if refresh or self.item_index.is_stale(folder_url, refresh_depth):
+            self.item_index.refresh(folder_url, refresh_depth)
+
+        # Search the item index for any matching jobs, skipping duplicates
+        found_urls = set()
+        for item in self.item_index.search(
+            search_pattern,
+            JenkinsItemClasses.JOB.value['class_type'],
+            folder_url=folder_url,
+            folder_depth=folder_depth,
+            fullname=fullname,
+        ):
+            if item['url'] in found_urls:
                 continue
+            found_urls.add(item['url'])
+            yield item
 
-            # Keep searching all sub-items for this item. Call itself for some recursion fun
-            self._recursive_search(search_pattern, list_item['jobs'], level, fullname)
+        self.search_items_count = self.item_index.searched_count
 
     def search(
         self,
@@ -99,52 +116,31 @@ class Job:
         folder_url: str = '',
         folder_depth: int = 4,
         fullname: bool = True,
+        *,
+        refresh: bool = False,
     ) -> tuple[list, list]:
-        """TODO Docstring
+        """Search for jobs matching a REGEX pattern, using the local item index
 
         Args:
-            arg 1 : DESCRIPTION
-            arg 2 : DESCRIPTION
+            search_pattern : REGEX pattern to match, case insensitive
+            folder_name    : Only search jobs directly within this folder name
+            folder_url     : Only search jobs directly within this folder URL
+            folder_depth   : Number of sub-folder levels to search
+            fullname       : Search the entire path of the job, not just the job name
+            refresh        : If True, refresh the item index before searching
 
         Returns:
-            TODO
+            List of matching job items, list of matching job URLs
         """
-        # Finding the job by REGEX pattern
-        # NOTE:
-        #   - Criteria of jobs is that jobs do not have any sub-folders, only views and jobs
-
         # Start a timer to time the search
         start_time = perf_counter()
 
-        logger.debug(f'Job search pattern: {search_pattern}')
-
-        # Get all the jobs
-        if folder_name or folder_url:
-            # Only recursively search the specified folder name
-            logger.debug(f'Searching jobs in sub-folder "{folder_name if folder_name else folder_url}"')
-            logger.debug('Folder depth does not apply. Only looking in this specific folder for job')
-            items = self.folder.item_list(folder_name=folder_name, folder_url=folder_url)[0]
-        else:
-            # Search entire Jenkins
-            logger.debug(f'Searching jobs in ALL Jenkins. Folder depth: "{folder_depth}"')
-            try:
-                items = self.jenkins_sdk.get_all_jobs(folder_depth=folder_depth)
-            except jenkins.JenkinsException as error:
-                error_no_html = error.args[0].split('\n')[0]
-                fail_out(f'Error while getting all items. Exception: {error_no_html}')
-            except Exception as error:
-                fail_out(error)
-
-        # Search for any matching folders ("jobs")
-        self.search_results = []
         self.search_items_count = 0
-        self._recursive_search(search_pattern=search_pattern, search_list=items, level=0, fullname=fullname)
-
-        # Remove duplicates from list
-        logger.debug('Removing duplicates if needed ...')
-        self.search_results = [i for n, i in enumerate(self.search_results) if i not in self.search_results[n + 1 :]]
+        self.search_results = list(
+            self.search_iter(search_pattern, folder_name, folder_url, folder_depth, fullname, refresh=refresh)
+        )
 
-        # Getting only the URLs of the stages
+        # Getting only the URLs of the jobs
         job_search_results_list = [result['url'] for result in self.search_results]
 
         # Output search stats
@@ -154,25 +150,29 @@ class Job:
 
         return self.search_results, job_search_results_list
 
-    def info(self, job_name: str = '', job_url: str = '') -> dict:
-        """TODO Docstring
+    def info(self, job_name: str = '', job_url: str = '', fields: Optional[list[str]] = None) -> dict:
+        """Get the job information
 
         Args:
-            TODO
+            job_name : Job name
+            job_url  : Job URL
+            fields   : Only get these fields, nested with a dot (ie. `lastBuild.number`). Default is all fields
 
         Returns:
-            TODO
+            Job information
         """
         if not job_name and not job_url:
             fail_out('No job name or job URL provided')
 
         if job_name and not job_url:
-            job_url = utility.name_to_url(self.rest.get_server_url(), job_name)
+            job_url = self.item_index.name_to_url(job_name)
 
         logger.debug(f'Job url passed: {job_url}')
-        job_info, _, success = self.rest.request(f'{job_url.strip("/")}/api/json', 'get', is_endpoint=False)
+        job_info, _, success = self.rest.request(
+            f'{job_url.strip("/")}/api/json', 'get', is_endpoint=False, fields=fields
+        )
         if not success:
-            fail_out(f'Failed to find job info: {job_url}')
+            fail_out(f'Failed to find job info: {job_url}{self.item_index.did_you_mean(job_name)}')
 
         # Check if found item type/class
         if job_info['_class'] not in JenkinsItemClasses.JOB.value['class_type']:
@@ -193,17 +193,19 @@ class Job:
 
         return job_info
 
-    def build_list(self, job_name: str = '', job_url: str = '') -> tuple[list, list]:
-        """TODO Docstring
+    def build_list(self, job_name: str = '', job_url: str = '', details: bool = False) -> tuple[list, list]:
+        """Get the list of all builds for the job
 
         Args:
-            TODO
+            job_name : Job name
+            job_url  : Job URL
+            details  : If True, fetch the full build information for every build (concurrently)
 
         Returns:
-            TODO
+            List of builds, information list and URL list
         """
         # Get the job information
-        job_info = self.info(job_name=job_name, job_url=job_url)
+        job_info = self.info(job_name=job_name, job_url=job_url, fields=['builds.number', 'builds.url'])
 
         # Get all the past builds
         build_list, build_url_list = utility.item_subitem_list(
@@ -213,8 +215,79 @@ class Job:
             item_class_list=JenkinsItemClasses.BUILD.value['class_type'],
         )
 
+        if details:
+            logger.debug(f'Getting detailed build information for {len(build_url_list)} builds ...')
+            build_list = [
+                build_info if build_info else build
+                for build, build_info in zip(build_list, self.build.info_many(build_url_list))
+            ]
+
         return build_list, build_url_list
 
+    def build_logs_grep(
+        self,
+        search_pattern: str,
+        job_name: str = '',
+        job_url: str = '',
+        job_search_pattern: str = '',
+        *,
+        last: int = 1,
+        ignore_case: bool = False,
+    ) -> Iterator[dict]:
+        """Search the console logs of the last builds of one or more jobs for lines matching a REGEX pattern
+
+        Details: With a job search pattern, the last builds of every matching job are searched.
+                 The build lists of the jobs are requested at the same time, and the logs of all
+                 builds are then searched at the same time. See `Build.logs_grep()`
+
+        Args:
+            search_pattern     : REGEX pattern to match in the logs
+            job_name           : Job name
+            job_url            : Job URL
+            job_search_pattern : REGEX pattern of the jobs to search, instead of one job
+            last               : Number of most recent builds of each job to search
+            ignore_case        : If True, match the logs regardless of case
+
+        Returns:
+            Iterator of matching log lines (`url`, `line_number`, `line`)
+        """
+        if job_search_pattern:
+            job_urls = [job['url'] for job in self.search_iter(job_search_pattern)]
+            if not job_urls:
+                fail_out(f'Failed to find any jobs matching "{job_search_pattern}"')
+            logger.debug(f'Found {len(job_urls)} jobs matching "{job_search_pattern}"')
+            jobs_info = self.rest.request_many(
+                [
+                    {
+                        'target': f'{url.strip("/")}/api/json',
+                        'request_type': 'get',
+                        'is_endpoint': False,
+                        'fields': ['builds.number', 'builds.url'],
+                    }
+                    for url in job_urls
+                ]
+            )
+            build_lists = [
+                utility.item_subitem_list(
+                    item_info=job_info,
+                    get_key_info='url',
+                    item_type=JenkinsItemClasses.BUILD.value['item_type'],
+                    item_class_list=JenkinsItemClasses.BUILD.value['class_type'],
+                )[0]
+                for job_info, _, success in jobs_info
+                if success
+            ]
+        else:
+            build_lists = [self.build_list(job_name=job_name, job_url=job_url)[0]]
+
+        build_urls = []
+        for build_list in build_lists:
+            latest_builds = sorted(build_list, key=lambda build: build.get('number', 0), reverse=True)
+            build_urls.extend(build['url'] for build in latest_builds[: max(last, 1)])
+        logger.debug(f'Searching logs of the last {last} builds of {len(build_lists)} jobs ({len(build_urls)} builds)')
+
+        return self.build.logs_grep(build_urls, search_pattern, ignore_case=ignore_case)
+
     def build_next_number(self, job_name: str = '', job_url: str = '') -> Union[int, None]:
         """TODO Docstring
 
@@ -225,7 +298,7 @@ class Job:
             TODO
         """
         # Get the job information
-        job_info = self.info(job_name=job_name, job_url=job_url)
+        job_info = self.info(job_name=job_name, job_url=job_url, fields=['nextBuildNumber'])
 
         if not job_info.get('nextBuildNumber'):
             fail_out('Failed to get next build number from job. "builds" key missing in job information')
@@ -246,7 +319,7 @@ class Job:
         # Get the job information
         if not job_info:
             # If the job info is not passed, request it from server
-            job_info = self.info(job_name=job_name, job_url=job_url)
+            job_info = self.info(job_name=job_name, job_url=job_url, fields=['lastBuild.number'])
 
         if not job_info.get('lastBuild'):
             return 0
@@ -300,7 +373,7 @@ class Job:
         """
         if not job_info:
             # Getting job information
-            job_info = self.info(job_name=job_name, job_url=job_url)
+            job_info = self.info(job_name=job_name, job_url=job_url, fields=['builds.number'])
 
         if 'builds' not in job_info:
             fail_out('Failed to get build list from job. "builds" key missing in job information')
@@ -487,7 +560,7 @@ class Job:
         if job_url:
             job_url = job_url.strip('/')
         else:
-            job_url = utility.name_to_url(self.rest.get_server_url(), job_name)
+            job_url = self.item_index.name_to_url(job_name)
 
         logger.debug(f'Opening in web browser: "{job_url}" ...')
         if not utility.browser_open(url=job_url):
@@ -521,7 +594,7 @@ class Job:
         if job_url:
             job_url = job_url.strip('/')
         else:
-            job_url = utility.name_to_url(self.rest.get_server_url(), job_name)
+            job_url = self.item_index.name_to_url(job_name)
 
         logger.debug(f'Fetching XML configurations for job: "{job_url}" ...')
         return_content, _, success = self.rest.request(
@@ -553,7 +626,7 @@ class Job:
         if job_url:
             job_url = job_url.strip('/')
         else:
-            job_url = utility.name_to_url(self.rest.get_server_url(), job_name)
+            job_url = self.item_index.name_to_url(job_name)
 
         logger.debug(f'Disabling job: "{job_url}" ...')
         success = self.rest.request(f'{job_url.strip("/")}/disable', 'post', is_endpoint=False)[2]
@@ -578,7 +651,7 @@ class Job:
         if job_url:
             job_url = job_url.strip('/')
         else:
-            job_url = utility.name_to_url(self.rest.get_server_url(), job_name)
+            job_url = self.item_index.name_to_url(job_name)
 
         logger.debug(f'Enabling job: "{job_url}" ...')
         success = self.rest.request(f'{job_url.strip("/")}/enable', 'post', is_endpoint=False)[2]
@@ -603,7 +676,7 @@ class Job:
         if job_url:
             job_url = job_url.strip('/')
         else:
-            job_url = utility.name_to_url(self.rest.get_server_url(), job_name)
+            job_url = self.item_index.name_to_url(job_name)
 
         if not new_name:
             fail_out('The new job name is a blank')
@@ -633,7 +706,7 @@ class Job:
         if job_url:
             job_url = job_url.strip('/')
         else:
-            job_url = utility.name_to_url(self.rest.get_server_url(), job_name)
+            job_url = self.item_index.name_to_url(job_name)
 
         logger.debug(f'Deleting job: "{job_url}" ...')
         success = self.rest.request(f'{job_url.strip("/")}/doDelete', 'post', is_endpoint=False)[2]
@@ -658,7 +731,7 @@ class Job:
         if job_url:
             job_url = job_url.strip('/')
         else:
-            job_url = utility.name_to_url(self.rest.get_server_url(), job_name)
+            job_url = self.item_index.name_to_url(job_name)
 
         logger.debug(f'Wiping workspace for job: "{job_url}" ...')
         success = self.rest.request(f'{job_url.strip("/")}/doWipeOutWorkspace', 'post', is_endpoint=False)[2]
@@ -683,12 +756,17 @@ class Job:
         if job_url:
             job_url = job_url.strip('/')
         else:
-            job_url = utility.name_to_url(self.rest.get_server_url(), job_name)
+            job_url = self.item_index.name_to_url(job_name)
 
         if not self.rest.request(f'{job_url.strip("/")}/api/json', 'head', is_endpoint=False)[2]:
             fail_out(f'Failed to find job. The job may not exist: {job_url}')
 
         logger.debug(f'Starting monitor for: "{job_url}" ...')
+        if not self.JM:
+            # Imported here, the monitor terminal and sound libraries are only needed for monitoring
+            from yojenkins.monitor import JobMonitor  # noqa: PLC0415
+
+            self.JM = JobMonitor(self.rest, self.auth, self, self.build)
         success = self.JM.monitor_start(job_url=job_url, sound=sound)
         if not success:
             fail_out('Failed to start job monitor')
@@ -718,7 +796,7 @@ class Job:
         if folder_url:
             folder_url = folder_url.strip('/')
         else:
-            folder_url = utility.name_to_url(self.rest.get_server_url(), folder_name)
+            folder_url = self.item_index.name_to_url(folder_name)
 
         if not name:
             fail_out('Provided item name is a blank')
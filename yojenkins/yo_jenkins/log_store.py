@@ -0,0 +1,299 @@
+"""LogStore class definition"""
+
+import gzip
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Optional
+
+try:
+    import zstandard
+except ImportError:
+    # Optional dependency. Logs are compressed with gzip instead
+    zstandard = None
+
+# Getting the logger reference
+logger = logging.getLogger()
+
+# TODO: Find centralized location for these static values
+CONFIG_DIR_NAME = '.yojenkins'
+LOG_STORE_DIR_NAME = 'logs'
+
+# Maximum size of all stored compressed logs, in megabytes
+DEFAULT_LOG_STORE_MAX_SIZE_MB = 1024
+# File extension of a stored log by compression
+LOG_FILE_EXTENSIONS = {'zstd': '.log.zst', 'gzip': '.log.gz'}
+# Compression levels, favoring speed since logs are compressed while they are read
+ZSTD_LEVEL = 3
+GZIP_LEVEL = 6
+# Number of decompressed bytes read from a stored log at a time
+READ_CHUNK_SIZE = 65536
+
+
+class LogStore:
+    """Local compressed store of the console logs of finished builds
+
+    Details: The console log of a finished build never changes, so it is stored the first time
+             it is read in full, and read from the store instead of the server afterwards.
+             Logs are compressed with zstd if the `zstandard` package is installed, else with gzip,
+             and are stored in `~/.yojenkins/logs`, one file per log, keyed by a hash of the
+             username and log URL. Logs are written to the store while they are streamed to the
+             reader, and only kept once read completely. Least recently read logs are removed
+             once the size of all stored logs exceeds `max_size_mb`.
+    """
+
+    def __init__(self, store_dir: str = '', max_size_mb: float = DEFAULT_LOG_STORE_MAX_SIZE_MB) -> None:
+        """Object constructor method, called at object creation
+
+        Args:
+            store_dir   : Directory holding the stored logs. Default is `~/.yojenkins/logs`
+            max_size_mb : Maximum size of all stored compressed logs, in megabytes. 0 to not store logs
+
+        Returns:
+            None
+        """
+        self.store_dir = store_dir or os.path.join(Path.home(), CONFIG_DIR_NAME, LOG_STORE_DIR_NAME)
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.compression = 'zstd' if zstandard else 'gzip'
+
+        self._lock = threading.Lock()
+
+    def configure(self, max_size_mb: Optional[float] = None) -> None:
+        """Update the log store settings
+
+        Args:
+            max_size_mb : Maximum size of all stored compressed logs, in megabytes
+
+        Returns:
+            None
+        """
+        if max_size_mb is not None:
+            self.max_size_bytes = int(float(max_size_mb) * 1024 * 1024)
+        logger.debug(f'Log store settings: Compression: {self.compression}, Max size: {self.max_size_bytes} bytes')
+
+    @staticmethod
+    def key(namespace: str, log_url: str) -> str:
+        """Build the store key of a log
+
+        Args:
+            namespace : Requesting user
+            log_url   : Full URL of the log
+
+        Returns:
+            Store key
+        """
+        return hashlib.sha256(f'{namespace}|{log_url.strip("/")}'.encode()).hexdigest()
+
+    def read(self, namespace: str, log_url: str, chunk_size: int = READ_CHUNK_SIZE) -> Optional[Iterator[bytes]]:
+        """Read a stored log
+
+        Args:
+            namespace  : Requesting user
+            log_url    : Full URL of the log
+            chunk_size : Number of decompressed bytes read at a time
+
+        Returns:
+            Iterator of log byte chunks, None if the log is not stored
+        """
+        key = self.key(namespace, log_url)
+        for compression in ['zstd', 'gzip'] if zstandard else ['gzip']:
+            file_path = os.path.join(self.store_dir, key + LOG_FILE_EXTENSIONS[compression])
+            try:
+                # Mark as recently read, for eviction
+                os.utime(file_path)
+                log_file = open(file_path, 'rb')
+            except OSError:
+                continue
+            logger.debug(f'Reading log from local store: {log_url}')
+            return self._read_file(log_file, file_path, compression, chunk_size)
+        return None
+
+    def store(
+        self, namespace: str, log_url: str, chunks: Iterator[bytes], expected_size: Optional[int] = None
+    ) -> Iterator[bytes]:
+        """Store a log while it is read
+
+        Details: The log is compressed into a temporary file as the chunks pass through, and only
+                 kept if all chunks were read and, if known, their size matches the expected size.
+                 Any failure to store leaves the chunks unaffected.
+
+        Args:
+            namespace     : Requesting user
+            log_url       : Full URL of the log
+            chunks        : Iterator of log byte chunks
+            expected_size : Number of bytes of the log (ie. `Content-Length` of the response), None if not known
+
+        Returns:
+            Iterator of the same log byte chunks
+        """
+        temp = self._open_temp() if self.max_size_bytes > 0 else None
+        if temp is None:
+            yield from chunks
+            return
+
+        temp_path, temp_file, writer = temp
+        file_path = os.path.join(self.store_dir, self.key(namespace, log_url) + LOG_FILE_EXTENSIONS[self.compression])
+        stored = False
+        size = 0
+        try:
+            for chunk in chunks:
+                writer = _write(writer, chunk)
+                size += len(chunk)
+                yield chunk
+            if expected_size is not None and size != expected_size:
+                logger.debug(f'Read {size} of {expected_size} log bytes. Not storing log: {log_url}')
+            elif writer:
+                stored = _keep(writer, temp_file, temp_path, file_path)
+        finally:
+            if not stored:
+                _discard(writer, temp_file, temp_path)
+        if stored:
+            logger.debug(f'Stored log ({os.path.getsize(file_path)} bytes compressed): {log_url}')
+            self.evict()
+
+    def evict(self) -> int:
+        """Remove the least recently read logs until the size of all stored logs is within `max_size_mb`
+
+        Returns:
+            Number of removed logs
+        """
+        with self._lock:
+            try:
+                log_files = [
+                    entry
+                    for entry in os.scandir(self.store_dir)
+                    if entry.is_file() and entry.name.endswith(tuple(LOG_FILE_EXTENSIONS.values()))
+                ]
+                log_stats = sorted(
+                    ((entry.path, entry.stat()) for entry in log_files), key=lambda log_stat: log_stat[1].st_mtime
+                )
+            except OSError as error:
+                logger.debug(f'Failed to list log store. Exception: {error}')
+                return 0
+
+            total_size = sum(stat.st_size for _, stat in log_stats)
+            removed = 0
+            for file_path, stat in log_stats:
+                if total_size <= self.max_size_bytes:
+                    break
+                _remove(file_path)
+                total_size -= stat.st_size
+                removed += 1
+            if removed:
+                logger.debug(f'Removed {removed} least recently read logs from log store ({total_size} bytes left)')
+            return removed
+
+    def _open_temp(self) -> Optional[tuple]:
+        """Open a temporary file in the store, with a compressing writer
+
+        Returns:
+            Temporary file path, file object, and compressing writer, None if it could not be opened
+        """
+        try:
+            os.makedirs(self.store_dir, mode=0o700, exist_ok=True)
+            file_descriptor, temp_path = tempfile.mkstemp(dir=self.store_dir, prefix='.log.')
+            temp_file = os.fdopen(file_descriptor, 'wb')
+        except OSError as error:
+            logger.debug(f'Failed to open log store. Not storing log. Exception: {error}')
+            return None
+        return temp_path, temp_file, self._writer(temp_file)
+
+    def _writer(self, file):
+        """Open a compressing writer on a file
+
+        Args:
+            file : Binary file object
+
+        Returns:
+            Writable file object compressing into the file
+        """
+        if self.compression == 'zstd':
+            return zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(file, closefd=False)
+        return gzip.GzipFile(fileobj=file, mode='wb', compresslevel=GZIP_LEVEL)
+
+    @staticmethod
+    def _read_file(log_file, file_path: str, compression: str, chunk_size: int) -> Iterator[bytes]:
+        """Decompress a stored log file in chunks
+
+        Details: A stored log that fails to decompress is removed from the store
+
+        Args:
+            log_file    : Open binary file object of the stored log
+            file_path   : Path of the stored log file
+            compression : Compression of the file (`zstd` or `gzip`)
+            chunk_size  : Number of decompressed bytes read at a time
+
+        Returns:
+            Iterator of log byte chunks
+        """
+        read_errors = (OSError, EOFError, zstandard.ZstdError) if zstandard else (OSError, EOFError)
+        with log_file:
+            if compression == 'zstd':
+                reader = zstandard.ZstdDecompressor().stream_reader(log_file, closefd=False)
+            else:
+                reader = gzip.GzipFile(fileobj=log_file, mode='rb')
+            try:
+                with reader:
+                    while True:
+                        chunk = reader.read(chunk_size)
+                        if not chunk:
+                            break
+                        yield chunk
+            except read_errors as error:
+                logger.debug(f'Failed to read stored log. Removing it from log store. Exception: {error}')
+                _remove(file_path)
+
+
+def _write(writer, chunk: bytes):
+    """Write a chunk to a compressing writer, if any
+
+    Returns:
+        The writer, None if there is no writer or it failed to write
+    """
+    if not writer:
+        return None
+    try:
+        writer.write(chunk)
+    except OSError as error:
+        logger.debug(f'Failed to write to log store. Not storing log. Exception: {error}')
+        return None
+    return writer
+
+
+def _keep(writer, temp_file, temp_path: str, file_path: str) -> bool:
+    """Finish writing a temporary file and give it its name in the store
+
+    Returns:
+        True if kept, else False
+    """
+    try:
+        writer.close()
+        temp_file.close()
+        os.replace(temp_path, file_path)
+    except OSError as error:
+        logger.debug(f'Failed to store log. Exception: {error}')
+        return False
+    return True
+
+
+def _discard(writer, temp_file, temp_path: str) -> None:
+    """Close and remove a temporary file that is not kept"""
+    for file in (writer, temp_file):
+        try:
+            if file:
+                file.close()
+        except (OSError, ValueError):
+            pass
+    _remove(temp_path)
+
+
+def _remove(path: str) -> None:
+    """Remove a file, if it exists"""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
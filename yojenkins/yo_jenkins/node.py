@@ -3,8 +3,10 @@
 import json
 import logging
 import os
+from collections.abc import Iterator
 from typing import Optional
 
+import requests
 import xmltodict
 
 from yojenkins.utility import utility
@@ -30,17 +32,16 @@ class Node:
         """
         self.rest = rest
 
-    def info(self, node_name: str, depth: int = 0) -> dict:
-        """TODO Docstring
-
-        Details: TODO
+    def info(self, node_name: str, depth: int = 0, fields: Optional[list[str]] = None) -> dict:
+        """Get the node information
 
         Args:
-            node_name: TODO
-            depth: TODO
+            node_name: Name of the node
+            depth: Depth of the returned information. Ignored if fields are specified
+            fields: Only get these fields, nested with a dot (ie. `executors.number`). Default is all fields
 
         Returns:
-            TODO
+            Node information
         """
         logger.debug(f'Getting info for node: {node_name} ...')
         node_name = '(master)' if node_name == 'master' else node_name  # Special case
@@ -49,26 +50,64 @@ class Node:
             request_type='get',
             is_endpoint=True,
             json_content=True,
+            fields=fields,
         )
         if not success:
             fail_out(f'Failed to find node info for "{node_name}"')
 
         return node_info
 
-    def list(self, depth: int = 0) -> tuple[list, list]:
-        """TODO Docstring
+    def list_iter(self, depth: int = 0, fields: Optional[list[str]] = None) -> Iterator[dict]:
+        """Get all nodes, yielding each node as soon as it is received from the server
 
-        Details: TODO
+        Details: The server response is parsed while it is received, so that the information
+                 of very many nodes or of a large `depth` is never held in memory all at once
 
         Args:
-            name: TODO
+            depth: Depth of the returned information. Ignored if fields are specified
+            fields: Only get these fields of each node, nested with a dot (ie. `executors.number`).
+                    Default is all fields. Empty list only gets the node names
 
         Returns:
-            TODO
+            Iterator of node information
+        """
+        logger.debug('Streaming a list of all nodes ...')
+        if fields is not None:
+            fields = [f'computer.{field}' for field in ['displayName', '_class', *fields]]
+        nodes, _, success = self.rest.request_stream(
+            target=f'computer/api/json?depth={depth}', item_path='computer', fields=fields
+        )
+        if not success:
+            fail_out('Failed to get any nodes')
+
+        try:
+            for node in nodes:
+                if node.get('_class') in JenkinsItemClasses.NODE.value['class_type']:
+                    yield node
+        except (ValueError, requests.exceptions.RequestException) as error:
+            fail_out(f'Failed to read the node list from the server. Exception: {error}')
+
+    def list(self, depth: int = 0, fields: Optional[list[str]] = None) -> tuple[list, list]:
+        """Get the list of all nodes
+
+        Args:
+            depth: Depth of the returned information. Ignored if fields are specified
+            fields: Only get these fields of each node, nested with a dot (ie. `executors.number`).
+                    Default is all fields. Empty list only gets the node names
+
+        Returns:
+            List of nodes, information list and name list
         """
         logger.debug('Getting a list of all nodes ...')
+        if fields is not None:
+            # Fields are for each listed node, node name is always needed for the list
+            fields = [f'computer.{field}' for field in ['displayName', *fields]]
         nodes_info, _, success = self.rest.request(
-            target=f'computer/api/json?depth={depth}', request_type='get', is_endpoint=True, json_content=True
+            target=f'computer/api/json?depth={depth}',
+            request_type='get',
+            is_endpoint=True,
+            json_content=True,
+            fields=fields,
         )
         if not success:
             fail_out('Failed to get any nodes')
@@ -214,7 +253,7 @@ class Node:
         logger.debug(f'Message for disabling node: "{message}"')
 
         # Check if node is disabled already
-        node_info = self.info(node_name=node_name)
+        node_info = self.info(node_name=node_name, fields=['offline'])
         if node_info['offline']:
             print2('Node is already disabled')
             return True
@@ -245,7 +284,7 @@ class Node:
         logger.debug(f'Message for enabling node: "{message}"')
 
         # Check if node is disabled already
-        node_info = self.info(node_name=node_name)
+        node_info = self.info(node_name=node_name, fields=['offline'])
         if not node_info['offline']:
             print2('Node is already enabled')
             return True
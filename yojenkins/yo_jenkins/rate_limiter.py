@@ -0,0 +1,261 @@
+"""RateLimiter class definition"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from time import sleep, time
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows, where limits only apply within the process
+    fcntl = None
+
+# Getting the logger reference
+logger = logging.getLogger()
+
+# TODO: Find centralized location for these static values
+CONFIG_DIR_NAME = '.yojenkins'
+RATE_LIMIT_DIR_NAME = 'rate_limit'
+
+# Seconds between checks for a free in-flight request slot
+SLOT_POLL_INTERVAL = 0.02
+# Longest seconds waited for a free in-flight request slot
+SLOT_WAIT_TIMEOUT = 120.0
+# Longest seconds slept while waiting for a rate limit token
+TOKEN_WAIT_MAX = 1.0
+
+
+class RateLimiter:
+    """Client-side request rate and concurrency limits of a server
+
+    Details: Requests take a token from a token bucket refilled at `rate` tokens per second,
+             holding up to `burst` tokens, and hold one of `max_in_flight` request slots while
+             being sent. Where file locks are available (ie. Linux, macOS) the bucket and the slots
+             are files in `~/.yojenkins/rate_limit`, shared by all yojenkins processes using the
+             same server. Slots are held with file locks, which are released by the operating
+             system if a process exits while holding one. Otherwise the limits apply per process.
+    """
+
+    def __init__(
+        self,
+        server: str,
+        rate: float = 0.0,
+        burst: int = 0,
+        max_in_flight: int = 0,
+        state_dir: str = '',
+    ) -> None:
+        """Object constructor method, called at object creation
+
+        Args:
+            server        : Server address (ie. `localhost:8080`)
+            rate          : Requests per second. 0 for no rate limit
+            burst         : Requests that can be sent at once after being idle. Default is one second of requests
+            max_in_flight : Requests sent at the same time. 0 for no limit
+            state_dir     : Directory of the shared limit files. Default is `~/.yojenkins/rate_limit`
+
+        Returns:
+            None
+        """
+        self.server = server
+        self.rate = float(rate or 0)
+        self.burst = max(1, int(burst or 0) or int(self.rate) or 1)
+        self.max_in_flight = int(max_in_flight or 0)
+
+        state_dir = state_dir or os.path.join(Path.home(), CONFIG_DIR_NAME, RATE_LIMIT_DIR_NAME)
+        file_prefix = os.path.join(state_dir, hashlib.sha256(server.encode()).hexdigest()[:16])
+        self.state_dir = state_dir
+        self.bucket_file = f'{file_prefix}.bucket'
+        self.slot_file_prefix = f'{file_prefix}.slot'
+        self.shared = fcntl is not None
+
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = time()
+        self._slot_files: dict[int, int] = {}
+        self._slots_held: set[int] = set()
+
+    def enabled(self) -> bool:
+        """Check if any limit is set
+
+        Returns:
+            True if requests are limited, else False
+        """
+        return self.rate > 0 or self.max_in_flight > 0
+
+    @contextmanager
+    def limit(self) -> Iterator[None]:
+        """Wait until a request may be sent, and hold an in-flight slot while it is sent
+
+        Details: Raises `TimeoutError` if no in-flight slot is free in time
+
+        Returns:
+            None
+        """
+        slot = self._acquire_slot() if self.max_in_flight > 0 else None
+        try:
+            if self.rate > 0:
+                self._take_token()
+            yield
+        finally:
+            if slot is not None:
+                self._release_slot(slot)
+
+    ###########################################################################
+    #                             RATE LIMIT
+    ###########################################################################
+
+    def _take_token(self) -> None:
+        """Take a token from the bucket, waiting until one is available
+
+        Returns:
+            None
+        """
+        wait_start = time()
+        while True:
+            wait = self._try_take_token()
+            if wait <= 0:
+                break
+            sleep(min(wait, TOKEN_WAIT_MAX))
+        if time() - wait_start > 0.001:
+            logger.debug(f'Rate limited request to "{self.server}" for {time() - wait_start:.3f} seconds')
+
+    def _try_take_token(self) -> float:
+        """Take a token from the bucket if one is available
+
+        Returns:
+            0 if a token was taken, else seconds until the next token is available
+        """
+        with self._lock:
+            if self.shared:
+                try:
+                    return self._try_take_shared_token()
+                except OSError as error:
+                    logger.debug(f'Failed to use shared rate limit file. Limiting within process. Exception: {error}')
+                    self.shared = False
+            self._tokens, self._updated, wait = self._refill_and_take(self._tokens, self._updated)
+            return wait
+
+    def _try_take_shared_token(self) -> float:
+        """Take a token from the bucket file shared by all processes
+
+        Returns:
+            0 if a token was taken, else seconds until the next token is available
+        """
+        os.makedirs(self.state_dir, mode=0o700, exist_ok=True)
+        file_descriptor = os.open(self.bucket_file, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(file_descriptor, fcntl.LOCK_EX)
+            try:
+                tokens, updated = (float(value) for value in os.read(file_descriptor, 64).split())
+            except ValueError:
+                tokens, updated = float(self.burst), time()
+            tokens, updated, wait = self._refill_and_take(tokens, updated)
+            state = f'{tokens:.6f} {updated:.6f}'.encode()
+            os.lseek(file_descriptor, 0, os.SEEK_SET)
+            os.write(file_descriptor, state)
+            os.ftruncate(file_descriptor, len(state))
+            return wait
+        finally:
+            os.close(file_descriptor)
+
+    def _refill_and_take(self, tokens: float, updated: float) -> tuple[float, float, float]:
+        """Refill a token bucket for the time passed and take a token if available
+
+        Args:
+            tokens  : Tokens in the bucket at the last update
+            updated : Time of the last update
+
+        Returns:
+            New tokens, new update time, and 0 if a token was taken, else seconds until one is available
+        """
+        now = time()
+        tokens = min(float(self.burst), tokens + max(0.0, now - updated) * self.rate)
+        if tokens >= 1:
+            return tokens - 1, now, 0.0
+        return tokens, now, (1 - tokens) / self.rate
+
+    ###########################################################################
+    #                             IN-FLIGHT LIMIT
+    ###########################################################################
+
+    def _acquire_slot(self) -> int:
+        """Take a free in-flight request slot, waiting until one is free
+
+        Details: Raises `TimeoutError` if no slot is free within `SLOT_WAIT_TIMEOUT` seconds
+
+        Returns:
+            Slot number
+        """
+        wait_start = time()
+        while True:
+            slot = self._try_acquire_slot()
+            if slot is not None:
+                break
+            if time() - wait_start > SLOT_WAIT_TIMEOUT:
+                raise TimeoutError(f'No free request slot to "{self.server}" within {SLOT_WAIT_TIMEOUT} seconds')
+            sleep(SLOT_POLL_INTERVAL)
+        if time() - wait_start > 0.001:
+            logger.debug(f'Waited {time() - wait_start:.3f} seconds for a free request slot to "{self.server}"')
+        return slot
+
+    def _try_acquire_slot(self) -> Optional[int]:
+        """Take a free in-flight request slot if there is one
+
+        Returns:
+            Slot number, None if all are taken
+        """
+        with self._lock:
+            for slot in range(self.max_in_flight):
+                if slot in self._slots_held:
+                    continue
+                if self.shared:
+                    try:
+                        if not self._lock_slot_file(slot):
+                            continue
+                    except OSError as error:
+                        logger.debug(f'Failed to use shared slot file. Limiting within process. Exception: {error}')
+                        self.shared = False
+                self._slots_held.add(slot)
+                return slot
+        return None
+
+    def _lock_slot_file(self, slot: int) -> bool:
+        """Lock the file of a slot without waiting
+
+        Args:
+            slot : Slot number
+
+        Returns:
+            True if locked, False if held by another process
+        """
+        if slot not in self._slot_files:
+            os.makedirs(self.state_dir, mode=0o700, exist_ok=True)
+            self._slot_files[slot] = os.open(f'{self.slot_file_prefix}{slot}', os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(self._slot_files[slot], fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        return True
+
+    def _release_slot(self, slot: int) -> None:
+        """Free an in-flight request slot
+
+        Args:
+            slot : Slot number
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._slots_held.discard(slot)
+            if slot in self._slot_files:
+                try:
+                    fcntl.flock(self._slot_files[slot], fcntl.LOCK_UN)
+                except OSError as error:
+                    logger.debug(f'Failed to unlock slot file. Exception: {error}')
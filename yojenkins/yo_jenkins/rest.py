@@ -1,21 +1,57 @@
 """Rest class definition"""
 
+import json
 import logging
-from time import perf_counter
+import weakref
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack, nullcontext
+from functools import partial
+from time import perf_counter, sleep
 from typing import Literal, Optional, Union
+from urllib.parse import urlparse
 
 import requests
 from requests.auth import HTTPBasicAuth
-from requests_futures.sessions import FuturesSession
+from requests.structures import CaseInsensitiveDict
+
+from yojenkins.utility.json_stream import iter_json_array
+from yojenkins.utility.utility import fields_to_tree
+from yojenkins.yo_jenkins.log_store import LogStore
+from yojenkins.yo_jenkins.rate_limiter import RateLimiter
+from yojenkins.yo_jenkins.rest_cache import RestCache
+from yojenkins.yo_jenkins.rest_crumb import CrumbManager
+from yojenkins.yo_jenkins.rest_pool import ConnectionPool
+from yojenkins.yo_jenkins.rest_retry import RETRY_STATUS_CODES, CircuitBreaker, RetryPolicy
+from yojenkins.yo_jenkins.rest_single_flight import SingleFlight
+from yojenkins.yo_jenkins.rest_trace import RequestTracer
+from yojenkins.yo_jenkins.server_capabilities import ServerCapabilities
 
 # Getting the logger reference
 logger = logging.getLogger()
 
+# Default number of requests sent at the same time with `Rest.request_many()`
+REQUEST_MANY_MAX_CONCURRENT = 16
+# Number of bytes read at a time from a response with `Rest.request_stream()` and `Rest.request_bytes()`
+STREAM_CHUNK_SIZE = 65536
+
 
 class Rest:
     """Handeling of REST requests"""
 
-    def __init__(self, username: str = '', api_token: str = '', server_url: str = '', session=None) -> None:
+    # Number of requests sent by this process that may change the server (ie. not GET or HEAD)
+    changing_requests_sent = 0
+
+    def __init__(
+        self,
+        username: str = '',
+        api_token: str = '',
+        server_url: str = '',
+        session=None,
+        *,
+        cache: Optional[RestCache] = None,
+        log_store: Optional[LogStore] = None,
+    ) -> None:
         """TODO Docstring
 
         Args:
@@ -27,14 +63,16 @@ class Rest:
         Returns:
             TODO
         """
+        # Connection pool and worker thread settings of the request session
+        self.pool = ConnectionPool()
+
         # Request session
         if not session:
             logger.debug('Starting new requests session (Type: FuturesSession) ...')
-            self.session = FuturesSession(max_workers=16)
         else:
             # Convert to future session
             logger.debug('Converting request session to FutureSession ...')
-            self.session = FuturesSession(session=session, max_workers=16)
+        self.session = self.pool.new_session(session)
 
         # Authentication passed
         self.username: str = username
@@ -44,6 +82,30 @@ class Rest:
         # Flag signaling if this object has authentication credentials to server
         self.has_credentials = False
 
+        # On-disk cache of GET responses. None if caching is disabled
+        self.cache: Optional[RestCache] = cache
+
+        # Local compressed store of the console logs of finished builds. None if disabled
+        self.log_store: Optional[LogStore] = log_store
+
+        # Called when the server denies a request made with the stored credentials
+        self.on_auth_failure: Optional[Callable[[int], None]] = None
+
+        # Retrying of temporary request failures
+        self.retry = RetryPolicy()
+
+        # Client-side request rate and concurrency limits of the server. None if not limited
+        self.rate_limiter: Optional[RateLimiter] = None
+
+        # Sharing of one in-flight request among identical concurrent GET requests
+        self.single_flight = SingleFlight()
+
+        # Features supported by the server, discovered when first needed
+        self.capabilities = ServerCapabilities(self)
+
+        # CSRF protection crumb sent with requests changing the server
+        self.crumb = CrumbManager(self)
+
     def set_credentials(self, username: str, api_token: str, server_url: str) -> None:
         """TODO Docstring
 
@@ -58,6 +120,25 @@ class Rest:
         self.server_url = server_url.strip('/') + '/'
         self.has_credentials = True
 
+    def configure_pool(
+        self, pool_size: Optional[int] = None, max_workers: Optional[int] = None, keep_alive: Optional[bool] = None
+    ) -> None:
+        """Update the connection pool settings and start a new request session using them
+
+        Args:
+            pool_size   : Number of kept connections to the server. 0 to size the pool automatically
+            max_workers : Number of threads sending requests at the same time
+            keep_alive  : If True, reuse connections for following requests
+
+        Returns:
+            None
+        """
+        if pool_size is None and max_workers is None and keep_alive is None:
+            return
+        self.pool.configure(pool_size=pool_size, max_workers=max_workers, keep_alive=keep_alive)
+        self.session = self.pool.new_session(self.session.session)
+        self.crumb.invalidate()
+
     def get_server_url(self) -> str:
         """TODO Docstring
 
@@ -98,7 +179,7 @@ class Rest:
         logger.debug(f'Checking if server is reachable: "{server_url}" ...')
 
         request_success = self.request(
-            target=server_url, is_endpoint=False, request_type='head', auth_needed=False, timeout=timeout
+            target=server_url, is_endpoint=False, request_type='head', auth_needed=False, timeout=timeout, retries=0
         )[1]
 
         if request_success:
@@ -123,10 +204,20 @@ class Rest:
         headers: dict = {},
         timeout: int = 10,
         allow_redirect: bool = True,
+        *,
+        use_cache: bool = True,
+        fields: Optional[list[str]] = None,
+        retries: Optional[int] = None,
     ) -> tuple[Union[dict, str], dict, bool]:
         """Utility method for a single REST requests
 
-        Details: Currently supported GET, POST, HEAD
+        Details: Currently supported GET, POST, HEAD, DELETE
+                 Connection errors and temporary server failures (ie. 503) of GET, HEAD, and DELETE
+                 requests are retried with exponential backoff, and all requests fast-fail while the
+                 circuit breaker of the server is open.
+                 Identical GET requests made at the same time from different threads (ie. monitor
+                 threads) share one request sent to the server and its returned content. Shared
+                 content must not be changed by the caller.
 
         **TODO**: Refactor/Rework this method. Too bloated. Take appart into multiple methods!
 
@@ -144,6 +235,77 @@ class Rest:
             headers        : Headers passed with the request
             timeout        : Number of seconds to wait for request
             allow_redirect : If True, allow request redirection to other URLs
+            use_cache      : If True, serve and store GET responses with the response cache, if enabled
+            fields         : Only get these fields of the JSON API content, nested with a dot (ie. `lastBuild.number`)
+            retries        : Number of times a temporary failure is retried. Default is the `retry` policy setting
+
+        Returns:
+            Tuple of return content, return header, return success
+        """
+        send_request = partial(
+            self._request,
+            target,
+            request_type,
+            is_endpoint=is_endpoint,
+            json_content=json_content,
+            auth=auth,
+            auth_needed=auth_needed,
+            new_session=new_session,
+            params=params,
+            data=data,
+            json_data=json_data,
+            headers=headers,
+            timeout=timeout,
+            allow_redirect=allow_redirect,
+            use_cache=use_cache,
+            fields=fields,
+            retries=retries,
+        )
+        # Only plain GET requests with the stored credentials are shared
+        coalesce = request_type.lower() == 'get' and auth is None and not new_session and not data and not json_data
+        if not coalesce:
+            return send_request()
+
+        request_key = (
+            self.server_url if is_endpoint else '',
+            target,
+            is_endpoint,
+            json_content,
+            auth_needed,
+            json.dumps(params, sort_keys=True, default=str),
+            json.dumps(headers, sort_keys=True, default=str),
+            use_cache,
+            tuple(fields) if fields else None,
+        )
+        result, shared = self.single_flight.do(request_key, send_request)
+        if shared:
+            logger.debug(f'Shared the response of an identical in-flight request: {target}')
+        return result
+
+    def _request(
+        self,
+        target: str,
+        request_type: Literal['get', 'post', 'head'],
+        *,
+        is_endpoint: bool = True,
+        json_content: bool = True,
+        auth: Optional[tuple] = None,
+        auth_needed: bool = True,
+        new_session: bool = False,
+        params: dict = {},
+        data: dict = {},
+        json_data: dict = {},
+        headers: dict = {},
+        timeout: int = 10,
+        allow_redirect: bool = True,
+        use_cache: bool = True,
+        fields: Optional[list[str]] = None,
+        retries: Optional[int] = None,
+    ) -> tuple[Union[dict, str], dict, bool]:
+        """Send a single REST request, without sharing it with identical concurrent requests
+
+        Args:
+            See `request()`
 
         Returns:
             Tuple of return content, return header, return success
@@ -156,7 +318,34 @@ class Rest:
 
         logger.debug(f'Request URL: {request_url}')
 
+        # Only request the needed fields
+        if fields:
+            params = {**params, 'tree': fields_to_tree(fields)}
+            logger.debug(f'Request fields: {params["tree"]}')
+
+        # Check the response cache
+        cache_usable = (
+            use_cache
+            and self.cache is not None
+            and request_type.lower() == 'get'
+            and auth_needed
+            and not auth
+            and not data
+            and not json_data
+        )
+        cache_entry = None
+        if cache_usable:
+            cache_entry = self.cache.get(self._cache_namespace(), request_url, params)
+            if cache_entry and self.cache.is_fresh(cache_entry):
+                logger.debug(f'Serving response from cache: {request_url}')
+                return_headers = CaseInsensitiveDict(cache_entry['headers'])
+                return self._cache_content(cache_entry, json_content), return_headers, True
+            if cache_entry:
+                logger.debug('Revalidating cached response with server ...')
+                headers = {**headers, **self.cache.validation_headers(cache_entry)}
+
         # Get credentials if needed
+        explicit_auth = auth is not None
         if auth_needed:
             if not auth:
                 auth = HTTPBasicAuth(self.username, self.api_token)
@@ -164,72 +353,42 @@ class Rest:
         # Use a connection session if possible
         if not self.session or new_session:
             logger.debug('Starting new requests session')
-            self.session = FuturesSession(max_workers=16)
+            self.session = self.pool.new_session()
+            # Crumbs are only valid within the session they were issued in
+            self.crumb.invalidate()
 
-        # Making the request
-        start_time = perf_counter()
-        try:
-            if request_type.lower() == 'get':
-                response = self.session.get(
-                    request_url,
-                    params=params,
-                    data=data,
-                    json=json_data,
-                    headers=headers,
-                    auth=auth,
-                    timeout=timeout,
-                    allow_redirects=allow_redirect,
-                )
-            elif request_type.lower() == 'post':
-                response = self.session.post(
-                    request_url,
-                    params=params,
-                    data=data,
-                    json=json_data,
-                    headers=headers,
-                    auth=auth,
-                    timeout=timeout,
-                    allow_redirects=allow_redirect,
-                )
-            elif request_type.lower() == 'head':
-                response = self.session.head(
-                    request_url,
-                    params=params,
-                    data=data,
-                    json=json_data,
-                    headers=headers,
-                    auth=auth,
-                    timeout=timeout,
-                    allow_redirects=allow_redirect,
-                )
-            elif request_type.lower() == 'delete':
-                response = self.session.delete(
-                    request_url,
-                    params=params,
-                    data=data,
-                    json=json_data,
-                    headers=headers,
-                    auth=auth,
-                    timeout=timeout,
-                    allow_redirects=allow_redirect,
-                )
-            else:
-                logger.debug(f'Request type "{request_type}" not recognized')
-                return {}, {}, False
-        except (
-            requests.exceptions.ConnectionError,
-            requests.exceptions.InvalidSchema,
-            requests.exceptions.RequestException,
-        ) as error:
-            logger.debug(f'Failed to make request. Exception: {error}')
+        if request_type.lower() not in ['get', 'post', 'head', 'delete']:
+            logger.debug(f'Request type "{request_type}" not recognized')
             return {}, {}, False
 
-        # Wait on the response to complete and get result
-        try:
-            if hasattr(response, 'result'):
-                response = response.result()
-        except (requests.exceptions.RequestException, Exception) as error:
-            logger.debug(f'Failed to make request. Exception: {error}')
+        # Send the server crumb with requests changing the server, unless one is passed
+        use_crumb = request_type.lower() in ['post', 'delete'] and auth_needed and not explicit_auth
+        if use_crumb and not any('crumb' in header.lower() for header in headers):
+            headers = {**headers, **self.crumb.headers()}
+        else:
+            use_crumb = False
+
+        # Making the request
+        start_time = perf_counter()
+        send_kwargs = {
+            'params': params,
+            'data': data,
+            'json': json_data,
+            'headers': headers,
+            'auth': auth,
+            'timeout': timeout,
+            'allow_redirects': allow_redirect,
+        }
+        response, _ = self._send_with_retries(request_type, request_url, retries, **send_kwargs)
+
+        # Fetch a new crumb and send again if the server rejected the crumb
+        if use_crumb and response is not None and CrumbManager.is_crumb_error(response):
+            logger.debug('Server rejected the crumb. Fetching a new crumb and sending again ...')
+            self.crumb.invalidate(rejected=True)
+            send_kwargs['headers'] = {**headers, **self.crumb.headers()}
+            response, _ = self._send_with_retries(request_type, request_url, retries, **send_kwargs)
+
+        if response is None:
             return {}, {}, False
 
         # For Debug Purposes
@@ -262,6 +421,8 @@ class Rest:
         # Check for permission denied
         if response.status_code in [401, 403, 405]:
             logger.debug('PERMISSION DENIED - HTTP(S) request denied due to insufficient privileges')
+            if response.status_code in [401, 403] and auth_needed and not explicit_auth and self.on_auth_failure:
+                self.on_auth_failure(response.status_code)
             return {}, {}, False
 
         # Check conflict
@@ -273,6 +434,12 @@ class Rest:
         if request_type.lower() == 'head':
             return {}, response.headers, response.ok
 
+        # Cached response is still valid
+        if cache_entry and response.status_code == 304:
+            logger.debug('Cached response is still valid (304 Not Modified)')
+            self.cache.refresh(cache_entry)
+            return self._cache_content(cache_entry, json_content), CaseInsensitiveDict(cache_entry['headers']), True
+
         # Check the return status code
         if not response.ok:
             logger.debug(
@@ -297,4 +464,334 @@ class Rest:
         else:
             logger.debug(f'No content received from {request_type.upper()} request: {request_url}')
 
+        # Update the response cache
+        if cache_usable:
+            immutable = json_content and self.cache.is_immutable_content(return_content)
+            if self.cache.is_storable(response.headers, immutable):
+                self.cache.store(
+                    self._cache_namespace(),
+                    request_url,
+                    params,
+                    response.headers,
+                    response.content,
+                    encoding=response.encoding,
+                    immutable=immutable,
+                )
+        elif self.cache is not None and request_type.lower() in ['post', 'delete']:
+            # Changing an item may change anything cached under it
+            self.cache.invalidate(request_url.rsplit('/', 1)[0])
+
         return return_content, response.headers, True
+
+    def request_stream(
+        self,
+        target: str,
+        item_path: str,
+        is_endpoint: bool = True,
+        params: dict = {},
+        headers: dict = {},
+        *,
+        timeout: int = 10,
+        fields: Optional[list[str]] = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> tuple[Iterator, dict, bool]:
+        """Utility method for a single REST GET request of a large JSON document, yielding the items
+        of one of its arrays while the response is received
+
+        Details: The response is never held in memory as a whole, so very large listings
+                 (ie. `computer/api/json?depth=2`) are processed with bounded memory.
+                 The response cache is not used.
+
+        Args:
+            target      : Request URL target. Does not include server_url
+            item_path   : Object keys leading to the array of items, nested with a dot (ie. `computer`)
+            is_endpoint : If True, add the object-stored server URL address, else do not
+            params      : Parameters passed with the request
+            headers     : Headers passed with the request
+            timeout     : Number of seconds to wait for the response to start
+            fields      : Only get these fields of the JSON API content, nested with a dot (ie. `computer.displayName`)
+            chunk_size  : Number of bytes read from the response at a time
+
+        Returns:
+            Tuple of item iterator, return header, return success
+        """
+        request_url = self.server_url.strip('/') + '/' + target.strip('/') if is_endpoint else target
+        logger.debug(f'Request URL (streamed): {request_url}')
+        if fields:
+            params = {**params, 'tree': fields_to_tree(fields)}
+            logger.debug(f'Request fields: {params["tree"]}')
+
+        chunks, return_headers, status_code = self.request_bytes(
+            request_url, is_endpoint=False, params=params, headers=headers, timeout=timeout, chunk_size=chunk_size
+        )
+        if not 200 <= status_code < 300:
+            return iter([]), {}, False
+        return iter_json_array(chunks, item_path), return_headers, True
+
+    def request_bytes(
+        self,
+        target: str,
+        is_endpoint: bool = True,
+        params: dict = {},
+        headers: dict = {},
+        *,
+        timeout: int = 10,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> tuple[Iterator[bytes], dict, int]:
+        """Utility method for a single REST GET request, yielding the response body in chunks while it is received
+
+        Details: The response is never held in memory as a whole. The response cache is not used.
+                 Any `Range` header is passed on. The server may answer a range request with the
+                 partial content (206), the whole content (200), or no content if the range starts
+                 past the end (416), so the status code is returned. The in-flight request slot is
+                 held until the chunk iterator is exhausted or closed. A lost connection raises
+                 `requests.exceptions.RequestException` from the chunk iterator.
+
+        Args:
+            target      : Request URL target. Does not include server_url
+            is_endpoint : If True, add the object-stored server URL address, else do not
+            params      : Parameters passed with the request
+            headers     : Headers passed with the request
+            timeout     : Number of seconds to wait for the response to start
+            chunk_size  : Number of bytes read from the response at a time
+
+        Returns:
+            Tuple of byte chunk iterator (empty if failed), return header, return status code (0 if no response)
+        """
+        request_url = self.server_url.strip('/') + '/' + target.strip('/') if is_endpoint else target
+        logger.debug(f'Request URL (streamed): {request_url}')
+
+        # Held while the response body is received
+        slot_holder = ExitStack()
+        response, trace_record = self._send_with_retries(
+            'get',
+            request_url,
+            params=params,
+            headers=headers,
+            auth=HTTPBasicAuth(self.username, self.api_token),
+            timeout=timeout,
+            stream=True,
+            slot_holder=slot_holder,
+        )
+        if response is None:
+            return iter([]), {}, 0
+        slot_holder.callback(response.close)
+
+        logger.debug(f'Status code: {response.status_code} ({response.reason})')
+        if not response.ok:
+            logger.debug(f'Failed to make streamed GET request "{request_url}". Server code: {response.status_code}')
+            # Released first, since handling an authentication failure sends requests of its own
+            slot_holder.close()
+            if response.status_code in [401, 403] and self.on_auth_failure:
+                self.on_auth_failure(response.status_code)
+            return iter([]), response.headers, response.status_code
+
+        def response_chunks() -> Iterator[bytes]:
+            start_time = perf_counter()
+            response_bytes = 0
+            try:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    response_bytes += len(chunk)
+                    yield chunk
+            finally:
+                slot_holder.close()
+                if trace_record:
+                    trace_record['bytes'] = response_bytes
+                    trace_record['total_ms'] += round((perf_counter() - start_time) * 1000, 3)
+
+        chunks = response_chunks()
+        # Also release the response if the chunks are dropped before they are read
+        weakref.finalize(chunks, slot_holder.close)
+        return chunks, response.headers, response.status_code
+
+    def _send_with_retries(
+        self,
+        request_type: str,
+        request_url: str,
+        retries: Optional[int] = None,
+        slot_holder: Optional[ExitStack] = None,
+        **kwargs,
+    ) -> tuple[Optional[requests.Response], Optional[dict]]:
+        """Send a request within the server limits, retrying temporary failures of idempotent requests
+
+        Args:
+            request_type : Type of request. Currently `get`, `post`, `head`, `delete` only
+            request_url  : Full request URL
+            retries      : Number of times a temporary failure is retried. Default is the `retry` policy setting
+            slot_holder  : If given, the in-flight slot of the returned response is only released when this
+                           is closed, instead of once the response headers are received
+            kwargs       : Any other arguments passed to the request session
+
+        Returns:
+            Response (None if the request failed without a response or was not sent),
+            and the request trace record (None if not tracing)
+        """
+        # Fast-fail while the server is failing
+        circuit_breaker = CircuitBreaker.for_server(urlparse(request_url).netloc)
+        if not circuit_breaker.allow_request():
+            logger.debug(f'Circuit breaker open for "{urlparse(request_url).netloc}". Request not sent')
+            return None, None
+
+        # Client-side rate and concurrency limits only apply to the configured server
+        rate_limiter = self.rate_limiter
+        if rate_limiter and (not rate_limiter.enabled() or urlparse(request_url).netloc != rate_limiter.server):
+            rate_limiter = None
+
+        if request_type.lower() not in ['get', 'head']:
+            Rest.changing_requests_sent += 1
+
+        retries = self.retry.retries if retries is None else retries
+        attempt = 0
+        start_time = perf_counter()
+        while True:
+            with ExitStack() as slot:
+                try:
+                    slot.enter_context(rate_limiter.limit() if rate_limiter else nullcontext())
+                except TimeoutError as error:
+                    logger.debug(f'Request not sent. {error}')
+                    response = None
+                    break
+                response = self._send(request_type, request_url, **kwargs)
+                if response is not None and response.status_code not in RETRY_STATUS_CODES:
+                    if slot_holder is not None:
+                        slot_holder.push(slot.pop_all())
+                    circuit_breaker.record_success()
+                    break
+
+            retry_after = None
+            if response is not None:
+                retry_after = RetryPolicy.parse_retry_after(response.headers.get('Retry-After'))
+                logger.debug(f'Server responded with temporary failure: {response.status_code} ({response.reason})')
+            circuit_breaker.record_failure(retry_after)
+
+            delay = None
+            if self.retry.is_retryable(request_type) and attempt < retries and not circuit_breaker.is_open():
+                delay = self.retry.delay(attempt, retry_after)
+            if delay is None:
+                break
+            attempt += 1
+            logger.debug(f'Retrying request in {delay:.2f} seconds (Retry {attempt}/{retries}) ...')
+            sleep(delay)
+
+        # Record the request with the tracer of the running command
+        trace_record = None
+        tracer = RequestTracer.active
+        if tracer:
+            response_bytes = None
+            if response is not None and not kwargs.get('stream'):
+                response_bytes = len(response.content)
+            trace_record = tracer.record(
+                request_type,
+                request_url,
+                response.status_code if response is not None else None,
+                response_bytes,
+                response.elapsed.total_seconds() if response is not None else None,
+                start_time=start_time,
+                retries=attempt,
+            )
+        return response, trace_record
+
+    def _send(self, request_type: str, request_url: str, **kwargs) -> Optional[requests.Response]:
+        """Send a single request and wait for its response
+
+        Args:
+            request_type : Type of request. Currently `get`, `post`, `head`, `delete` only
+            request_url  : Full request URL
+            kwargs       : Any other arguments passed to the request session
+
+        Returns:
+            Response, None if the request failed without a response
+        """
+        try:
+            with self.pool.track():
+                response = getattr(self.session, request_type.lower())(request_url, **kwargs)
+                if hasattr(response, 'result'):
+                    response = response.result()
+        except (requests.exceptions.RequestException, Exception) as error:
+            logger.debug(f'Failed to make request. Exception: {error}')
+            return None
+        return response
+
+    def _cache_namespace(self) -> str:
+        """Get the response cache namespace of the current credentials
+
+        Args:
+            None
+
+        Returns:
+            Cache namespace
+        """
+        return f'{self.username}@{self.server_url.strip("/")}'
+
+    @staticmethod
+    def _cache_content(cache_entry: dict, json_content: bool) -> Union[dict, str]:
+        """Get the return content from a cached response
+
+        Args:
+            cache_entry  : Cached entry
+            json_content : If True, parse as json/dict, else return raw content text
+
+        Returns:
+            Return content
+        """
+        if not cache_entry['body']:
+            return {}
+        if json_content:
+            try:
+                return json.loads(cache_entry['body'])
+            except ValueError as error:
+                logger.debug(f'Failed to parse cached response as JSON. Exception: {error})')
+                return {}
+        return bytes(cache_entry['body']).decode(cache_entry['encoding'] or 'utf-8', errors='replace')
+
+    def request_many(
+        self,
+        requests_kwargs: list[dict],
+        max_concurrent: int = REQUEST_MANY_MAX_CONCURRENT,
+        in_order: bool = True,
+    ) -> Union[list[tuple[Union[dict, str], dict, bool]], Iterator[tuple[int, tuple[Union[dict, str], dict, bool]]]]:
+        """Send a batch of REST requests concurrently
+
+        Details: Each item in `requests_kwargs` holds the keyword arguments of one `Rest.request()`
+                 call (ie. `{'target': url, 'request_type': 'get', 'is_endpoint': False}`).
+                 All requests are submitted at once and at most `max_concurrent` are in flight.
+
+        Args:
+            requests_kwargs : List of keyword arguments, one dict per request
+            max_concurrent  : Maximum number of requests in flight at the same time
+            in_order        : If True, return a list of results in the same order as passed,
+                              else return an iterator yielding `(index, result)` as each request completes
+
+        Returns:
+            List of `Rest.request()` return tuples, or iterator of index and return tuple
+        """
+        if not requests_kwargs:
+            return [] if in_order else iter([])
+
+        number_of_workers = max(1, min(max_concurrent, len(requests_kwargs)))
+        logger.debug(f'Sending {len(requests_kwargs)} requests with {number_of_workers} concurrent workers ...')
+        self.pool.request_concurrency(number_of_workers)
+
+        if in_order:
+            with ThreadPoolExecutor(max_workers=number_of_workers) as executor:
+                futures = [executor.submit(self.request, **kwargs) for kwargs in requests_kwargs]
+                return [future.result() for future in futures]
+
+        return self._request_many_as_completed(requests_kwargs, number_of_workers)
+
+    def _request_many_as_completed(
+        self, requests_kwargs: list[dict], number_of_workers: int
+    ) -> Iterator[tuple[int, tuple[Union[dict, str], dict, bool]]]:
+        """Yield the result of each request in a batch as soon as it completes
+
+        Args:
+            requests_kwargs   : List of keyword arguments, one dict per request
+            number_of_workers : Number of concurrent workers
+
+        Returns:
+            Iterator of request index and `Rest.request()` return tuple
+        """
+        with ThreadPoolExecutor(max_workers=number_of_workers) as executor:
+            futures = {executor.submit(self.request, **kwargs): index for index, kwargs in enumerate(requests_kwargs)}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
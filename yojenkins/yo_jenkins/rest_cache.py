@@ -0,0 +1,393 @@
+"""RestCache class definition"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from time import time
+from typing import Optional
+from urllib.parse import urlencode
+
+from yojenkins.yo_jenkins.jenkins_item_classes import JenkinsItemClasses
+
+# Getting the logger reference
+logger = logging.getLogger()
+
+# TODO: Find centralized location for these static values
+CONFIG_DIR_NAME = '.yojenkins'
+CACHE_DIR_NAME = 'cache'
+CACHE_FILE_NAME = 'cache.sqlite'
+
+# Seconds a mutable response is served without revalidating with the server
+DEFAULT_CACHE_TTL = 0
+# Maximum size of all cached response bodies, in megabytes
+DEFAULT_CACHE_MAX_SIZE_MB = 256
+
+
+class RestCache:
+    """On-disk cache of REST GET responses
+
+    Details: Responses are stored in a SQLite database and keyed by the requesting user,
+             the server, and the full request URL with parameters. Entries are either immutable
+             (ie. finished builds), which are served forever, or mutable, which are served for
+             `ttl` seconds and then revalidated with the server using `ETag`/`Last-Modified`.
+             Least recently used entries are evicted once the total size exceeds `max_size_mb`.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = '',
+        ttl: float = DEFAULT_CACHE_TTL,
+        max_size_mb: float = DEFAULT_CACHE_MAX_SIZE_MB,
+    ) -> None:
+        """Object constructor method, called at object creation
+
+        Args:
+            cache_dir   : Directory holding the cache database. Default is `~/.yojenkins/cache`
+            ttl         : Seconds a mutable response is served without revalidating
+            max_size_mb : Maximum size of all cached response bodies, in megabytes
+
+        Returns:
+            None
+        """
+        self.cache_dir = cache_dir or os.path.join(Path.home(), CONFIG_DIR_NAME, CACHE_DIR_NAME)
+        self.ttl = ttl
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._disabled = False
+
+    def configure(self, ttl: Optional[float] = None, max_size_mb: Optional[float] = None) -> None:
+        """Update the cache settings
+
+        Args:
+            ttl         : Seconds a mutable response is served without revalidating
+            max_size_mb : Maximum size of all cached response bodies, in megabytes
+
+        Returns:
+            None
+        """
+        if ttl is not None:
+            self.ttl = float(ttl)
+        if max_size_mb is not None:
+            self.max_size_bytes = int(float(max_size_mb) * 1024 * 1024)
+        logger.debug(f'Response cache settings: TTL: {self.ttl}s, Max size: {self.max_size_bytes} bytes')
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the cache database, creating it if needed
+
+        Details: Any failure disables the cache for the rest of the session instead of failing the request
+
+        Args:
+            None
+
+        Returns:
+            Database connection, None if cache could not be opened
+        """
+        if self._connection or self._disabled:
+            return self._connection
+
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            cache_filepath = os.path.join(self.cache_dir, CACHE_FILE_NAME)
+            logger.debug(f'Opening response cache: {cache_filepath}')
+            connection = sqlite3.connect(cache_filepath, timeout=5, check_same_thread=False)
+            os.chmod(cache_filepath, 0o600)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    stored REAL NOT NULL,
+                    accessed REAL NOT NULL,
+                    immutable INTEGER NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    encoding TEXT,
+                    headers TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL
+                )
+                """
+            )
+            connection.execute('CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)')
+            connection.execute('CREATE INDEX IF NOT EXISTS responses_url ON responses (url)')
+            connection.commit()
+        except (sqlite3.Error, OSError) as error:
+            logger.debug(f'Failed to open response cache. Disabling cache. Exception: {error}')
+            self._disabled = True
+            return None
+
+        self._connection = connection
+        return self._connection
+
+    @staticmethod
+    def make_key(namespace: str, url: str, params: Optional[dict] = None) -> str:
+        """Build the cache key for a request
+
+        Args:
+            namespace : Requesting user and server identifier
+            url       : Full request URL
+            params    : Parameters passed with the request
+
+        Returns:
+            Cache key
+        """
+        query = urlencode(sorted(params.items()), doseq=True) if params else ''
+        return hashlib.sha256(f'{namespace}|{url}?{query}'.encode()).hexdigest()
+
+    @staticmethod
+    def is_immutable_content(content: dict) -> bool:
+        """Check if the returned JSON content describes a Jenkins item that will no longer change
+
+        Details: A build is finished and immutable once its `result` is set and it is not building
+
+        Args:
+            content : Parsed JSON content returned by the server
+
+        Returns:
+            True if content will no longer change, else False
+        """
+        if not isinstance(content, dict):
+            return False
+        if content.get('_class') not in JenkinsItemClasses.BUILD.value['class_type']:
+            return False
+        return content.get('result') is not None and not content.get('building', False)
+
+    def get(self, namespace: str, url: str, params: Optional[dict] = None) -> Optional[dict]:
+        """Get a cached response
+
+        Args:
+            namespace : Requesting user and server identifier
+            url       : Full request URL
+            params    : Parameters passed with the request
+
+        Returns:
+            Cached entry, None if not cached
+        """
+        connection = self._connect()
+        if not connection:
+            return None
+
+        key = self.make_key(namespace, url, params)
+        try:
+            with self._lock:
+                row = connection.execute(
+                    'SELECT stored, immutable, etag, last_modified, encoding, headers, body '
+                    'FROM responses WHERE key = ?',
+                    (key,),
+                ).fetchone()
+                if not row:
+                    return None
+                connection.execute('UPDATE responses SET accessed = ? WHERE key = ?', (time(), key))
+                connection.commit()
+        except sqlite3.Error as error:
+            logger.debug(f'Failed to read response cache. Exception: {error}')
+            return None
+
+        return {
+            'key': key,
+            'stored': row[0],
+            'immutable': bool(row[1]),
+            'etag': row[2],
+            'last_modified': row[3],
+            'encoding': row[4],
+            'headers': json.loads(row[5]),
+            'body': row[6],
+        }
+
+    def is_fresh(self, entry: dict) -> bool:
+        """Check if a cached entry can be served without revalidating with the server
+
+        Args:
+            entry : Cached entry
+
+        Returns:
+            True if entry can be served as is, else False
+        """
+        return entry['immutable'] or time() - entry['stored'] < self.ttl
+
+    @staticmethod
+    def validation_headers(entry: dict) -> dict:
+        """Get the conditional request headers used to revalidate a cached entry
+
+        Args:
+            entry : Cached entry
+
+        Returns:
+            Request headers
+        """
+        headers = {}
+        if entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        if entry['last_modified']:
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def is_storable(self, headers: dict, immutable: bool) -> bool:
+        """Check if a response is worth storing
+
+        Details: Mutable responses without validators are only stored if they can be served for a while
+
+        Args:
+            headers   : Response headers
+            immutable : If True, response will no longer change
+
+        Returns:
+            True if response should be stored, else False
+        """
+        return immutable or self.ttl > 0 or 'ETag' in headers or 'Last-Modified' in headers
+
+    def store(
+        self,
+        namespace: str,
+        url: str,
+        params: Optional[dict],
+        headers: dict,
+        body: bytes,
+        *,
+        encoding: Optional[str],
+        immutable: bool,
+    ) -> None:
+        """Store a response
+
+        Args:
+            namespace : Requesting user and server identifier
+            url       : Full request URL
+            params    : Parameters passed with the request
+            headers   : Response headers
+            body      : Raw response body
+            encoding  : Text encoding of the response body
+            immutable : If True, response will no longer change and is served forever
+
+        Returns:
+            None
+        """
+        if len(body) > self.max_size_bytes:
+            logger.debug(f'Response too large to cache ({len(body)} bytes): {url}')
+            return
+        connection = self._connect()
+        if not connection:
+            return
+
+        now = time()
+        key = self.make_key(namespace, url, params)
+        logger.debug(f'Caching response ({"immutable" if immutable else "mutable"}, {len(body)} bytes): {url}')
+        try:
+            with self._lock:
+                connection.execute(
+                    'INSERT OR REPLACE INTO responses '
+                    '(key, url, stored, accessed, immutable, etag, last_modified, encoding, headers, body, size) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    (
+                        key,
+                        url,
+                        now,
+                        now,
+                        int(immutable),
+                        headers.get('ETag'),
+                        headers.get('Last-Modified'),
+                        encoding,
+                        json.dumps(dict(headers)),
+                        sqlite3.Binary(body),
+                        len(body),
+                    ),
+                )
+                connection.commit()
+                self._evict(connection)
+        except sqlite3.Error as error:
+            logger.debug(f'Failed to write response cache. Exception: {error}')
+
+    def refresh(self, entry: dict) -> None:
+        """Mark a cached entry as revalidated by the server
+
+        Args:
+            entry : Cached entry
+
+        Returns:
+            None
+        """
+        connection = self._connect()
+        if not connection:
+            return
+        try:
+            with self._lock:
+                connection.execute('UPDATE responses SET stored = ? WHERE key = ?', (time(), entry['key']))
+                connection.commit()
+        except sqlite3.Error as error:
+            logger.debug(f'Failed to update response cache. Exception: {error}')
+
+    def invalidate(self, url_prefix: str) -> None:
+        """Remove all cached entries under a URL
+
+        Args:
+            url_prefix : URL prefix of the entries to remove
+
+        Returns:
+            None
+        """
+        connection = self._connect()
+        if not connection:
+            return
+        url_prefix = url_prefix.strip('/')
+        logger.debug(f'Invalidating cached responses under: {url_prefix}')
+        escaped = url_prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        try:
+            with self._lock:
+                connection.execute(
+                    "DELETE FROM responses WHERE url = ? OR url LIKE ? ESCAPE '\\'", (url_prefix, f'{escaped}/%')
+                )
+                connection.commit()
+        except sqlite3.Error as error:
+            logger.debug(f'Failed to invalidate response cache. Exception: {error}')
+
+    def clear(self) -> None:
+        """Remove all cached entries
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        connection = self._connect()
+        if not connection:
+            return
+        try:
+            with self._lock:
+                connection.execute('DELETE FROM responses')
+                connection.commit()
+                connection.execute('VACUUM')
+        except sqlite3.Error as error:
+            logger.debug(f'Failed to clear response cache. Exception: {error}')
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Remove the least recently used entries until the cache is within its size limit
+
+        Details: Evicts down to 90% of the size limit to avoid evicting on every store
+
+        Args:
+            connection : Database connection
+
+        Returns:
+            None
+        """
+        total_size = connection.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total_size <= self.max_size_bytes:
+            return
+
+        target_size = self.max_size_bytes * 0.9
+        evict_keys = []
+        for key, size in connection.execute('SELECT key, size FROM responses ORDER BY accessed ASC'):
+            if total_size <= target_size:
+                break
+            evict_keys.append((key,))
+            total_size -= size
+        logger.debug(f'Evicting {len(evict_keys)} least recently used cached responses ...')
+        connection.executemany('DELETE FROM responses WHERE key = ?', evict_keys)
+        connection.commit()
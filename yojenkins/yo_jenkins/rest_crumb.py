@@ -0,0 +1,105 @@
+"""CrumbManager class definition"""
+
+import logging
+import threading
+from typing import Optional
+
+import requests
+
+# Getting the logger reference
+logger = logging.getLogger()
+
+# Text of the server response to a request with a missing or expired crumb
+CRUMB_ERROR_TEXT = b'No valid crumb was included in the request'
+
+
+class CrumbManager:
+    """CSRF protection crumb of a server, shared by all requests changing the server
+
+    Details: The crumb is fetched from `crumbIssuer` before the first POST or DELETE request and
+             sent with every following one. Since the server ties a crumb to the web session
+             (session cookie) it was issued in, it is kept for the life of the `Rest` session,
+             including across commands within the agent daemon, and is not written to disk.
+             It is only fetched again when the server rejects it or a new session is started.
+             If the server has no crumb issuer, no crumb is sent.
+    """
+
+    def __init__(self, rest) -> None:
+        """Object constructor method, called at object creation
+
+        Args:
+            rest : Rest object of the server
+
+        Returns:
+            None
+        """
+        self.rest = rest
+
+        # Crumb header by field name. Empty if no crumb is sent. None if not yet fetched
+        self._headers: Optional[dict] = None
+        # Server rejected a request without a crumb, even if known not to require one
+        self._rejected = False
+        self._lock = threading.Lock()
+
+    def headers(self) -> dict:
+        """Get the crumb header to send, fetching the crumb if not yet fetched
+
+        Returns:
+            Crumb header by field name (ie. `{'Jenkins-Crumb': '...'}`), empty if no crumb is needed or available
+        """
+        with self._lock:
+            if self._headers is None:
+                self._headers = self._fetch()
+            return self._headers
+
+    def invalidate(self, rejected: bool = False) -> None:
+        """Forget the crumb, so that it is fetched again before the next request changing the server
+
+        Args:
+            rejected : If True, the server rejected the crumb sent, or a request without one
+
+        Returns:
+            None
+        """
+        with self._lock:
+            if self._headers:
+                logger.debug('Dropping server crumb')
+            self._headers = None
+            self._rejected = self._rejected or rejected
+
+    @staticmethod
+    def is_crumb_error(response: requests.Response) -> bool:
+        """Check if the server rejected a request for a missing or expired crumb
+
+        Args:
+            response : Server response
+
+        Returns:
+            True if rejected for the crumb, else False
+        """
+        return response.status_code == 403 and CRUMB_ERROR_TEXT in (response.content or b'')
+
+    def _fetch(self) -> dict:
+        """Request a new crumb from the server crumb issuer
+
+        Details: If the crumb issuer cannot be reached (ie. the server has none), requests are sent
+                 without a crumb until the server rejects one for a missing crumb
+
+        Returns:
+            Crumb header by field name, empty if the server needs no crumb or none is available
+        """
+        if not self._rejected and self.rest.capabilities.peek('crumb_required') is False:
+            logger.debug('Server does not require a crumb')
+            return {}
+
+        logger.debug('Fetching server crumb ...')
+        content, _, success = self.rest.request(
+            'crumbIssuer/api/json', 'get', is_endpoint=True, use_cache=False, fields=['crumb', 'crumbRequestField']
+        )
+        if not success or not isinstance(content, dict) or not content.get('crumb'):
+            logger.debug('Failed to fetch server crumb. Sending requests without a crumb')
+            return {}
+
+        crumb_field = content.get('crumbRequestField') or 'Jenkins-Crumb'
+        logger.debug(f'Using server crumb with field "{crumb_field}"')
+        return {crumb_field: content['crumb']}
@@ -0,0 +1,197 @@
+"""ConnectionPool class definition"""
+
+import logging
+import math
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Optional
+
+import requests
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from requests_futures.sessions import FuturesSession
+
+# Getting the logger reference
+logger = logging.getLogger()
+
+# Number of threads sending requests of a session at the same time
+DEFAULT_MAX_WORKERS = 16
+# Number of kept connections to the server. 0 to size the pool automatically
+DEFAULT_POOL_SIZE = 0
+# Weight of the newest sample in the averaged request latency and interval
+AVERAGE_WEIGHT = 0.2
+
+
+class ConnectionPool:
+    """Connection pool, worker threads, and keep-alive settings of a server session
+
+    Details: With a fixed `pool_size`, that many connections to the server are kept open for reuse.
+             Otherwise the pool starts at the `requests` default size and grows, up to `max_workers`,
+             to the number of requests sent at the same time. This is either the concurrency asked
+             for (ie. by `Rest.request_many()`), the requests seen in flight, or the concurrency
+             expected from the averaged request rate and latency (Little's law), whichever is
+             largest. The pool only grows, since a larger pool only keeps more idle connections.
+             Without `keep_alive`, every request uses a new connection that is closed after it.
+    """
+
+    def __init__(
+        self, pool_size: int = DEFAULT_POOL_SIZE, max_workers: int = DEFAULT_MAX_WORKERS, keep_alive: bool = True
+    ) -> None:
+        """Object constructor method, called at object creation
+
+        Args:
+            pool_size   : Number of kept connections to the server. 0 to size the pool automatically
+            max_workers : Number of threads sending requests at the same time
+            keep_alive  : If True, reuse connections for following requests, else close them after each
+
+        Returns:
+            None
+        """
+        self.pool_size = pool_size
+        self.max_workers = max_workers
+        self.keep_alive = keep_alive
+
+        # Session sending the requests, and the current pool size of its adapters
+        self._session: Optional[requests.Session] = None
+        self._size = 0
+
+        # Observed requests, for automatic sizing
+        self._in_flight = 0
+        self._latency = 0.0
+        self._interval = 0.0
+        self._last_start = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def adaptive(self) -> bool:
+        """True if the pool is sized automatically"""
+        return self.pool_size <= 0
+
+    def configure(
+        self, pool_size: Optional[int] = None, max_workers: Optional[int] = None, keep_alive: Optional[bool] = None
+    ) -> None:
+        """Update the pool settings. Applied to sessions created afterwards
+
+        Args:
+            pool_size   : Number of kept connections to the server. 0 to size the pool automatically
+            max_workers : Number of threads sending requests at the same time
+            keep_alive  : If True, reuse connections for following requests
+
+        Returns:
+            None
+        """
+        if pool_size is not None:
+            self.pool_size = int(pool_size)
+        if max_workers is not None:
+            self.max_workers = max(1, int(max_workers))
+        if keep_alive is not None:
+            self.keep_alive = keep_alive if isinstance(keep_alive, bool) else str(keep_alive).lower() == 'true'
+
+    def new_session(self, session: Optional[requests.Session] = None) -> FuturesSession:
+        """Create a session sending requests with the pool settings
+
+        Args:
+            session : Existing session to send the requests with. Default is a new session
+
+        Returns:
+            Session returning a future for each request
+        """
+        futures_session = FuturesSession(session=session, max_workers=self.max_workers)
+        with self._lock:
+            self._session = session or futures_session
+            self._size = 0
+            self._in_flight = 0
+            size = self.pool_size if not self.adaptive else min(DEFAULT_POOLSIZE, self.max_workers)
+            self._mount(size)
+        if not self.keep_alive:
+            self._session.headers['Connection'] = 'close'
+        logger.debug(
+            f'Request session: {self.max_workers} workers, '
+            f'{"automatic" if self.adaptive else "fixed"} connection pool of {self._size}, '
+            f'keep-alive {"on" if self.keep_alive else "off"}'
+        )
+        return futures_session
+
+    def request_concurrency(self, concurrency: int) -> None:
+        """Grow an automatically sized pool ahead of sending requests at the same time
+
+        Args:
+            concurrency : Number of requests about to be sent at the same time
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._grow(concurrency)
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """Record a request being sent, for automatic sizing
+
+        Returns:
+            None
+        """
+        if not self.adaptive:
+            yield
+            return
+
+        start_time = perf_counter()
+        with self._lock:
+            if self._last_start:
+                self._interval = _average(self._interval, start_time - self._last_start)
+            self._last_start = start_time
+            self._in_flight += 1
+            self._grow(self._in_flight)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._latency = _average(self._latency, perf_counter() - start_time)
+                if self._interval > 0:
+                    self._grow(math.ceil(self._latency / self._interval))
+
+    def _grow(self, concurrency: int) -> None:
+        """Grow an automatically sized pool to fit a number of requests sent at the same time
+
+        Details: The pool is doubled until large enough, so that it is replaced only a few times
+
+        Args:
+            concurrency : Number of requests sent at the same time
+
+        Returns:
+            None
+        """
+        if not self.adaptive or not self._session or concurrency <= self._size or self._size >= self.max_workers:
+            return
+        size = self._size
+        while size < concurrency:
+            size *= 2
+        self._mount(min(size, self.max_workers))
+        logger.debug(
+            f'Connection pool grown to {self._size} for {concurrency} concurrent requests '
+            f'(Average latency: {self._latency * 1000:.0f} ms)'
+        )
+
+    def _mount(self, size: int) -> None:
+        """Replace the connection adapters of the session with ones of a pool size
+
+        Details: Requests still in flight finish on the replaced adapters, whose connections
+                 are then closed once no longer used
+
+        Args:
+            size : Number of kept connections
+
+        Returns:
+            None
+        """
+        self._size = max(1, size)
+        adapter = HTTPAdapter(pool_connections=self._size, pool_maxsize=self._size)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+
+def _average(average: float, sample: float) -> float:
+    """Update an exponentially weighted average with a new sample"""
+    return sample if not average else average + AVERAGE_WEIGHT * (sample - average)
@@ -0,0 +1,249 @@
+"""RetryPolicy and CircuitBreaker class definitions"""
+
+import logging
+import random
+import threading
+from email.utils import parsedate_to_datetime
+from time import time
+from typing import Optional
+
+# Getting the logger reference
+logger = logging.getLogger()
+
+# Number of times a failed idempotent request is sent again
+DEFAULT_RETRIES = 3
+# Seconds of the first retry delay, doubled on each following retry
+DEFAULT_RETRY_BACKOFF = 0.5
+# Longest seconds waited before a retry. A longer server `Retry-After` is not waited for
+DEFAULT_RETRY_BACKOFF_MAX = 30.0
+# Consecutive failed requests to a server that open its circuit breaker. 0 to disable
+DEFAULT_CIRCUIT_BREAKER_THRESHOLD = 5
+# Seconds an open circuit breaker fast-fails requests before letting a trial request through
+DEFAULT_CIRCUIT_BREAKER_TIMEOUT = 30.0
+
+# Request methods that can safely be sent more than once
+RETRY_METHODS = ['get', 'head', 'delete']
+# Server response codes signaling a temporary failure or overload
+RETRY_STATUS_CODES = [429, 502, 503, 504]
+
+
+class RetryPolicy:
+    """Retry settings of failed REST requests
+
+    Details: Delays grow exponentially from `backoff` up to `backoff_max` seconds and use full
+             jitter (a random delay between zero and the exponential delay), so that many clients
+             failing at the same time do not retry at the same time. A `Retry-After` given by the
+             server is used as the shortest delay.
+    """
+
+    def __init__(
+        self,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = DEFAULT_RETRY_BACKOFF,
+        backoff_max: float = DEFAULT_RETRY_BACKOFF_MAX,
+    ) -> None:
+        """Object constructor method, called at object creation
+
+        Args:
+            retries     : Number of times a failed idempotent request is sent again. 0 to not retry
+            backoff     : Seconds of the first retry delay
+            backoff_max : Longest seconds waited before a retry
+
+        Returns:
+            None
+        """
+        self.retries = retries
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+
+    def configure(
+        self, retries: Optional[int] = None, backoff: Optional[float] = None, backoff_max: Optional[float] = None
+    ) -> None:
+        """Update the retry settings
+
+        Args:
+            retries     : Number of times a failed idempotent request is sent again
+            backoff     : Seconds of the first retry delay
+            backoff_max : Longest seconds waited before a retry
+
+        Returns:
+            None
+        """
+        if retries is not None:
+            self.retries = int(retries)
+        if backoff is not None:
+            self.backoff = float(backoff)
+        if backoff_max is not None:
+            self.backoff_max = float(backoff_max)
+        logger.debug(f'Request retry settings: Retries: {self.retries}, Backoff: {self.backoff}-{self.backoff_max}s')
+
+    @staticmethod
+    def is_retryable(request_type: str) -> bool:
+        """Check if a request method can safely be sent more than once
+
+        Args:
+            request_type : Type of request (ie. `get`, `post`)
+
+        Returns:
+            True if retryable, else False
+        """
+        return request_type.lower() in RETRY_METHODS
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """Get the seconds to wait before retrying a failed request
+
+        Args:
+            attempt     : Number of retries already made
+            retry_after : Seconds the server asked to wait with `Retry-After`, if any
+
+        Returns:
+            Seconds to wait, None if the request should not be retried
+        """
+        if attempt >= self.retries:
+            return None
+        if retry_after is not None and retry_after > self.backoff_max:
+            logger.debug(f'Server asked to retry in {retry_after:.0f} seconds. Not waiting that long')
+            return None
+        delay = random.uniform(0, min(self.backoff_max, self.backoff * 2**attempt))
+        return max(delay, retry_after or 0.0)
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse the value of a `Retry-After` response header
+
+        Args:
+            value : Header value, in seconds or as an HTTP date
+
+        Returns:
+            Seconds to wait, None if not given or not valid
+        """
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time())
+        except (TypeError, ValueError, IndexError):
+            return None
+
+
+class CircuitBreaker:
+    """Per-server fast-fail of requests while the server is failing
+
+    Details: After `threshold` consecutive failed requests (connection errors or temporary
+             failure responses) the circuit opens and requests to that server fail right away,
+             without contacting it, for `timeout` seconds. A single trial request is then let
+             through. If it succeeds the circuit closes, else it opens again.
+             All `Rest` objects within the same process share the breaker of each server.
+    """
+
+    # Circuit breakers by server address
+    _breakers: dict[str, 'CircuitBreaker'] = {}
+    _breakers_lock = threading.Lock()
+
+    def __init__(
+        self,
+        threshold: int = DEFAULT_CIRCUIT_BREAKER_THRESHOLD,
+        timeout: float = DEFAULT_CIRCUIT_BREAKER_TIMEOUT,
+    ) -> None:
+        """Object constructor method, called at object creation
+
+        Args:
+            threshold : Consecutive failed requests opening the circuit. 0 to never open
+            timeout   : Seconds the open circuit fast-fails requests
+
+        Returns:
+            None
+        """
+        self.threshold = threshold
+        self.timeout = timeout
+
+        self.failures = 0
+        self.open_until = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_server(cls, server: str) -> 'CircuitBreaker':
+        """Get the shared circuit breaker of a server
+
+        Args:
+            server : Server address (ie. `localhost:8080`)
+
+        Returns:
+            Circuit breaker of the server
+        """
+        with cls._breakers_lock:
+            if server not in cls._breakers:
+                cls._breakers[server] = cls()
+            return cls._breakers[server]
+
+    def configure(self, threshold: Optional[int] = None, timeout: Optional[float] = None) -> None:
+        """Update the circuit breaker settings
+
+        Args:
+            threshold : Consecutive failed requests opening the circuit
+            timeout   : Seconds the open circuit fast-fails requests
+
+        Returns:
+            None
+        """
+        if threshold is not None:
+            self.threshold = int(threshold)
+        if timeout is not None:
+            self.timeout = float(timeout)
+
+    def is_open(self) -> bool:
+        """Check if requests are currently fast-failed
+
+        Returns:
+            True if open, else False
+        """
+        return self.open_until > time()
+
+    def allow_request(self) -> bool:
+        """Check if a request may be sent, taking the trial request slot if the circuit is half-open
+
+        Returns:
+            True if the request may be sent, else False
+        """
+        with self._lock:
+            if not self.open_until:
+                return True
+            if self.open_until > time() or self._trial_in_flight:
+                return False
+            logger.debug('Circuit breaker half-open. Sending a trial request ...')
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        """Record a successful request, closing the circuit
+
+        Returns:
+            None
+        """
+        with self._lock:
+            if self.open_until:
+                logger.debug('Circuit breaker closed. Server is responding again')
+            self.failures = 0
+            self.open_until = 0.0
+            self._trial_in_flight = False
+
+    def record_failure(self, retry_after: Optional[float] = None) -> None:
+        """Record a failed request, opening the circuit if too many failed in a row
+
+        Args:
+            retry_after : Seconds the server asked to wait with `Retry-After`, if any
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if not self.threshold or (self.failures < self.threshold and not self.open_until):
+                return
+            open_for = max(self.timeout, retry_after or 0.0)
+            self.open_until = time() + open_for
+            logger.debug(f'Circuit breaker open after {self.failures} failed requests. Fast-failing for {open_for}s')
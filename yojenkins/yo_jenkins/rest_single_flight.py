@@ -0,0 +1,98 @@
+"""SingleFlight class definition"""
+
+import copy
+import logging
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any, Optional
+
+# Getting the logger reference
+logger = logging.getLogger()
+
+
+class _Call:
+    """Call in progress, waited on by the callers sharing its result"""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.thread = threading.get_ident()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.shared = 0
+
+
+class SingleFlight:
+    """Coalescing of identical calls made at the same time by different threads
+
+    Details: While a call with a key is in progress, other calls with the same key wait for it
+             and get its result (or its exception) instead of making the call again. Once it
+             is done, the next call with that key is made again. A shared result is copied for
+             each caller, including the one that made the call, so each caller may change its own.
+    """
+
+    def __init__(self) -> None:
+        """Object constructor method, called at object creation
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> tuple[Any, bool]:
+        """Call the function, or wait for the call in progress with the same key
+
+        Args:
+            key      : Key identifying identical calls
+            function : Function to call
+
+        Returns:
+            Result of the call (a copy if shared), and True if it was shared from a call in progress, else False
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+            elif call.thread == threading.get_ident():
+                # Same key called again from within the call. Waiting would never end
+                call = None
+                leader = False
+            else:
+                call.shared += 1
+                leader = False
+
+        if call is None:
+            return function(), False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result), True
+
+        try:
+            call.result = function()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+            if call.shared:
+                logger.debug(f'Shared the result of one call with {call.shared} identical concurrent calls')
+        # No more callers join once the call is done, so the number of sharing callers is final
+        return (copy.deepcopy(call.result) if call.shared else call.result), False
+
+    def in_flight(self) -> int:
+        """Get the number of calls in progress
+
+        Returns:
+            Number of calls in progress
+        """
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,225 @@
+"""RequestTracer class definition"""
+
+import json
+import logging
+import os
+import re
+import threading
+from time import perf_counter, time
+from typing import Optional
+from urllib.parse import urlparse
+
+# Getting the logger reference
+logger = logging.getLogger()
+
+# URL path parts replaced with a placeholder to group requests by endpoint
+URL_TEMPLATE_PATTERNS = [
+    (re.compile(r'/job/[^/]+'), '/job/{name}'),
+    (re.compile(r'/view/[^/]+'), '/view/{name}'),
+    (re.compile(r'/computer/(?!api/)[^/]+'), '/computer/{name}'),
+    (re.compile(r'/user/[^/]+'), '/user/{name}'),
+    (re.compile(r'/credentials/store/[^/]+/domain/[^/]+'), '/credentials/store/{store}/domain/{domain}'),
+    (re.compile(r'/credential/[^/]+'), '/credential/{id}'),
+    (re.compile(r'/(\d+|lastBuild|lastCompletedBuild|lastSuccessfulBuild|lastFailedBuild)(?=/|$)'), '/{number}'),
+]
+
+TRACE_FORMATS = ['json', 'chrome']
+
+
+class RequestTracer:
+    """Records timing and size of every REST request sent to the server
+
+    Details: While a tracer is the `active` tracer, each request sent by `Rest` is recorded
+             with its method, URL, URL template (ie. `/job/{name}/{number}/api/json`), status
+             code, response bytes, time to first byte, total time, and number of retries.
+             Requests served from the local response cache are not sent and not recorded.
+    """
+
+    # Tracer that records the requests of the running command. None if not tracing
+    active: Optional['RequestTracer'] = None
+
+    def __init__(self) -> None:
+        """Object constructor method, called at object creation
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.requests: list[dict] = []
+        self.start_time = perf_counter()
+        self.start_timestamp = time()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def url_template(url: str) -> str:
+        """Get the endpoint of a request URL, with item names and numbers replaced by placeholders
+
+        Examples:
+            - 'http://host/job/a/job/b/12/api/json?tree=x' -> '/job/{name}/job/{name}/{number}/api/json'
+
+        Args:
+            url : Full request URL
+
+        Returns:
+            URL path template
+        """
+        path = urlparse(url).path.rstrip('/') or '/'
+        for pattern, replacement in URL_TEMPLATE_PATTERNS:
+            path = pattern.sub(replacement, path)
+        return path
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        status_code: Optional[int],
+        response_bytes: Optional[int],
+        ttfb: Optional[float],
+        *,
+        start_time: float,
+        retries: int = 0,
+    ) -> dict:
+        """Record a sent request
+
+        Args:
+            method         : Request method (ie. `GET`)
+            url            : Full request URL
+            status_code    : Response status code, None if there was no response
+            response_bytes : Number of response body bytes, None if unknown
+            ttfb           : Seconds until the response headers were received, None if there was no response
+            start_time     : `perf_counter()` time the request was started
+            retries        : Number of times the request was retried
+
+        Returns:
+            Recorded request. Its `bytes` and `total_ms` can be updated while a streamed response is read
+        """
+        request = {
+            'method': method.upper(),
+            'url': url,
+            'template': self.url_template(url),
+            'status': status_code,
+            'bytes': response_bytes,
+            'start_ms': round((start_time - self.start_time) * 1000, 3),
+            'ttfb_ms': round(ttfb * 1000, 3) if ttfb is not None else None,
+            'total_ms': round((perf_counter() - start_time) * 1000, 3),
+            'retries': retries,
+            'thread': threading.get_ident(),
+        }
+        with self._lock:
+            self.requests.append(request)
+        return request
+
+    def summary(self) -> list[dict]:
+        """Summarize the recorded requests by endpoint
+
+        Returns:
+            Request count, retries, bytes, and p50/p95 total time of each endpoint, most requested first
+        """
+        endpoints: dict[tuple[str, str], list[dict]] = {}
+        with self._lock:
+            for request in self.requests:
+                endpoints.setdefault((request['method'], request['template']), []).append(request)
+
+        summary = []
+        for (method, template), requests in endpoints.items():
+            times = sorted(request['total_ms'] for request in requests)
+            summary.append(
+                {
+                    'method': method,
+                    'template': template,
+                    'count': len(requests),
+                    'retries': sum(request['retries'] for request in requests),
+                    'bytes': sum(request['bytes'] or 0 for request in requests),
+                    'p50_ms': _percentile(times, 50),
+                    'p95_ms': _percentile(times, 95),
+                    'total_ms': round(sum(times), 3),
+                }
+            )
+        return sorted(summary, key=lambda endpoint: (-endpoint['count'], -endpoint['total_ms']))
+
+    def summary_text(self) -> str:
+        """Format the request summary as a text table
+
+        Returns:
+            Summary table
+        """
+        summary = self.summary()
+        elapsed = perf_counter() - self.start_time
+        lines = [f'{len(self.requests)} requests to the server in {elapsed:.3f} seconds']
+        if not summary:
+            return lines[0]
+        template_width = max(len(endpoint['template']) for endpoint in summary) + 2
+        lines.append(f'{"COUNT":>6}  {"P50 MS":>9}  {"P95 MS":>9}  {"BYTES":>11}  {"RETRY":>5}  {"METHOD":<7}ENDPOINT')
+        for endpoint in summary:
+            lines.append(
+                f'{endpoint["count"]:>6}  {endpoint["p50_ms"]:>9.1f}  {endpoint["p95_ms"]:>9.1f}  '
+                f'{endpoint["bytes"]:>11}  {endpoint["retries"]:>5}  {endpoint["method"]:<7}'
+                f'{endpoint["template"]:<{template_width}}'.rstrip()
+            )
+        return '\n'.join(lines)
+
+    def to_json(self) -> dict:
+        """Get the recorded requests and their summary
+
+        Returns:
+            Trace with all requests and the summary by endpoint
+        """
+        with self._lock:
+            requests = list(self.requests)
+        return {'started': self.start_timestamp, 'requests': requests, 'summary': self.summary()}
+
+    def to_chrome_trace(self) -> dict:
+        """Get the recorded requests in the Chrome trace event format
+
+        Details: Can be opened with `chrome://tracing` or https://ui.perfetto.dev
+
+        Returns:
+            Trace events
+        """
+        with self._lock:
+            requests = list(self.requests)
+        events = []
+        for request in requests:
+            events.append(
+                {
+                    'name': f'{request["method"]} {request["template"]}',
+                    'cat': 'http',
+                    'ph': 'X',
+                    'ts': int(request['start_ms'] * 1000),
+                    'dur': int(request['total_ms'] * 1000),
+                    'pid': os.getpid(),
+                    'tid': request['thread'],
+                    'args': {key: request[key] for key in ['url', 'status', 'bytes', 'ttfb_ms', 'retries']},
+                }
+            )
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def dump(self, file_path: str, trace_format: str = 'json') -> bool:
+        """Write the trace to a file
+
+        Args:
+            file_path    : File path to write to
+            trace_format : `json` for all requests and the summary, `chrome` for Chrome trace events
+
+        Returns:
+            True if written, else False
+        """
+        trace = self.to_chrome_trace() if trace_format == 'chrome' else self.to_json()
+        try:
+            with open(file_path, 'w', encoding='utf-8') as file:
+                json.dump(trace, file, indent=2)
+        except OSError as error:
+            logger.debug(f'Failed to write request trace file "{file_path}". Exception: {error}')
+            return False
+        logger.debug(f'Wrote {len(self.requests)} traced requests to "{file_path}"')
+        return True
+
+
+def _percentile(sorted_values: list[float], percent: float) -> float:
+    """Get the nearest-rank percentile of sorted values"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * percent // 100))
+    return sorted_values[int(rank) - 1]
@@ -1,6 +1,10 @@
 """Server class definition"""
 
 import logging
+from collections.abc import Iterator
+from typing import Optional
+
+import requests
 
 from yojenkins.utility import utility
 from yojenkins.utility.utility import fail_out
@@ -8,6 +12,9 @@ from yojenkins.utility.utility import fail_out
 # Getting the logger reference
 logger = logging.getLogger()
 
+# Plugin fields used for the plugin information list
+PLUGIN_LIST_FIELDS = ['longName', 'shortName', 'version']
+
 
 class Server:
     """TODO Server"""
@@ -65,6 +72,28 @@ class Server:
 
         return people_info, people_info_list
 
+    def people_iter(self) -> Iterator[dict]:
+        """Get all people/accounts on the server, yielding each as soon as it is received from the server
+
+        Details: The server response is parsed while it is received, so that the information
+                 of very many users is never held in memory all at once
+
+        Args:
+            None
+
+        Returns:
+            Iterator of user/account information
+        """
+        logger.debug(f'Streaming all people/users for "{self.server_base_url}" ...')
+        people, _, success = self.rest.request_stream('asynchPeople/api/json?depth=1', item_path='users')
+        if not success:
+            fail_out('Failed to fetch server people/users information')
+
+        try:
+            yield from people
+        except (ValueError, requests.exceptions.RequestException) as error:
+            fail_out(f'Failed to read server people/users information. Exception: {error}')
+
     def queue_info(self) -> dict:
         """Get all the jobs stuck in the server queue
 
@@ -109,18 +138,24 @@ class Server:
 
         return queue_list
 
-    def plugin_list(self) -> tuple[list, list]:
+    def plugin_list(self, fields: Optional[list[str]] = None) -> tuple[list, list]:
         """Get the list of plugins installed on the server
 
         Args:
-            None
+            fields : Only get these fields of each plugin, nested with a dot (ie. `dependencies.shortName`).
+                     Default is all fields. Empty list only gets the fields needed for the information list
 
         Returns:
             List of plugins, information list and URL list
         """
         logger.debug(f'Getting all installed server plugins for "{self.server_base_url}" ...')
 
-        plugins_info, _, success = self.rest.request('pluginManager/api/json?depth=2', 'get', is_endpoint=True)
+        if fields is not None:
+            # Fields are for each listed plugin, fields for the information list are always needed
+            fields = [f'plugins.{field}' for field in [*PLUGIN_LIST_FIELDS, *fields]]
+        plugins_info, _, success = self.rest.request(
+            'pluginManager/api/json?depth=2', 'get', is_endpoint=True, fields=fields
+        )
         if not success:
             fail_out('Failed to fetch server plugin information')
 
@@ -132,6 +167,33 @@ class Server:
 
         return plugins_info, plugin_info_list
 
+    def plugin_list_iter(self, fields: Optional[list[str]] = None) -> Iterator[dict]:
+        """Get the plugins installed on the server, yielding each as soon as it is received from the server
+
+        Details: The server response is parsed while it is received, so that the information
+                 of all plugins and their dependencies is never held in memory all at once
+
+        Args:
+            fields : Only get these fields of each plugin, nested with a dot (ie. `dependencies.shortName`).
+                     Default is all fields. Empty list only gets the fields needed for the information list
+
+        Returns:
+            Iterator of plugin information
+        """
+        logger.debug(f'Streaming all installed server plugins for "{self.server_base_url}" ...')
+        if fields is not None:
+            fields = [f'plugins.{field}' for field in [*PLUGIN_LIST_FIELDS, *fields]]
+        plugins, _, success = self.rest.request_stream(
+            'pluginManager/api/json?depth=2', item_path='plugins', fields=fields
+        )
+        if not success:
+            fail_out('Failed to fetch server plugin information')
+
+        try:
+            yield from plugins
+        except (ValueError, requests.exceptions.RequestException) as error:
+            fail_out(f'Failed to read server plugin information. Exception: {error}')
+
     def browser_open(self) -> bool:
         """TODO Docstring
 
@@ -0,0 +1,269 @@
+"""ServerCapabilities class definition"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from time import time
+from typing import Any, Optional
+
+# Getting the logger reference
+logger = logging.getLogger()
+
+# TODO: Find centralized location for these static values
+CONFIG_DIR_NAME = '.yojenkins'
+CAPABILITIES_FILE_NAME = 'capabilities.json'
+
+# Seconds discovered server capabilities are used before discovering them again
+DEFAULT_CAPABILITIES_MAX_AGE = 86400
+
+# Plugins that yojenkins can make use of, by capability name
+CAPABILITY_PLUGINS = {
+    'workflow_api': 'pipeline-rest-api',
+    'blue_ocean': 'blueocean-rest',
+    'timestamper': 'timestamper',
+}
+
+# Capabilities learned when first used, instead of when discovered
+LEARNED_CAPABILITIES = ['progressive_text']
+
+
+class ServerCapabilities:
+    """Features supported by a server, discovered once and shared by all commands
+
+    Details: The record holds the Jenkins version, the versions of the installed plugins that
+             yojenkins can make use of, and whether the server requires a crumb and compresses
+             responses. Capabilities that can only be checked with a build (ie. `progressive_text`)
+             are added the first time they are checked. A capability is `None` if it is not known,
+             for example when the user is not allowed to list the installed plugins.
+             Records are kept in `~/.yojenkins/capabilities.json` for `max_age` seconds, keyed by
+             a hash of the server URL and username.
+    """
+
+    def __init__(self, rest, cache_file: str = '', max_age: float = DEFAULT_CAPABILITIES_MAX_AGE) -> None:
+        """Object constructor method, called at object creation
+
+        Args:
+            rest       : Rest object of the server
+            cache_file : File path of the capability records. Default is `~/.yojenkins/capabilities.json`
+            max_age    : Seconds a discovered record is used. 0 to discover with every command
+
+        Returns:
+            None
+        """
+        self.rest = rest
+        self.cache_file = cache_file or os.path.join(Path.home(), CONFIG_DIR_NAME, CAPABILITIES_FILE_NAME)
+        self.max_age = max_age
+
+        self._record: Optional[dict] = None
+        self._lock = threading.RLock()
+
+    def configure(self, max_age: Optional[float] = None) -> None:
+        """Update the capability record settings
+
+        Args:
+            max_age : Seconds a discovered record is used
+
+        Returns:
+            None
+        """
+        if max_age is not None:
+            self.max_age = float(max_age)
+
+    def key(self) -> str:
+        """Get the key of the capability record of the server and user
+
+        Returns:
+            Hexadecimal hash of the server URL and username
+        """
+        server = '\n'.join([self.rest.server_url.strip('/'), self.rest.username])
+        return hashlib.sha256(server.encode('utf-8')).hexdigest()
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Get a capability of the server, discovering the capabilities if not yet known
+
+        Args:
+            name    : Capability name (ie. `workflow_api`, `crumb_required`, `version`)
+            default : Value returned if the capability is not known
+
+        Returns:
+            Capability value, or the default if not known
+        """
+        value = self.record().get(name)
+        return default if value is None else value
+
+    def peek(self, name: str) -> Any:
+        """Get a capability of the server only if already known, without discovering the capabilities
+
+        Args:
+            name : Capability name
+
+        Returns:
+            Capability value, None if not known
+        """
+        with self._lock:
+            if self._record is None:
+                self._record = self._load_record()
+            return self._record.get(name) if self._record is not None else None
+
+    def record(self, refresh: bool = False) -> dict:
+        """Get the capability record of the server
+
+        Args:
+            refresh : If True, discover the capabilities again even if a record is kept
+
+        Returns:
+            Capability record
+        """
+        with self._lock:
+            if self._record is not None and not refresh:
+                return self._record
+            if not refresh:
+                self._record = self._load_record()
+                if self._record is not None:
+                    return self._record
+            self._record = self.discover()
+            self._save_record(self._record)
+            return self._record
+
+    def update(self, **capabilities: Any) -> None:
+        """Add learned capabilities to the record of the server
+
+        Args:
+            capabilities : Capability values by name
+
+        Returns:
+            None
+        """
+        with self._lock:
+            record = self.record()
+            changed = {name: value for name, value in capabilities.items() if record.get(name) != value}
+            if not changed:
+                return
+            logger.debug(f'Learned server capabilities: {changed}')
+            record.update(changed)
+            self._save_record(record)
+
+    def discover(self) -> dict:
+        """Ask the server for its capabilities
+
+        Details: Sends the requests at the same time: the server information for the version and
+                 compression, the installed plugins, and the crumb issuer. If the server does not
+                 respond, the record is not kept and all capabilities are not known.
+
+        Returns:
+            Capability record
+        """
+        logger.debug(f'Discovering server capabilities of "{self.rest.server_url}" ...')
+        (_, server_headers, server_success), plugins_response, crumb_response = self.rest.request_many(
+            [
+                {'target': 'api/json', 'request_type': 'get', 'fields': ['mode'], 'use_cache': False},
+                {
+                    'target': 'pluginManager/api/json',
+                    'request_type': 'get',
+                    'fields': ['plugins.shortName', 'plugins.version', 'plugins.active'],
+                    'use_cache': False,
+                },
+                {'target': 'crumbIssuer/api/json', 'request_type': 'get', 'use_cache': False},
+            ]
+        )
+
+        record: dict[str, Any] = dict.fromkeys(['version', 'gzip', 'plugins', 'crumb_required'])
+        record.update(dict.fromkeys([*CAPABILITY_PLUGINS, *LEARNED_CAPABILITIES]))
+        if server_success:
+            record['version'] = server_headers.get('X-Jenkins')
+            record['gzip'] = 'gzip' in server_headers.get('Content-Encoding', '')
+
+        plugins_content, _, plugins_success = plugins_response
+        if plugins_success and isinstance(plugins_content, dict):
+            installed = {
+                plugin.get('shortName'): plugin.get('version')
+                for plugin in plugins_content.get('plugins', [])
+                if plugin.get('active', True)
+            }
+            record['plugins'] = {name: installed[name] for name in CAPABILITY_PLUGINS.values() if name in installed}
+            for capability, plugin_name in CAPABILITY_PLUGINS.items():
+                record[capability] = plugin_name in installed
+        else:
+            logger.debug('Failed to list the installed plugins. Plugin capabilities are not known')
+
+        # Without a crumb issuer (404) no crumb is needed
+        record['crumb_required'] = bool(crumb_response[2]) if server_success else None
+
+        # Only a record of a responding server is kept
+        record['discovered'] = time() if server_success else None
+        logger.debug(f'Server capabilities: {record}')
+        return record
+
+    def _load_record(self) -> Optional[dict]:
+        """Load the kept record of the server, if not older than `max_age`
+
+        Returns:
+            Capability record, None if not kept or too old
+        """
+        if self.max_age <= 0:
+            return None
+        record = self._load().get(self.key())
+        if not isinstance(record, dict) or not isinstance(record.get('discovered'), (int, float)):
+            return None
+        age = time() - record['discovered']
+        if not 0 <= age < self.max_age:
+            logger.debug(f'Server capabilities were discovered {age:.0f} seconds ago. Discovering again ...')
+            return None
+        logger.debug(f'Using server capabilities discovered {age:.0f} seconds ago')
+        return record
+
+    def _save_record(self, record: dict) -> None:
+        """Keep the record of the server, dropping any records older than `max_age`
+
+        Args:
+            record : Capability record
+
+        Returns:
+            None
+        """
+        if self.max_age <= 0 or not record.get('discovered'):
+            return
+        now = time()
+        records = {
+            key: server_record
+            for key, server_record in self._load().items()
+            if isinstance(server_record, dict) and now - server_record.get('discovered', 0) < self.max_age
+        }
+        records[self.key()] = record
+        self._save(records)
+
+    def _load(self) -> dict:
+        """Load all records from file
+
+        Returns:
+            Capability records by key
+        """
+        try:
+            with open(self.cache_file, encoding='utf-8') as file:
+                records = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        return records if isinstance(records, dict) else {}
+
+    def _save(self, records: dict) -> None:
+        """Replace all records in file
+
+        Args:
+            records : Capability records by key
+
+        Returns:
+            None
+        """
+        cache_dir = os.path.dirname(self.cache_file)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            file_descriptor, temp_path = tempfile.mkstemp(dir=cache_dir, prefix='.capabilities.')
+            with os.fdopen(file_descriptor, 'w', encoding='utf-8') as file:
+                json.dump(records, file)
+            os.replace(temp_path, self.cache_file)
+        except OSError as error:
+            logger.debug(f'Failed to save server capabilities. Exception: {error}')
@@ -2,13 +2,12 @@
 
 import logging
 import os
-import threading
 from datetime import datetime, timedelta
 from typing import Optional, Union
 
 from yojenkins.utility import utility
 from yojenkins.utility.utility import fail_out, print2
-from yojenkins.yo_jenkins.status import StageStatus
+from yojenkins.yo_jenkins.status import StageStatus, Status
 
 # Getting the logger reference
 logger = logging.getLogger()
@@ -32,9 +31,6 @@ class Stage:
 
         self.build_logs_extension = '.log'
 
-        self._stage_log_list_thread_lock = threading.Lock()
-        self.stage_log_dict = {}
-
     def info(
         self,
         stage_name: str,
@@ -228,21 +224,18 @@ class Stage:
 
         return step_list, step_name_list
 
-    def _thread_step_info(self, step_index: int, total_steps: int, step: dict) -> None:
-        """TODO
-
-        Details: TODO
+    def _step_log_list(self, step_index: int, total_steps: int, step: dict, step_info: dict) -> list[str]:
+        """Format the log lines of a single stage step
 
         Args:
-            TODO
+            step_index  : Index of the step within the stage
+            total_steps : Total number of steps in the stage
+            step        : Step item as listed in the stage information
+            step_info   : Step log information as returned by the server
 
-        Returns: None
+        Returns:
+            List of formatted step log lines
         """
-        logger.debug(f'Thread starting - Step Info - (ID: {threading.get_ident()} - INDEX: {step_index}) ...')
-
-        # Getting step information
-        return_content = self.step.info(step_url=step['url_log'])
-
         logger.debug(f'---> {step_index + 1}/{total_steps} - {step["name"]}')
         if 'parameterDescription' in step:
             parameter = step['parameterDescription']
@@ -250,9 +243,9 @@ class Stage:
             parameter = 'None'
 
         # Check if there is any log text to this stage step
-        if 'text' in return_content or not return_content['length'] == 0:
+        if 'text' in step_info or not step_info['length'] == 0:
             # Clean up all HTML tags from return, keep only raw text
-            log_text = utility.html_clean(return_content['text'])
+            log_text = utility.html_clean(step_info['text'])
 
             # Also convert to list
             log_list = [y for y in (x.strip() for x in log_text.splitlines()) if y]
@@ -268,10 +261,45 @@ class Stage:
             # If no logs in step, still add step command
             log_list = [f'[STEP: {step_index + 1}/{total_steps}] [STEP] : {step["name"]} - PARAMETER: {parameter}']
 
-        with self._stage_log_list_thread_lock:
-            self.stage_log_dict[step_index] = log_list
+        return log_list
 
-        logger.debug(f'Thread stopped - Step Info - (ID: {threading.get_ident()} - INDEX: {step_index}) ...')
+    def _stored_step_log(self, step: dict) -> Optional[tuple[dict, dict, bool]]:
+        """Read the log of a stage step from the log store of the server session
+
+        Args:
+            step : Step item as listed in the stage information
+
+        Returns:
+            Step log information in the form of a request return, None if not stored
+        """
+        if self.rest.log_store is None:
+            return None
+        step_log_url = self.rest.server_url.strip('/') + '/' + step['url_log'].strip('/')
+        chunks = self.rest.log_store.read(self.rest.username, step_log_url)
+        if chunks is None:
+            return None
+        log_text = b''.join(chunks).decode('utf-8', errors='replace')
+        return {'text': log_text, 'length': len(log_text), 'hasMore': False}, {}, True
+
+    def _store_step_log(self, step: dict, step_info: dict) -> None:
+        """Store the log of a finished stage step in the log store of the server session
+
+        Args:
+            step      : Step item as listed in the stage information
+            step_info : Step log information as returned by the server
+
+        Returns:
+            None
+        """
+        finished = [*Status.SUCCESS.value, *Status.FAILURE.value, *Status.ABORTED.value, *Status.UNSTABLE.value]
+        if self.rest.log_store is None or step.get('status') not in finished:
+            return
+        if not step_info or step_info.get('hasMore') or not isinstance(step_info.get('text'), str):
+            return
+        step_log_url = self.rest.server_url.strip('/') + '/' + step['url_log'].strip('/')
+        log_chunks = iter([step_info['text'].encode('utf-8')])
+        for _ in self.rest.log_store.store(self.rest.username, step_log_url, log_chunks):
+            pass
 
     def logs(
         self,
@@ -315,30 +343,24 @@ class Stage:
             latest=latest,
         )[0]
 
-        logger.debug(
-            f'Downloading logs for {len(stage_step_list)} step in the stage using {len(stage_step_list)} threads ...'
-        )
-        self.stage_log_dict = {}
-        threads = []
-        for i, stage_step in enumerate(stage_step_list):
-            thread = threading.Thread(
-                target=self._thread_step_info,
-                args=(
-                    i,
-                    len(stage_step_list),
-                    stage_step,
-                ),
-                daemon=False,
-            )
-            thread.start()
-            threads.append(thread)
-        for thread in threads:
-            thread.join()
-
-        # Convert dict to index sorted list
+        # Read the logs of finished steps from the log store, and fetch the logs of all other steps at once
+        step_info_list = [self._stored_step_log(stage_step) for stage_step in stage_step_list]
+        fetch_indexes = [i for i, step_info in enumerate(step_info_list) if step_info is None]
+        logger.debug(f'Downloading logs for {len(fetch_indexes)} of {len(stage_step_list)} steps in the stage ...')
+        requests_kwargs = [
+            {'target': stage_step_list[i]['url_log'].strip('/'), 'request_type': 'get', 'is_endpoint': True}
+            for i in fetch_indexes
+        ]
+        for i, step_response in zip(fetch_indexes, self.rest.request_many(requests_kwargs)):
+            step_info_list[i] = step_response
+            self._store_step_log(stage_step_list[i], step_response[0])
+
+        # Combine step logs in step order
         stage_log_list = []
-        for _, stage_logs in sorted(self.stage_log_dict.items()):
-            stage_log_list.extend(stage_logs)
+        for i, (stage_step, (step_info, _, _)) in enumerate(zip(stage_step_list, step_info_list)):
+            if not step_info:
+                fail_out(f'Failed to get step info for: {stage_step["url_log"].strip("/")}')
+            stage_log_list.extend(self._step_log_list(i, len(stage_step_list), stage_step, step_info))
 
         # Make the list to continuos step, with newline in between them
         stage_log_text = os.linesep.join(stage_log_list)
@@ -6,6 +6,7 @@ from yojenkins.yo_jenkins.account import Account
 from yojenkins.yo_jenkins.build import Build
 from yojenkins.yo_jenkins.credential import Credential
 from yojenkins.yo_jenkins.folder import Folder
+from yojenkins.yo_jenkins.item_index import DEFAULT_INDEX_MAX_AGE, ItemIndex
 from yojenkins.yo_jenkins.job import Job
 from yojenkins.yo_jenkins.node import Node
 from yojenkins.yo_jenkins.server import Server
@@ -38,8 +39,11 @@ class YoJenkins:
         self.node = Node(self.rest)
         self.account = Account(self.rest)
         self.credential = Credential(self.rest)
-        self.folder = Folder(self.rest, self.jenkins_sdk)
-        self.build = Build(self.rest, self.auth)
-        self.job = Job(self.rest, self.folder, self.jenkins_sdk, self.auth, self.build)
+        self.item_index = ItemIndex(
+            self.rest, max_age=float(self.auth.jenkins_profile.get('index_max_age', DEFAULT_INDEX_MAX_AGE))
+        )
+        self.folder = Folder(self.rest, self.jenkins_sdk, self.item_index)
+        self.build = Build(self.rest, self.auth, self.item_index)
+        self.job = Job(self.rest, self.folder, self.jenkins_sdk, self.auth, self.build, item_index=self.item_index)
         self.step = Step(self.rest)
         self.stage = Stage(self.rest, self.build, self.step)